@@ -3,7 +3,7 @@
 A pipeline for identifying, disambiguating, and extracting verifiable claims.
 """
 
-from claim_extractor.agent import create_graph, graph
+from claim_extractor.agent import create_graph
 from claim_extractor.schemas import (
     ContextualSentence,
     DisambiguatedContent,
@@ -25,3 +25,12 @@ __all__ = [
     "PotentialClaim",
     "ValidatedClaim",
 ]
+
+
+def __getattr__(name: str):
+    # Resolve the compiled graph lazily (see claim_extractor.agent)
+    if name == "graph":
+        from claim_extractor import agent
+
+        return agent.graph
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
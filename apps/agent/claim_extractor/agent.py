@@ -1,12 +1,16 @@
 import logging
+from typing import Optional
 
 from dotenv import load_dotenv
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from utils import LLMConfigurable
 
 from claim_extractor.nodes import (
     decomposition_node,
     disambiguation_node,
+    fused_selection_node,
+    route_selection,
     selection_node,
     sentence_splitter_node,
     validation_node,
@@ -30,13 +34,17 @@ def create_graph() -> CompiledStateGraph:
     3. Resolve ambiguities like pronouns
     4. Extract specific atomic claims
     5. Validate claims are properly formed
+
+    With configurable.extraction_mode="fused", steps 2 and 3 run as a
+    single fused_selection node.
     """
-    workflow = StateGraph(State)
+    workflow = StateGraph(State, config_schema=LLMConfigurable)
 
     # Add nodes
     workflow.add_node("sentence_splitter", sentence_splitter_node)
     workflow.add_node("selection", selection_node)
     workflow.add_node("disambiguation", disambiguation_node)
+    workflow.add_node("fused_selection", fused_selection_node)
     workflow.add_node("decomposition", decomposition_node)
     workflow.add_node("validation", validation_node)
 
@@ -44,9 +52,12 @@ def create_graph() -> CompiledStateGraph:
     workflow.set_entry_point("sentence_splitter")
 
     # Connect the nodes in sequence
-    workflow.add_edge("sentence_splitter", "selection")
+    workflow.add_conditional_edges(
+        "sentence_splitter", route_selection, ["selection", "fused_selection"]
+    )
     workflow.add_edge("selection", "disambiguation")
     workflow.add_edge("disambiguation", "decomposition")
+    workflow.add_edge("fused_selection", "decomposition")
     workflow.add_edge("decomposition", "validation")
 
     # Set finish point
@@ -55,4 +66,14 @@ def create_graph() -> CompiledStateGraph:
     return workflow.compile()
 
 
-graph = create_graph()
+_graph: Optional[CompiledStateGraph] = None
+
+
+def __getattr__(name: str):
+    """Compile ``graph`` on first access so importing the module stays cheap."""
+    global _graph
+    if name == "graph":
+        if _graph is None:
+            _graph = create_graph()
+        return _graph
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,8 +6,12 @@ Central storage for all configuration settings.
 from claim_extractor.config.nodes import (
     CONTEXT_WINDOWS,
     DECOMPOSITION_CONFIG,
+    DEDUP_CONFIG,
     DISAMBIGUATION_CONFIG,
+    FUSED_SELECTION_CONFIG,
+    MEMO_CONFIG,
     SELECTION_CONFIG,
+    SENTENCE_SPLITTER_CONFIG,
     VALIDATION_CONFIG,
 )
 
@@ -15,8 +19,12 @@ __all__ = [
     # Node configurations
     "SELECTION_CONFIG",
     "DISAMBIGUATION_CONFIG",
+    "FUSED_SELECTION_CONFIG",
     "DECOMPOSITION_CONFIG",
+    "DEDUP_CONFIG",
     "VALIDATION_CONFIG",
+    "SENTENCE_SPLITTER_CONFIG",
+    "MEMO_CONFIG",
     # Context windows
     "CONTEXT_WINDOWS",
 ]
@@ -16,14 +16,50 @@ DISAMBIGUATION_CONFIG = {
     "temperature": 0.2,  # Higher temp for diverse judgments
 }
 
+# Selection and disambiguation as one structured call per completion
+FUSED_SELECTION_CONFIG = {
+    "mode": "two_stage",  # "two_stage" (selection, then disambiguation) or "fused"
+    "completions": 3,
+    "min_successes": 2,
+    "temperature": 0.2,  # Higher temp for diverse judgments
+}
+
 DECOMPOSITION_CONFIG = {
     "completions": 1,
     "min_successes": 1,
     "temperature": 0.0,  # Zero temp for consistent results
 }
 
+# Duplicate claims are collapsed after decomposition, before validation
+DEDUP_CONFIG = {
+    "enabled": True,
+    "shingle_size": 5,  # Characters per shingle of the normalised claim
+    "num_perm": 32,  # MinHash signature length
+    "bands": 8,  # LSH bands (num_perm // bands rows each)
+    "threshold": 0.85,  # Shingle Jaccard similarity to count as a near duplicate
+}
+
 VALIDATION_CONFIG = {
     "temperature": 0.0,  # Zero temp for consistent results
+    "batched": True,  # Validate several claims per LLM call
+    "max_batch_claims": 25,
+    "max_batch_tokens": 1500,  # Estimated claim tokens per call
+    "prefilter": True,  # Reject obvious non-sentences without an LLM call
+}
+
+SENTENCE_SPLITTER_CONFIG = {
+    "segmenter": "punkt",  # "punkt" (NLTK) or "regex" (fast, markdown-aware)
+    "language": "english",  # Punkt model to load
+    "offload_threshold_chars": 20000,  # Split larger documents in a worker thread
+}
+
+# Sentence-level memoisation of stage results, so re-checking an edited
+# document only reprocesses changed sentences and their context neighbours
+# (configurable.memoize=False disables it for a run)
+MEMO_CONFIG = {
+    "enabled": True,
+    "max_entries": 20000,  # Per stage result, across all documents in the process
+    "ttl_seconds": 3600,
 }
 
 # Context windows
@@ -36,6 +72,10 @@ CONTEXT_WINDOWS = {
         "preceding_sentences": 5,
         "following_sentences": 0,  # No following sentences here
     },
+    "fused_selection": {
+        "preceding_sentences": 5,
+        "following_sentences": 5,  # Only for selection; the prompt keeps them out of disambiguation
+    },
     "decomposition": {
         "preceding_sentences": 5,
         "following_sentences": 0,  # No following sentences here
@@ -0,0 +1,144 @@
+"""Exact and near-duplicate collapsing of potential claims.
+
+Decomposition of overlapping sentences often yields the same claim several
+times, differing only in casing, punctuation or a word or two. Claims are
+compared on normalised text (exact duplicates) and on character-shingle
+Jaccard similarity (near duplicates), using MinHash with LSH banding to find
+candidate pairs without comparing every pair. Similarity alone is not
+enough for a fact checker ("won" vs "lost" barely moves it), so near
+duplicates are only merged when the words they differ in are stopwords.
+"""
+
+import hashlib
+import random
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Sequence, Set, Tuple
+
+from claim_extractor.config import DEDUP_CONFIG
+from claim_extractor.schemas import PotentialClaim
+
+_PUNCTUATION = re.compile(r"[^\w\s%.]|(?<!\d)\.|\.(?!\d)")
+# Function words that may differ between two merged claims. Negations,
+# tense-bearing auxiliaries and relational prepositions are deliberately absent.
+_STOPWORDS = frozenset(
+    "a an the this that these those its their his her of in on at to for by with from as and "
+    "also it they which who".split()
+)
+
+
+def normalize_claim_text(text: str) -> str:
+    """Case-, punctuation- and whitespace-insensitive form of a claim."""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = text.replace("n't", " not")
+    return " ".join(_PUNCTUATION.sub(" ", text).split())
+
+
+def shingles(normalized: str, size: int) -> FrozenSet[str]:
+    """Character shingles of a normalised claim."""
+    if len(normalized) <= size:
+        return frozenset({normalized})
+    return frozenset(normalized[i : i + size] for i in range(len(normalized) - size + 1))
+
+
+@lru_cache(maxsize=4)
+def _masks(num_perm: int) -> Tuple[int, ...]:
+    rng = random.Random(num_perm)
+    return tuple(rng.getrandbits(64) for _ in range(num_perm))
+
+
+def minhash_signature(shingle_set: FrozenSet[str], num_perm: int) -> Tuple[int, ...]:
+    """MinHash signature; matching positions estimate the Jaccard similarity.
+
+    Each "permutation" XORs a 64-bit shingle hash with a random mask, which is
+    much cheaper in pure Python than universal hashing and good enough to
+    propose candidates that are then checked exactly.
+    """
+    hashes = [
+        int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for shingle in shingle_set
+    ]
+    return tuple(min([h ^ mask for h in hashes]) for mask in _masks(num_perm))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def content_words(normalized: str) -> FrozenSet[str]:
+    """Words of a normalised claim other than stopwords; these must match to merge."""
+    return frozenset(word for word in normalized.split() if word not in _STOPWORDS)
+
+
+def _find(parent: List[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def duplicate_groups(texts: Sequence[str]) -> List[List[int]]:
+    """Group the positions of duplicate texts, each group in input order."""
+    size = DEDUP_CONFIG["shingle_size"]
+    num_perm = DEDUP_CONFIG["num_perm"]
+    bands = DEDUP_CONFIG["bands"]
+    threshold = DEDUP_CONFIG["threshold"]
+    rows = num_perm // bands
+
+    parent = list(range(len(texts)))
+    normalized = [normalize_claim_text(text) for text in texts]
+
+    # Exact duplicates after normalisation
+    first_seen: Dict[str, int] = {}
+    for i, norm in enumerate(normalized):
+        if norm in first_seen:
+            parent[_find(parent, i)] = _find(parent, first_seen[norm])
+        else:
+            first_seen[norm] = i
+
+    # Near duplicates: LSH buckets propose candidates, exact Jaccard and the
+    # content words confirm
+    unique = list(first_seen.values())
+    shingle_sets = {i: shingles(normalized[i], size) for i in unique}
+    guards = {i: content_words(normalized[i]) for i in unique}
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+    for i in unique:
+        signature = minhash_signature(shingle_sets[i], num_perm)
+        for band in range(bands):
+            key = (band, signature[band * rows : (band + 1) * rows])
+            buckets.setdefault(key, []).append(i)
+
+    checked: Set[Tuple[int, int]] = set()
+    for members in buckets.values():
+        for n, i in enumerate(members):
+            for j in members[n + 1 :]:
+                if (i, j) in checked:
+                    continue
+                checked.add((i, j))
+                if (
+                    guards[i] == guards[j]
+                    and jaccard(shingle_sets[i], shingle_sets[j]) >= threshold
+                ):
+                    parent[_find(parent, j)] = _find(parent, i)
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(texts)):
+        groups.setdefault(_find(parent, i), []).append(i)
+    return sorted(groups.values(), key=lambda group: group[0])
+
+
+def dedupe_claims(claims: Sequence[PotentialClaim]) -> List[PotentialClaim]:
+    """Collapse duplicate claims into their first occurrence.
+
+    The kept claim's source_indices lists the original_index of every claim
+    it stands for.
+    """
+    unique = []
+    for group in duplicate_groups([claim.claim_text for claim in claims]):
+        kept = claims[group[0]]
+        source_indices = sorted(
+            {index for i in group for index in (claims[i].source_indices or [claims[i].original_index])}
+        )
+        unique.append(kept.model_copy(update={"source_indices": source_indices}))
+    return unique
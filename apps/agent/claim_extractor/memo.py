@@ -0,0 +1,98 @@
+"""Sentence-level memoisation of extraction stage results.
+
+Each LLM stage memoises its result per item under a key made of the stage,
+the run's LLM provider and model, and the exact prompt inputs: the rendered
+context window and the sentence (or claim) itself. Re-checking an edited
+document therefore hits the memo for every sentence whose text and context
+window are unchanged, and only changed sentences and their context
+neighbours are sent to the LLM again.
+
+Stored values never contain sentence positions, since an edit above a
+sentence shifts its index without changing its result.
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Set, Tuple, TypeVar
+
+from langchain_core.runnables import RunnableConfig
+from utils import TTLCache, collect_llm_errors, memo_enabled, memo_key
+
+from claim_extractor.config import MEMO_CONFIG
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+V = TypeVar("V")
+
+_MISSING = object()
+
+_MEMO: TTLCache[str, Any] = TTLCache(
+    max_size=MEMO_CONFIG["max_entries"], ttl=MEMO_CONFIG["ttl_seconds"]
+)
+
+
+async def memoized(
+    stage: str,
+    config: Optional[RunnableConfig],
+    items: Sequence[T],
+    key_parts: Callable[[T], Sequence[str]],
+    compute: Callable[[List[T]], Awaitable[Tuple[List[Optional[V]], Set[int]]]],
+) -> List[Optional[V]]:
+    """Results for ``items`` (in order), computing only those not memoised.
+
+    Args:
+        stage: Stage name, part of the memo key
+        config: Run config; its LLM selection is part of the key and
+            configurable.memoize can disable memoisation
+        items: Items to get results for
+        key_parts: The item's prompt inputs
+        compute: Computes results for the items it is given, in order (None
+            for "no result"), and the positions whose result must not be
+            memoised because an LLM call failed
+
+    Returns:
+        One result per item
+    """
+    if not memo_enabled(config, MEMO_CONFIG["enabled"]):
+        results, _ = await compute(list(items))
+        return results
+
+    keys = [memo_key(stage, config, *key_parts(item)) for item in items]
+    results = [_MEMO.get(key, _MISSING) for key in keys]
+    pending = [i for i, result in enumerate(results) if result is _MISSING]
+    if len(pending) < len(items):
+        logger.info(f"Reusing {stage} results for {len(items) - len(pending)} of {len(items)} items")
+
+    if pending:
+        computed, failed = await compute([items[i] for i in pending])
+        for position, (i, result) in enumerate(zip(pending, computed)):
+            results[i] = result
+            if position not in failed:
+                _MEMO.set(keys[i], result)
+    return results
+
+
+def tracking_failures(
+    processor: Callable[[T, Any], Awaitable[Tuple[bool, Any]]], failed: Set[int]
+) -> Callable[[T, Any], Awaitable[Tuple[bool, Any]]]:
+    """Wrap a voting processor to record the original_index of items whose
+    LLM calls failed, so their (possibly wrong) outcome is not memoised."""
+
+    async def run(item: T, llm: Any) -> Tuple[bool, Any]:
+        with collect_llm_errors() as errors:
+            outcome = await processor(item, llm)
+        if errors:
+            failed.add(item.original_index)
+        return outcome
+
+    return run
+
+
+def memo_stats() -> dict:
+    """Size and hit statistics of the stage memo."""
+    return _MEMO.stats()
+
+
+def clear_memo() -> None:
+    """Forget all memoised stage results."""
+    _MEMO.clear()
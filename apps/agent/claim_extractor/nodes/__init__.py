@@ -2,6 +2,7 @@
 
 from claim_extractor.nodes.decomposition import decomposition_node
 from claim_extractor.nodes.disambiguation import disambiguation_node
+from claim_extractor.nodes.fused_selection import fused_selection_node, route_selection
 from claim_extractor.nodes.selection import selection_node
 from claim_extractor.nodes.sentence_splitter import sentence_splitter_node
 from claim_extractor.nodes.validation import validation_node
@@ -10,6 +11,8 @@ __all__ = [
     "sentence_splitter_node",
     "selection_node",
     "disambiguation_node",
+    "fused_selection_node",
+    "route_selection",
     "decomposition_node",
     "validation_node",
 ]
@@ -6,20 +6,24 @@ Breaks complex sentences into simple, standalone factual claims.
 import asyncio
 import itertools
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
+from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel, Field
 
-from claim_extractor.config import DECOMPOSITION_CONFIG
+from claim_extractor.config import CONTEXT_WINDOWS, DECOMPOSITION_CONFIG, DEDUP_CONFIG
+from claim_extractor.dedup import dedupe_claims
+from claim_extractor.memo import memoized
 from claim_extractor.prompts import DECOMPOSITION_SYSTEM_PROMPT, HUMAN_PROMPT
 from claim_extractor.schemas import DisambiguatedContent, PotentialClaim, State
-from utils import call_llm_with_structured_output, get_llm, remove_following_sentences
+from utils import call_llm_with_structured_output, collect_llm_errors, get_llm, render_context
 
 logger = logging.getLogger(__name__)
 
 # Use only one completion here - we've already filtered and disambiguated
 COMPLETIONS = DECOMPOSITION_CONFIG["completions"]
 MIN_SUCCESSES = DECOMPOSITION_CONFIG["min_successes"]
+CONTEXT_WINDOW = CONTEXT_WINDOWS["decomposition"]
 
 
 class DecompositionOutput(BaseModel):
@@ -33,13 +37,32 @@ class DecompositionOutput(BaseModel):
     )
 
 
+def _excerpt(
+    disambiguated_item: DisambiguatedContent, sentences: Sequence[str], metadata: Optional[str]
+) -> str:
+    # Context window without following sentences
+    return render_context(
+        sentences,
+        disambiguated_item.original_index,
+        CONTEXT_WINDOW["preceding_sentences"],
+        CONTEXT_WINDOW["following_sentences"],
+        metadata,
+    )
+
+
 async def _decomposition_stage(
     disambiguated_item: DisambiguatedContent,
+    config: RunnableConfig,
+    sentences: Sequence[str],
+    metadata: Optional[str] = None,
 ) -> List[PotentialClaim]:
     """Extract atomic claims from a disambiguated sentence.
 
     Args:
         disambiguated_item: Disambiguated content to process
+        config: Run config carrying the LLM provider/model selection
+        sentences: Document sentence table
+        metadata: Source metadata
 
     Returns:
         List of potential claims
@@ -47,15 +70,10 @@ async def _decomposition_stage(
     sentence = disambiguated_item.disambiguated_sentence
     logger.debug(f"Processing decomposition for: '{sentence}'")
 
-    # Get zero-temp LLM for consistent results with configured provider
-    from utils.settings import settings
-    llm = get_llm(completions=COMPLETIONS, provider=settings.llm_provider)
+    # Get zero-temp LLM for consistent results with the run's provider
+    llm = get_llm(completions=COMPLETIONS, config=config)
 
-    # Get context without following sentences
-    original_context = (
-        disambiguated_item.original_selected_item.original_context_item.context_for_llm
-    )
-    modified_context = remove_following_sentences(original_context)
+    modified_context = _excerpt(disambiguated_item, sentences, metadata)
 
     # Prep the prompt
     messages = [
@@ -87,16 +105,11 @@ async def _decomposition_stage(
     # Clean up claims and convert to objects
     claims_texts = [claim.strip() for claim in response.claims if claim.strip()]
 
-    # Get original sentence and index
-    original_sentence = disambiguated_item.original_selected_item.original_context_item.original_sentence
-    original_index = disambiguated_item.original_selected_item.original_context_item.original_index
-
     potential_claims = [
         PotentialClaim(
-            claim_text=claim_text, 
+            claim_text=claim_text,
             disambiguated_sentence=sentence,
-            original_sentence=original_sentence,
-            original_index=original_index
+            original_index=disambiguated_item.original_index,
         )
         for claim_text in claims_texts
     ]
@@ -107,11 +120,14 @@ async def _decomposition_stage(
     return potential_claims
 
 
-async def decomposition_node(state: State) -> Dict[str, List[PotentialClaim]]:
+async def decomposition_node(
+    state: State, config: RunnableConfig
+) -> Dict[str, List[PotentialClaim]]:
     """Break sentences into self-contained factual claims.
 
     Args:
         state: Current workflow state
+        config: Run config carrying the LLM provider/model selection
 
     Returns:
         Dictionary with potential_claims key
@@ -122,15 +138,42 @@ async def decomposition_node(state: State) -> Dict[str, List[PotentialClaim]]:
         logger.warning("Nothing to decompose")
         return {"potential_claims": []}
 
-    # Process all contents in parallel for speed
-    potential_claims = await asyncio.gather(
-        *(
-            _decomposition_stage(disambiguated_content)
-            for disambiguated_content in disambiguated_contents
+    async def decompose_one(item: DisambiguatedContent) -> Tuple[List[str], bool]:
+        with collect_llm_errors() as errors:
+            claims = await _decomposition_stage(item, config, state.sentences, state.metadata)
+        return [claim.claim_text for claim in claims], bool(errors)
+
+    async def decompose(
+        pending: List[DisambiguatedContent],
+    ) -> Tuple[List[List[str]], Set[int]]:
+        # Process all contents in parallel for speed
+        outcomes = await asyncio.gather(*(decompose_one(item) for item in pending))
+        return (
+            [claim_texts for claim_texts, _ in outcomes],
+            {i for i, (_, failed) in enumerate(outcomes) if failed},
         )
-    )
 
-    potential_claims = list(itertools.chain.from_iterable(potential_claims))
+    # Unchanged sentences with unchanged preceding context reuse earlier claims
+    claim_texts = await memoized(
+        "decomposition",
+        config,
+        disambiguated_contents,
+        lambda item: (_excerpt(item, state.sentences, state.metadata), item.disambiguated_sentence),
+        decompose,
+    )
+    potential_claims = list(
+        itertools.chain.from_iterable(
+            (
+                PotentialClaim(
+                    claim_text=claim_text,
+                    disambiguated_sentence=item.disambiguated_sentence,
+                    original_index=item.original_index,
+                )
+                for claim_text in texts or []
+            )
+            for item, texts in zip(disambiguated_contents, claim_texts)
+        )
+    )
 
     # Check if any claims were found
     if not potential_claims:
@@ -138,4 +181,14 @@ async def decomposition_node(state: State) -> Dict[str, List[PotentialClaim]]:
         return {"potential_claims": []}
 
     logger.info(f"Extracted a total of {len(potential_claims)} potential claims")
+
+    # Collapse duplicates here so validation and verification see each claim once
+    if DEDUP_CONFIG["enabled"]:
+        extracted = len(potential_claims)
+        potential_claims = dedupe_claims(potential_claims)
+        if len(potential_claims) < extracted:
+            logger.info(
+                f"Collapsed {extracted - len(potential_claims)} duplicate claims, "
+                f"{len(potential_claims)} unique"
+            )
     return {"potential_claims": potential_claims}
@@ -4,19 +4,22 @@ Clarifies pronouns and other references so claims make sense on their own.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel, Field
 
-from claim_extractor.config import DISAMBIGUATION_CONFIG
+from claim_extractor.config import CONTEXT_WINDOWS, DISAMBIGUATION_CONFIG
+from claim_extractor.memo import memoized, tracking_failures
 from claim_extractor.prompts import DISAMBIGUATION_SYSTEM_PROMPT, HUMAN_PROMPT
 from claim_extractor.schemas import DisambiguatedContent, SelectedContent, State
 from utils import (
     call_llm_with_structured_output,
     get_llm,
     process_with_voting,
-    remove_following_sentences,
+    render_context,
 )
 
 logger = logging.getLogger(__name__)
@@ -25,6 +28,7 @@ logger = logging.getLogger(__name__)
 # to ensure consistency in how references are resolved
 COMPLETIONS = DISAMBIGUATION_CONFIG["completions"]
 MIN_SUCCESSES = DISAMBIGUATION_CONFIG["min_successes"]
+CONTEXT_WINDOW = CONTEXT_WINDOWS["disambiguation"]
 
 
 class DisambiguationOutput(BaseModel):
@@ -38,25 +42,40 @@ class DisambiguationOutput(BaseModel):
     )
 
 
+def _excerpt(
+    selected_item: SelectedContent, sentences: Sequence[str], metadata: Optional[str]
+) -> str:
+    # Context window without following sentences
+    # We don't want to rely on future info that might not be available
+    return render_context(
+        sentences,
+        selected_item.original_index,
+        CONTEXT_WINDOW["preceding_sentences"],
+        CONTEXT_WINDOW["following_sentences"],
+        metadata,
+    )
+
+
 async def _single_disambiguation_attempt(
-    selected_item: SelectedContent, llm: BaseChatModel
+    selected_item: SelectedContent,
+    llm: BaseChatModel,
+    sentences: Sequence[str],
+    metadata: Optional[str] = None,
 ) -> Tuple[bool, Optional[str]]:
     """Try to disambiguate a single sentence.
 
     Args:
         selected_item: Selected content to disambiguate
         llm: LLM instance
+        sentences: Document sentence table
+        metadata: Source metadata
 
     Returns:
         (success, disambiguated_sentence)
     """
     sentence = selected_item.processed_sentence
 
-    # Get context but remove following sentences
-    # We don't want to rely on future info that might not be available
-    modified_context = remove_following_sentences(
-        selected_item.original_context_item.context_for_llm
-    )
+    modified_context = _excerpt(selected_item, sentences, metadata)
 
     # Prep the prompt
     messages = [
@@ -106,15 +125,18 @@ def _create_disambiguated_content(
     logger.info(f"Disambiguated: '{sentence}' → '{disambiguated_sentence}'")
     return DisambiguatedContent(
         disambiguated_sentence=disambiguated_sentence,
-        original_selected_item=selected_item,
+        original_index=selected_item.original_index,
     )
 
 
-async def disambiguation_node(state: State) -> Dict[str, List[DisambiguatedContent]]:
+async def disambiguation_node(
+    state: State, config: RunnableConfig
+) -> Dict[str, List[DisambiguatedContent]]:
     """Resolve ambiguous references in sentences.
 
     Args:
         state: Current workflow state
+        config: Run config carrying the LLM provider/model selection
 
     Returns:
         Dictionary with disambiguated_contents key
@@ -125,20 +147,51 @@ async def disambiguation_node(state: State) -> Dict[str, List[DisambiguatedConte
         logger.warning("Nothing to disambiguate")
         return {}
 
-    # Get LLM with temperature 0.2 for multiple completions with configured provider
-    from utils.settings import settings
-    llm = get_llm(completions=COMPLETIONS, provider=settings.llm_provider)
-
-    # Process all selected contents with voting
-    disambiguated_contents = await process_with_voting(
-        items=selected_contents,
-        processor=_single_disambiguation_attempt,
-        llm=llm,
-        completions=COMPLETIONS,
-        min_successes=MIN_SUCCESSES,
-        result_factory=_create_disambiguated_content,
-        description="sentence for disambiguation",
+    async def disambiguate(
+        pending: List[SelectedContent],
+    ) -> Tuple[List[Optional[str]], Set[int]]:
+        # Get LLM with temperature 0.2 for multiple completions with the run's provider
+        llm = get_llm(completions=COMPLETIONS, config=config)
+
+        # Process the selected contents with voting
+        failed: Set[int] = set()
+        disambiguated = await process_with_voting(
+            items=pending,
+            processor=tracking_failures(
+                partial(
+                    _single_disambiguation_attempt,
+                    sentences=state.sentences,
+                    metadata=state.metadata,
+                ),
+                failed,
+            ),
+            llm=llm,
+            completions=COMPLETIONS,
+            min_successes=MIN_SUCCESSES,
+            result_factory=_create_disambiguated_content,
+            description="sentence for disambiguation",
+        )
+        by_index = {
+            content.original_index: content.disambiguated_sentence for content in disambiguated
+        }
+        return (
+            [by_index.get(item.original_index) for item in pending],
+            {i for i, item in enumerate(pending) if item.original_index in failed},
+        )
+
+    # Unchanged sentences with unchanged preceding context reuse earlier results
+    disambiguated_sentences = await memoized(
+        "disambiguation",
+        config,
+        selected_contents,
+        lambda item: (_excerpt(item, state.sentences, state.metadata), item.processed_sentence),
+        disambiguate,
     )
+    disambiguated_contents = [
+        DisambiguatedContent(disambiguated_sentence=sentence, original_index=item.original_index)
+        for item, sentence in zip(selected_contents, disambiguated_sentences)
+        if sentence is not None
+    ]
 
     if not disambiguated_contents:
         logger.info("Nothing could be disambiguated")
@@ -0,0 +1,250 @@
+"""Fused selection node - selection and disambiguation in one call.
+
+An optional replacement for the selection and disambiguation nodes: each
+completion returns both the selected content and its disambiguated form, so
+a sentence costs one round of voting instead of two.
+"""
+
+import logging
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import RunnableConfig
+from pydantic import BaseModel, Field
+
+from claim_extractor.config import CONTEXT_WINDOWS, FUSED_SELECTION_CONFIG
+from claim_extractor.memo import memoized, tracking_failures
+from claim_extractor.prompts import HUMAN_PROMPT, SELECTION_DISAMBIGUATION_SYSTEM_PROMPT
+from claim_extractor.schemas import (
+    ContextualSentence,
+    DisambiguatedContent,
+    SelectedContent,
+    State,
+)
+from utils import (
+    call_llm_with_structured_output,
+    get_llm,
+    process_with_voting,
+    render_context,
+)
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_MODES = ("two_stage", "fused")
+
+COMPLETIONS = FUSED_SELECTION_CONFIG["completions"]
+MIN_SUCCESSES = FUSED_SELECTION_CONFIG["min_successes"]
+CONTEXT_WINDOW = CONTEXT_WINDOWS["fused_selection"]
+
+
+class FusedSelectionOutput(BaseModel):
+    """Response schema for fused selection and disambiguation LLM calls."""
+
+    processed_sentence: Optional[str] = Field(
+        default=None, description="The processed sentence containing verifiable content"
+    )
+    no_verifiable_claims: bool = Field(
+        description="Flag indicating if no verifiable claims were found"
+    )
+    remains_unchanged: bool = Field(
+        description="Flag indicating if the sentence remains unchanged"
+    )
+    disambiguated_sentence: Optional[str] = Field(
+        default=None, description="The processed sentence with ambiguities resolved"
+    )
+    cannot_be_disambiguated: bool = Field(
+        default=False,
+        description="Flag indicating if the sentence cannot be disambiguated",
+    )
+
+
+def get_extraction_mode(config: Optional[RunnableConfig] = None) -> str:
+    """Extraction mode: configurable.extraction_mode or the config default."""
+    configurable = (config or {}).get("configurable") or {}
+    mode = configurable.get("extraction_mode") or FUSED_SELECTION_CONFIG["mode"]
+    if mode not in EXTRACTION_MODES:
+        raise ValueError(
+            f"Unknown extraction mode: {mode}. Supported: {list(EXTRACTION_MODES)}"
+        )
+    return mode
+
+
+def route_selection(state: State, config: Optional[RunnableConfig] = None) -> str:
+    """Send the sentences to the two-stage or the fused selection path."""
+    if get_extraction_mode(config) == "fused":
+        return "fused_selection"
+    return "selection"
+
+
+def _excerpt(
+    contextual_item: ContextualSentence, sentences: Sequence[str], metadata: Optional[str]
+) -> str:
+    return render_context(
+        sentences,
+        contextual_item.original_index,
+        CONTEXT_WINDOW["preceding_sentences"],
+        CONTEXT_WINDOW["following_sentences"],
+        metadata,
+    )
+
+
+async def _single_fused_attempt(
+    contextual_item: ContextualSentence,
+    llm: BaseChatModel,
+    sentences: Sequence[str],
+    metadata: Optional[str] = None,
+) -> Tuple[bool, Optional[Tuple[str, str]]]:
+    """Make a single fused selection and disambiguation attempt.
+
+    Args:
+        contextual_item: Sentence to select from
+        llm: LLM instance
+        sentences: Document sentence table
+        metadata: Source metadata
+
+    Returns:
+        (success, (processed_sentence, disambiguated_sentence))
+    """
+    sentence = contextual_item.original_sentence
+
+    messages = [
+        ("system", SELECTION_DISAMBIGUATION_SYSTEM_PROMPT),
+        (
+            "human",
+            HUMAN_PROMPT.format(
+                excerpt=_excerpt(contextual_item, sentences, metadata),
+                sentence=sentence,
+            ),
+        ),
+    ]
+
+    response = await call_llm_with_structured_output(
+        llm=llm,
+        output_class=FusedSelectionOutput,
+        messages=messages,
+        context_desc=f"fused selection attempt for '{sentence}'",
+    )
+
+    # A vote only counts if the sentence is both verifiable and unambiguous,
+    # the same sentences the two-stage path passes on to decomposition
+    if (
+        not response
+        or not response.processed_sentence
+        or response.no_verifiable_claims
+        or not response.disambiguated_sentence
+        or response.cannot_be_disambiguated
+    ):
+        return False, None
+
+    if response.remains_unchanged:
+        processed = sentence
+    else:
+        processed = response.processed_sentence.strip()
+
+    return True, (processed, response.disambiguated_sentence.strip())
+
+
+def _create_fused_content(
+    result: Tuple[str, str], contextual_item: ContextualSentence
+) -> Tuple[SelectedContent, DisambiguatedContent]:
+    """Package the selected and disambiguated content.
+
+    Args:
+        result: (processed_sentence, disambiguated_sentence)
+        contextual_item: Original context
+
+    Returns:
+        (SelectedContent, DisambiguatedContent)
+    """
+    processed_sentence, disambiguated_sentence = result
+    logger.info(
+        f"Selected and disambiguated: '{contextual_item.original_sentence}' → "
+        f"'{disambiguated_sentence}'"
+    )
+    index = contextual_item.original_index
+    return (
+        SelectedContent(processed_sentence=processed_sentence, original_index=index),
+        DisambiguatedContent(disambiguated_sentence=disambiguated_sentence, original_index=index),
+    )
+
+
+async def fused_selection_node(
+    state: State, config: RunnableConfig
+) -> Dict[str, List]:
+    """Select verifiable sentences and resolve their ambiguities in one pass.
+
+    Unlike the two-stage path, selected_contents only lists sentences that
+    could also be disambiguated.
+
+    Args:
+        state: Current workflow state
+        config: Run config carrying the LLM provider/model selection
+
+    Returns:
+        Dictionary with selected_contents and disambiguated_contents keys
+    """
+    contextual_sentences = state.contextual_sentences or []
+
+    if not contextual_sentences:
+        logger.warning("No sentences to process")
+        return {}
+
+    async def select_and_disambiguate(
+        pending: List[ContextualSentence],
+    ) -> Tuple[List[Optional[Tuple[str, str]]], Set[int]]:
+        llm = get_llm(completions=COMPLETIONS, config=config)
+
+        failed: Set[int] = set()
+        fused = await process_with_voting(
+            items=pending,
+            processor=tracking_failures(
+                partial(_single_fused_attempt, sentences=state.sentences, metadata=state.metadata),
+                failed,
+            ),
+            llm=llm,
+            completions=COMPLETIONS,
+            min_successes=MIN_SUCCESSES,
+            result_factory=_create_fused_content,
+            description="sentence for fused selection",
+        )
+        by_index = {
+            selected.original_index: (
+                selected.processed_sentence,
+                disambiguated.disambiguated_sentence,
+            )
+            for selected, disambiguated in fused
+        }
+        return (
+            [by_index.get(item.original_index) for item in pending],
+            {i for i, item in enumerate(pending) if item.original_index in failed},
+        )
+
+    results = await memoized(
+        "fused_selection",
+        config,
+        contextual_sentences,
+        lambda item: (_excerpt(item, state.sentences, state.metadata), item.original_sentence),
+        select_and_disambiguate,
+    )
+    fused_contents = [
+        (
+            SelectedContent(processed_sentence=result[0], original_index=item.original_index),
+            DisambiguatedContent(disambiguated_sentence=result[1], original_index=item.original_index),
+        )
+        for item, result in zip(contextual_sentences, results)
+        if result is not None
+    ]
+
+    if not fused_contents:
+        logger.info("No verifiable, unambiguous claims found")
+        return {}
+
+    logger.info(
+        f"Selected and disambiguated {len(fused_contents)} of "
+        f"{len(contextual_sentences)} sentences"
+    )
+    return {
+        "selected_contents": [selected for selected, _ in fused_contents],
+        "disambiguated_contents": [disambiguated for _, disambiguated in fused_contents],
+    }
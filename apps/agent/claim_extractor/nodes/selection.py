@@ -4,13 +4,16 @@ Filters out fluff and keeps only sentences with factual claims.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel, Field
-from utils import call_llm_with_structured_output, get_llm, process_with_voting
+from utils import call_llm_with_structured_output, get_llm, process_with_voting, render_context
 
-from claim_extractor.config import SELECTION_CONFIG
+from claim_extractor.config import CONTEXT_WINDOWS, SELECTION_CONFIG
+from claim_extractor.memo import memoized, tracking_failures
 from claim_extractor.prompts import HUMAN_PROMPT, SELECTION_SYSTEM_PROMPT
 from claim_extractor.schemas import ContextualSentence, SelectedContent, State
 
@@ -19,6 +22,7 @@ logger = logging.getLogger(__name__)
 
 COMPLETIONS = SELECTION_CONFIG["completions"]
 MIN_SUCCESSES = SELECTION_CONFIG["min_successes"]
+CONTEXT_WINDOW = CONTEXT_WINDOWS["selection"]
 
 
 class SelectionOutput(BaseModel):
@@ -35,14 +39,31 @@ class SelectionOutput(BaseModel):
     )
 
 
+def _excerpt(
+    contextual_item: ContextualSentence, sentences: Sequence[str], metadata: Optional[str]
+) -> str:
+    return render_context(
+        sentences,
+        contextual_item.original_index,
+        CONTEXT_WINDOW["preceding_sentences"],
+        CONTEXT_WINDOW["following_sentences"],
+        metadata,
+    )
+
+
 async def _single_selection_attempt(
-    contextual_item: ContextualSentence, llm
+    contextual_item: ContextualSentence,
+    llm,
+    sentences: Sequence[str],
+    metadata: Optional[str] = None,
 ) -> Tuple[bool, Optional[str]]:
     """Make a single selection attempt.
 
     Args:
-        contextual_item: Sentence with context
+        contextual_item: Sentence to select from
         llm: LLM instance
+        sentences: Document sentence table
+        metadata: Source metadata
 
     Returns:
         (success, processed_sentence)
@@ -58,10 +79,7 @@ async def _single_selection_attempt(
     )
 
     prompt_messages = messages.invoke(
-        {
-            "excerpt": contextual_item.context_for_llm,
-            "sentence": sentence,
-        }
+        {"excerpt": _excerpt(contextual_item, sentences, metadata), "sentence": sentence}
     )
 
     # Call the LLM
@@ -105,15 +123,18 @@ def _create_selected_content(
     logger.info(f"Selected content: '{processed_sentence}' from original: '{sentence}'")
     return SelectedContent(
         processed_sentence=processed_sentence,
-        original_context_item=contextual_item,
+        original_index=contextual_item.original_index,
     )
 
 
-async def selection_node(state: State) -> Dict[str, List[SelectedContent]]:
+async def selection_node(
+    state: State, config: RunnableConfig
+) -> Dict[str, List[SelectedContent]]:
     """Filter sentences that contain verifiable claims.
 
     Args:
         state: Current workflow state
+        config: Run config carrying the LLM provider/model selection
 
     Returns:
         Dictionary with selected_contents key
@@ -124,20 +145,47 @@ async def selection_node(state: State) -> Dict[str, List[SelectedContent]]:
         logger.warning("No sentences to process")
         return {}
 
-    # Get LLM with temperature 0.2 since we're using multiple completions with configured provider
-    from utils.settings import settings
-    llm = get_llm(completions=COMPLETIONS, provider=settings.llm_provider)
-
-    # Process all sentences with voting
-    selected_contents = await process_with_voting(
-        items=contextual_sentences,
-        processor=_single_selection_attempt,
-        llm=llm,
-        completions=COMPLETIONS,
-        min_successes=MIN_SUCCESSES,
-        result_factory=_create_selected_content,
-        description="sentence",
+    async def select(
+        pending: List[ContextualSentence],
+    ) -> Tuple[List[Optional[str]], Set[int]]:
+        # Get LLM with temperature 0.2 since we're using multiple completions with the run's provider
+        llm = get_llm(completions=COMPLETIONS, config=config)
+
+        # Process the sentences with voting
+        failed: Set[int] = set()
+        selected = await process_with_voting(
+            items=pending,
+            processor=tracking_failures(
+                partial(
+                    _single_selection_attempt, sentences=state.sentences, metadata=state.metadata
+                ),
+                failed,
+            ),
+            llm=llm,
+            completions=COMPLETIONS,
+            min_successes=MIN_SUCCESSES,
+            result_factory=_create_selected_content,
+            description="sentence",
+        )
+        by_index = {content.original_index: content.processed_sentence for content in selected}
+        return (
+            [by_index.get(item.original_index) for item in pending],
+            {i for i, item in enumerate(pending) if item.original_index in failed},
+        )
+
+    # Sentences whose text and context window are unchanged reuse earlier results
+    processed_sentences = await memoized(
+        "selection",
+        config,
+        contextual_sentences,
+        lambda item: (_excerpt(item, state.sentences, state.metadata), item.original_sentence),
+        select,
     )
+    selected_contents = [
+        SelectedContent(processed_sentence=processed, original_index=item.original_index)
+        for item, processed in zip(contextual_sentences, processed_sentences)
+        if processed is not None
+    ]
 
     if not selected_contents:
         logger.info("No verifiable claims found")
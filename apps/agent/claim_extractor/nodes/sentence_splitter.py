@@ -1,70 +1,258 @@
 """Sentence splitting and context creation.
 
-Chunks input text into sentences and builds context windows for each one.
+Chunks input text into the document sentence table that context windows
+are rendered from.
+Segmentation is pluggable: "punkt" (NLTK, default) or "regex", a fast
+rule-based segmenter that understands markdown structure.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional
+import re
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-import nltk
+from langchain_core.runnables import RunnableConfig
 
-from claim_extractor.config import CONTEXT_WINDOWS
+from claim_extractor.config import SENTENCE_SPLITTER_CONFIG
 from claim_extractor.schemas import ContextualSentence, State
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Punkt data bundled with the package (populated at image build time) so
+# production never downloads at runtime
+BUNDLED_NLTK_DATA = Path(__file__).resolve().parent.parent / "nltk_data"
+
+LANGUAGE = SENTENCE_SPLITTER_CONFIG["language"]
+OFFLOAD_THRESHOLD_CHARS = SENTENCE_SPLITTER_CONFIG["offload_threshold_chars"]
+DEFAULT_SEGMENTER = SENTENCE_SPLITTER_CONFIG["segmenter"]
+
+# Loaded once per process by get_sentence_tokenizer()
+_tokenizer: Optional[Any] = None
+_tokenizer_lock = threading.Lock()
+
 
 def ensure_nltk_resources() -> None:
     """Download NLTK stuff if needed."""
-    resources = ["tokenizers/punkt_tab", "tokenizers/punkt"]
+    import nltk
+
+    if BUNDLED_NLTK_DATA.is_dir() and str(BUNDLED_NLTK_DATA) not in nltk.data.path:
+        nltk.data.path.insert(0, str(BUNDLED_NLTK_DATA))
 
-    for resource in resources:
-        try:
-            nltk.data.find(resource)
-            return
-        except LookupError:
-            continue
+    try:
+        nltk.data.find("tokenizers/punkt_tab")
+        return
+    except LookupError:
+        pass
 
-    # None found, download both
+    # Not bundled or installed - fall back to downloading it
     logger.info("Downloading NLTK resources...")
     nltk.download("punkt_tab", quiet=True)
-    nltk.download("punkt", quiet=True)
 
 
-async def _sentence_splitter_and_context_creator(
-    answer_text: str,
-    p_sentences: int = 1,
-    f_sentences: int = 1,
-    include_metadata: bool = False,
-    metadata: Optional[str] = None,
-) -> List[ContextualSentence]:
-    """Split text into sentences and add context windows.
+def get_sentence_tokenizer() -> Any:
+    """Get the punkt sentence tokenizer, loading it on first call.
+
+    Blocking (may hit the filesystem or network) - call from a worker thread
+    when on the event loop and the tokenizer isn't loaded yet.
+    """
+    global _tokenizer
+    if _tokenizer is None:
+        with _tokenizer_lock:
+            if _tokenizer is None:
+                ensure_nltk_resources()
+                from nltk.tokenize import PunktTokenizer
+
+                _tokenizer = PunktTokenizer(LANGUAGE)
+                logger.info(f"Loaded punkt sentence tokenizer ({LANGUAGE})")
+    return _tokenizer
+
+
+class SentenceSegmenter(ABC):
+    """Abstract base class for sentence segmenters."""
+
+    @property
+    def ready(self) -> bool:
+        """Whether segment() can run without loading resources first."""
+        return True
+
+    @abstractmethod
+    def segment(self, text: str) -> List[str]:
+        """Split raw text into sentences.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            Sentences in document order
+        """
+        pass
+
+
+class PunktSegmenter(SentenceSegmenter):
+    """NLTK punkt, applied per line so bullet lists and paragraphs stay apart."""
+
+    _LINE_BREAK = re.compile(r"\r?\n")
+
+    @property
+    def ready(self) -> bool:
+        return _tokenizer is not None
+
+    def segment(self, text: str) -> List[str]:
+        tokenizer = get_sentence_tokenizer()
+
+        sentences: List[str] = []
+        for paragraph in self._LINE_BREAK.split(text):
+            if paragraph.strip():
+                sentences.extend(tokenizer.tokenize(paragraph.strip()))
+        return sentences
+
+
+class RegexSegmenter(SentenceSegmenter):
+    """Fast rule-based segmenter built on compiled regexes.
+
+    Understands markdown structure: headings, list items and lines are their
+    own units, soft-wrapped lines (continuing in lowercase) are joined, and
+    fenced code blocks are dropped.
+    Within a unit it splits after . ! ? unless the period belongs to a known
+    abbreviation, an initial or a dotted acronym, or the next word is lowercase.
+    """
+
+    ABBREVIATIONS = frozenset(
+        {
+            "mr.", "mrs.", "ms.", "dr.", "prof.", "sr.", "jr.", "st.", "mt.",
+            "vs.", "e.g.", "i.e.", "cf.", "al.", "approx.", "ca.", "no.",
+            "fig.", "vol.", "inc.", "ltd.", "co.", "corp.", "dept.", "gen.",
+            "gov.", "rep.", "sen.", "jan.", "feb.", "mar.", "apr.", "jun.",
+            "jul.", "aug.", "sep.", "sept.", "oct.", "nov.", "dec.",
+        }
+    )
+
+    # Real newlines and literal "\\n" escapes left in by some clients
+    _LINE_BREAK = re.compile(r"\r?\n|\\n")
+    _FENCE = re.compile(r"^\s*(```|~~~)")
+    _HEADING = re.compile(r"^\s{0,3}#{1,6}\s+(.*?)[\s#]*$")
+    _LIST_ITEM = re.compile(r"^\s*(?:[-*+\u2022]|\d{1,3}[.)])\s+")
+    # Terminal punctuation, closing quotes/brackets, citation markers like [^1^], then space
+    _CANDIDATE = re.compile(r"[.!?]+[\"'\u201d\u2019)\]]*(?:\s*\[\^?\d+\^?\])*\s+")
+    _LAST_TOKEN = re.compile(r"(\S+)$")
+    _INITIAL_OR_ACRONYM = re.compile(r"^\(?(?:[A-Za-z]\.)+$")
+
+    def segment(self, text: str) -> List[str]:
+        sentences: List[str] = []
+        for block in self._blocks(text):
+            sentences.extend(self._split_block(block))
+        return sentences
+
+    def _blocks(self, text: str) -> Iterator[str]:
+        """Group lines into headings, list items and paragraphs."""
+        paragraph: List[str] = []
+        in_code = False
+
+        for line in self._LINE_BREAK.split(text):
+            if self._FENCE.match(line):
+                in_code = not in_code
+                if paragraph:
+                    yield " ".join(paragraph)
+                    paragraph = []
+                continue
+            if in_code:
+                continue
+
+            stripped = line.strip()
+            heading = self._HEADING.match(line)
+            item = self._LIST_ITEM.match(line) if not heading else None
+
+            # A line continues the paragraph only when it reads as a soft wrap
+            new_unit = not stripped or heading or item or not stripped[0].islower()
+            if new_unit:
+                if paragraph:
+                    yield " ".join(paragraph)
+                    paragraph = []
+
+            if heading:
+                if heading.group(1):
+                    yield heading.group(1)
+            elif item:
+                paragraph = [line[item.end():].strip()]
+            elif stripped:
+                paragraph.append(stripped)
+
+        if paragraph:
+            yield " ".join(paragraph)
+
+    def _is_boundary(self, block: str, match: "re.Match[str]") -> bool:
+        following = block[match.end():match.end() + 1]
+        if following.islower():
+            return False
+
+        if block[match.start()] != ".":
+            return True
+
+        token = self._LAST_TOKEN.search(block, 0, match.start() + 1)
+        word = token.group(1) if token else ""
+        if word.lower() in self.ABBREVIATIONS:
+            return False
+        # Initials ("J. K. Rowling") and dotted acronyms ("U.S.") - except when
+        # the acronym is long enough to plausibly end the sentence
+        return not self._INITIAL_OR_ACRONYM.match(word) or len(word) > 4
+
+    def _split_block(self, block: str) -> List[str]:
+        sentences: List[str] = []
+        start = 0
+        for match in self._CANDIDATE.finditer(block):
+            if match.end() < len(block) and self._is_boundary(block, match):
+                sentences.append(block[start:match.end()].strip())
+                start = match.end()
+
+        tail = block[start:].strip()
+        if tail:
+            sentences.append(tail)
+        return sentences
+
+
+SEGMENTERS = {
+    "punkt": PunktSegmenter,
+    "regex": RegexSegmenter,
+}
+
+# Segmenter cache for singleton pattern - they are stateless
+_SEGMENTER_CACHE: Dict[str, SentenceSegmenter] = {}
+
+
+def get_segmenter(name: Optional[str] = None) -> SentenceSegmenter:
+    """Get a sentence segmenter by name.
 
     Args:
-        answer_text: Text to split
-        p_sentences: Number of preceding sentences for context
-        f_sentences: Number of following sentences for context
-        include_metadata: Whether to include metadata
-        metadata: Source metadata
+        name: "punkt" or "regex". If None, uses the configured default.
 
     Returns:
-        List of sentences with context
+        Segmenter instance
     """
-    logger.info("Stage 1: Sentence Splitting and Context Creation")
+    name = name or DEFAULT_SEGMENTER
+    if name not in _SEGMENTER_CACHE:
+        if name not in SEGMENTERS:
+            raise ValueError(
+                f"Unknown sentence segmenter: {name}. Supported segmenters: {list(SEGMENTERS)}"
+            )
+        _SEGMENTER_CACHE[name] = SEGMENTERS[name]()
+    return _SEGMENTER_CACHE[name]
 
-    # Get tokenizer
-    ensure_nltk_resources()
 
-    # Split by paragraphs first, then sentences
-    # This handles bullet lists and paragraph breaks better
-    paragraphs = [p.strip() for p in answer_text.split("\\n") if p.strip()]
-    raw_sentences_from_paragraphs: List[str] = []
-    for paragraph in paragraphs:
-        raw_sentences_from_paragraphs.extend(nltk.sent_tokenize(paragraph))
+def _split_into_sentences(answer_text: str, segmenter: SentenceSegmenter) -> List[str]:
+    """Split text into sentences, merging tiny fragments.
 
-    # Use the paragraph-aware sentences
-    raw_sentences = raw_sentences_from_paragraphs
+    Args:
+        answer_text: Text to split
+        segmenter: Segmenter producing the raw sentences
+
+    Returns:
+        List of sentences
+    """
+    raw_sentences = segmenter.segment(answer_text)
 
     # Merge short fragments (< 5 chars) with next sentence
     # Avoids processing meaningless bits like bullet points
@@ -82,72 +270,62 @@ async def _sentence_splitter_and_context_creator(
             merged_sentences.append(current_sentence)
         i += 1
 
-    # Create context windows for each sentence
-    contextual_sentences: List[ContextualSentence] = []
-
-    for i, sentence in enumerate(merged_sentences):
-        context_parts: List[str] = []
-
-        # Add metadata if available
-        if include_metadata and metadata:
-            context_parts.append(f"[Document Metadata: {metadata}]")
-
-        # Add preceding sentences
-        start_index = max(0, i - p_sentences)
-        if start_index < i:
-            context_parts.append("\n[Preceding Sentences:]")
-            for j in range(start_index, i):
-                context_parts.append(merged_sentences[j])
-
-        # Add the sentence itself
-        context_parts.append(f"\n[Sentence of Interest for current task:]\n{sentence}")
-
-        # Add following sentences
-        end_index = min(len(merged_sentences), i + 1 + f_sentences)
-        if (i + 1) < end_index:
-            context_parts.append("\n[Following Sentences:]")
-            for j in range(i + 1, end_index):
-                context_parts.append(merged_sentences[j])
-
-        # Package it up
-        full_context_str = "\n".join(context_parts)
-        contextual_sentences.append(
-            ContextualSentence(
-                original_sentence=sentence,
-                context_for_llm=full_context_str,
-                metadata=metadata,
-                original_index=i,
-            )
-        )
+    return merged_sentences
+
+
+async def _sentence_splitter_and_context_creator(
+    answer_text: str,
+    segmenter: Optional[SentenceSegmenter] = None,
+) -> Tuple[List[str], List[ContextualSentence]]:
+    """Split text into the document sentence table and per-sentence items.
 
-        # Log a preview
-        sentence_preview = sentence[:30] + ("..." if len(sentence) > 30 else "")
-        logger.debug(f"Context created for: '{sentence_preview}'")
+    Items only reference the table by index; each stage renders the context
+    window it needs with utils.render_context.
+
+    Args:
+        answer_text: Text to split
+        segmenter: Sentence segmenter (defaults to the configured one)
+
+    Returns:
+        (sentences, contextual sentences)
+    """
+    logger.info("Stage 1: Sentence Splitting and Context Creation")
+
+    segmenter = segmenter or get_segmenter()
+
+    # Keep the event loop free while resources load or a large document splits
+    if not segmenter.ready or len(answer_text) > OFFLOAD_THRESHOLD_CHARS:
+        sentences = await asyncio.to_thread(_split_into_sentences, answer_text, segmenter)
+    else:
+        sentences = _split_into_sentences(answer_text, segmenter)
+
+    contextual_sentences = [
+        ContextualSentence(original_sentence=sentence, original_index=i)
+        for i, sentence in enumerate(sentences)
+    ]
 
     logger.info(f"Processed {len(contextual_sentences)} sentences with context")
-    return contextual_sentences
+    return sentences, contextual_sentences
 
 
-async def sentence_splitter_node(state: State) -> Dict[str, List[ContextualSentence]]:
+async def sentence_splitter_node(
+    state: State, config: RunnableConfig
+) -> Dict[str, List[Any]]:
     """Split text into sentences and create context windows.
 
     Args:
         state: Current workflow state
+        config: Run config; configurable.sentence_segmenter overrides the default
 
     Returns:
-        Dictionary with contextual_sentences key
+        Dictionary with sentences and contextual_sentences keys
     """
-    # Get what we need from state
-    answer_text = state.answer_text
-    metadata = state.metadata
-
-    # Use config-defined context window sizes
-    p_sentences = CONTEXT_WINDOWS["selection"]["preceding_sentences"]
-    f_sentences = CONTEXT_WINDOWS["selection"]["following_sentences"]
+    configurable = (config or {}).get("configurable") or {}
+    segmenter = get_segmenter(configurable.get("sentence_segmenter"))
 
     # Process the text
-    contextual_sentences = await _sentence_splitter_and_context_creator(
-        answer_text, p_sentences, f_sentences, bool(metadata), metadata
+    sentences, contextual_sentences = await _sentence_splitter_and_context_creator(
+        state.answer_text, segmenter
     )
 
-    return {"contextual_sentences": contextual_sentences}
+    return {"sentences": sentences, "contextual_sentences": contextual_sentences}
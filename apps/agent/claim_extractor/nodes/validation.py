@@ -1,19 +1,38 @@
 """Validation node - verifies claims are properly formed sentences.
 
 Makes sure claims are complete declarative sentences ready for fact-checking.
+Obvious non-sentences are rejected locally; the rest are validated in
+batches of several claims per LLM call.
 """
 
 import asyncio
 import logging
-from typing import Dict, Sequence
+import re
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
+from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel, Field
-from claim_extractor.prompts import VALIDATION_HUMAN_PROMPT, VALIDATION_SYSTEM_PROMPT
+from claim_extractor.config import VALIDATION_CONFIG
+from claim_extractor.memo import memoized
+from claim_extractor.prompts import (
+    BATCH_VALIDATION_HUMAN_PROMPT,
+    BATCH_VALIDATION_SYSTEM_PROMPT,
+    VALIDATION_HUMAN_PROMPT,
+    VALIDATION_SYSTEM_PROMPT,
+)
 from claim_extractor.schemas import PotentialClaim, State, ValidatedClaim
-from utils import get_llm, call_llm_with_structured_output
+from security import release_run_lease
+from utils import (
+    call_llm_with_structured_output,
+    collect_llm_errors,
+    estimate_token_count,
+    get_llm,
+)
 
 logger = logging.getLogger(__name__)
 
+_WORD = re.compile(r"[A-Za-z][A-Za-z'-]*")
+
 
 class ValidationOutput(BaseModel):
     """Response schema for validation LLM calls."""
@@ -23,11 +42,66 @@ class ValidationOutput(BaseModel):
     )
 
 
-async def _validate_claim(potential_claim: PotentialClaim) -> ValidatedClaim:
+class ClaimValidation(BaseModel):
+    """Validation result for one claim of a batch."""
+
+    index: int = Field(description="The number of the claim in the list")
+    is_complete_declarative: bool = Field(
+        description="Whether the claim is a complete declarative sentence"
+    )
+
+
+class BatchValidationOutput(BaseModel):
+    """Response schema for batched validation LLM calls."""
+
+    results: List[ClaimValidation] = Field(
+        default_factory=list, description="One validation result per claim"
+    )
+
+
+def prefilter_rejection(claim_text: str) -> Optional[str]:
+    """Why a claim is obviously not a declarative sentence, or None if unsure.
+
+    Deliberately conservative: only the shape of the text is checked, and
+    anything that might be a sentence (including verbless-looking ones) is
+    left to the LLM.
+    """
+    text = claim_text.strip()
+    words = _WORD.findall(text)
+
+    if not words:
+        return "no words"
+    if text.endswith("?"):
+        return "question"
+    if text.endswith(":"):
+        return "heading"
+    if len(words) < 2:
+        return "fragment"
+    return None
+
+
+def _to_validated_claim(
+    potential_claim: PotentialClaim, is_valid: bool, sentences: Sequence[str]
+) -> ValidatedClaim:
+    return ValidatedClaim(
+        claim_text=potential_claim.claim_text,
+        is_complete_declarative=is_valid,
+        disambiguated_sentence=potential_claim.disambiguated_sentence,
+        original_sentence=sentences[potential_claim.original_index],
+        original_index=potential_claim.original_index,
+        source_indices=potential_claim.source_indices,
+    )
+
+
+async def _validate_claim(
+    potential_claim: PotentialClaim, config: RunnableConfig, sentences: Sequence[str]
+) -> ValidatedClaim:
     """Check if a claim is a properly formed complete sentence.
 
     Args:
         potential_claim: Claim to validate
+        config: Run config carrying the LLM provider/model selection
+        sentences: Document sentence table
 
     Returns:
         Validation result
@@ -39,9 +113,8 @@ async def _validate_claim(potential_claim: PotentialClaim) -> ValidatedClaim:
         ("human", VALIDATION_HUMAN_PROMPT.format(claim=potential_claim.claim_text)),
     ]
 
-    # Use zero-temp LLM for consistent results with configured provider
-    from utils.settings import settings
-    llm = get_llm(provider=settings.llm_provider)  # Uses configured provider and default temperature for consistent results
+    # Use zero-temp LLM for consistent results with the run's provider
+    llm = get_llm(config=config)
 
     # Call the LLM
     response = await call_llm_with_structured_output(
@@ -62,21 +135,127 @@ async def _validate_claim(potential_claim: PotentialClaim) -> ValidatedClaim:
         f"Claim validation {'succeeded' if is_valid else 'failed'}: '{potential_claim.claim_text}'",
     )
 
-    # Return result
-    return ValidatedClaim(
-        claim_text=potential_claim.claim_text,
-        is_complete_declarative=is_valid,
-        disambiguated_sentence=potential_claim.disambiguated_sentence,
-        original_sentence=potential_claim.original_sentence,
-        original_index=potential_claim.original_index,
+    return _to_validated_claim(potential_claim, is_valid, sentences)
+
+
+def _batch_claims(claims: Sequence[PotentialClaim]) -> List[List[PotentialClaim]]:
+    """Split claims into batches bounded by claim count and estimated tokens."""
+    max_claims = VALIDATION_CONFIG["max_batch_claims"]
+    max_tokens = VALIDATION_CONFIG["max_batch_tokens"]
+
+    batches: List[List[PotentialClaim]] = []
+    batch: List[PotentialClaim] = []
+    batch_tokens = 0
+    for claim in claims:
+        tokens = estimate_token_count(claim.claim_text) + 1
+        if batch and (len(batch) >= max_claims or batch_tokens + tokens > max_tokens):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(claim)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+async def _validate_batch(
+    batch: Sequence[PotentialClaim], config: RunnableConfig, sentences: Sequence[str]
+) -> List[ValidatedClaim]:
+    """Validate a batch of claims in one LLM call.
+
+    Results are matched to claims by their 1-based index; claims the response
+    leaves out (or answers inconsistently) are validated one by one.
+
+    Args:
+        batch: Claims to validate
+        config: Run config carrying the LLM provider/model selection
+        sentences: Document sentence table
+
+    Returns:
+        Validation results in batch order
+    """
+    if len(batch) == 1:
+        return [await _validate_claim(batch[0], config, sentences)]
+
+    claims_list = "\n".join(
+        f"{number}. {claim.claim_text}" for number, claim in enumerate(batch, start=1)
+    )
+    messages = [
+        ("system", BATCH_VALIDATION_SYSTEM_PROMPT),
+        ("human", BATCH_VALIDATION_HUMAN_PROMPT.format(claims=claims_list)),
+    ]
+
+    response = await call_llm_with_structured_output(
+        llm=get_llm(config=config),
+        output_class=BatchValidationOutput,
+        messages=messages,
+        context_desc=f"batched validation of {len(batch)} claims",
     )
 
+    answers: Dict[int, bool] = {}
+    conflicting = set()
+    for result in response.results if response else []:
+        index = result.index - 1
+        if not 0 <= index < len(batch):
+            continue
+        if index in answers and answers[index] != result.is_complete_declarative:
+            conflicting.add(index)
+        answers.setdefault(index, result.is_complete_declarative)
 
-async def validation_node(state: State) -> Dict[str, Sequence[ValidatedClaim]]:
+    unanswered = [i for i in range(len(batch)) if i not in answers or i in conflicting]
+    if unanswered:
+        logger.warning(
+            f"Batched validation left {len(unanswered)} of {len(batch)} claims unanswered; "
+            f"validating them individually"
+        )
+    retried = await asyncio.gather(
+        *(_validate_claim(batch[i], config, sentences) for i in unanswered)
+    )
+
+    results = {i: validated for i, validated in zip(unanswered, retried)}
+    for i, claim in enumerate(batch):
+        if i not in results:
+            results[i] = _to_validated_claim(claim, answers[i], sentences)
+    return [results[i] for i in range(len(batch))]
+
+
+async def _validate_claims(
+    claims: List[PotentialClaim], config: RunnableConfig, sentences: Sequence[str]
+) -> Tuple[List[bool], Set[int]]:
+    """Validate claims, batched or one per call.
+
+    Returns:
+        (validity per claim, positions of claims whose LLM calls failed)
+    """
+    if VALIDATION_CONFIG["batched"]:
+        batches = _batch_claims(claims)
+    else:
+        batches = [[claim] for claim in claims]
+
+    async def validate(batch: List[PotentialClaim]) -> Tuple[List[ValidatedClaim], bool]:
+        with collect_llm_errors() as errors:
+            validated = await _validate_batch(batch, config, sentences)
+        return validated, bool(errors)
+
+    outcomes = await asyncio.gather(*(validate(batch) for batch in batches))
+
+    valid: List[bool] = []
+    failed: Set[int] = set()
+    for validated, errored in outcomes:
+        if errored:
+            failed.update(range(len(valid), len(valid) + len(validated)))
+        valid.extend(claim.is_complete_declarative for claim in validated)
+    return valid, failed
+
+
+async def validation_node(
+    state: State, config: RunnableConfig
+) -> Dict[str, Sequence[ValidatedClaim]]:
     """Validate claims as complete, properly formed sentences.
 
     Args:
         state: Current workflow state
+        config: Run config carrying the LLM provider/model selection
 
     Returns:
         Dictionary with validated_claims key
@@ -85,12 +264,33 @@ async def validation_node(state: State) -> Dict[str, Sequence[ValidatedClaim]]:
 
     if not potential_claims:
         logger.warning("No claims to validate")
+        await release_run_lease(config)
         return {}
 
-    # Validate all claims in parallel
-    validation_results = await asyncio.gather(
-        *[_validate_claim(claim) for claim in potential_claims]
+    results: Dict[int, ValidatedClaim] = {}
+    candidates = []
+    for position, claim in enumerate(potential_claims):
+        reason = prefilter_rejection(claim.claim_text) if VALIDATION_CONFIG["prefilter"] else None
+        if reason:
+            logger.info(f"Claim rejected by pre-filter ({reason}): '{claim.claim_text}'")
+            results[position] = _to_validated_claim(claim, False, state.sentences)
+        else:
+            candidates.append(position)
+
+    # Validity only depends on the claim text, so unchanged claims reuse it
+    candidate_claims = [potential_claims[position] for position in candidates]
+    valid = await memoized(
+        "validation",
+        config,
+        candidate_claims,
+        lambda claim: (claim.claim_text,),
+        lambda pending: _validate_claims(pending, config, state.sentences),
+    )
+    results.update(
+        (position, _to_validated_claim(claim, bool(is_valid), state.sentences))
+        for position, claim, is_valid in zip(candidates, candidate_claims, valid)
     )
+    validation_results = [results[position] for position in range(len(potential_claims))]
 
     # Filter out invalid and duplicate claims
     validated_claims = []
@@ -113,4 +313,5 @@ async def validation_node(state: State) -> Dict[str, Sequence[ValidatedClaim]]:
             logger.info(f"Discarded claim ({reason}): '{validated.claim_text}'")
 
     logger.info(f"Validated {len(validated_claims)} of {len(potential_claims)} claims")
+    await release_run_lease(config)
     return {"validated_claims": validated_claims}
@@ -12,6 +12,11 @@ Claim:
 {claim}
 """
 
+BATCH_VALIDATION_HUMAN_PROMPT = """
+Claims:
+{claims}
+"""
+
 ### SYSTEM PROMPTS ###
 
 SELECTION_SYSTEM_PROMPT = """
@@ -118,6 +123,37 @@ After completing this analysis, my output will directly populate the following s
 If the sentence cannot be disambiguated due to unresolvable ambiguities, I will set cannot_be_disambiguated to true and disambiguated_sentence to null. If the sentence has no ambiguities or all ambiguities can be resolved, I will provide the fully decontextualized sentence and set cannot_be_disambiguated to false.
 """
 
+SELECTION_DISAMBIGUATION_SYSTEM_PROMPT = """
+You are an assistant to a fact-checker. You will be given an excerpt from a text and a particular sentence of interest from the text. If it contains "[...]", this means that you are NOT seeing all sentences in the text. You will complete two tasks in order.
+
+Task 1 - Selection: determine whether the sentence contains at least one specific and verifiable proposition, and if so, rewrite it as a complete sentence that only contains verifiable information.
+- If the sentence is about a lack of information, e.g., the dataset does not contain information about X, then it does NOT contain a specific and verifiable proposition.
+- It does NOT matter whether the proposition is true or false, or whether it contains ambiguous terms; ambiguity is handled in Task 2.
+- Do NOT consider whether the sentence contains a citation.
+- Consider the preceding and following sentences: a sentence that only introduces the following sentences, or only concludes the preceding ones, does NOT contain a specific and verifiable proposition.
+- Broad or generic statements, opinions, interpretations, speculations and recommendations (e.g., "Technological progress should be inclusive", "AI could lead to advancements in healthcare") do NOT contain a specific and verifiable proposition.
+- Remove unverifiable parts and keep the verifiable core, e.g., "Smith's advocacy for renewable energy is crucial in addressing these challenges" -> "Smith advocates for renewable energy"; "John, the CEO of Company X, is a notable example of effective leadership" -> "John is the CEO of Company X".
+
+Task 2 - Disambiguation: if Task 1 found verifiable content, "decontextualize" the selected sentence using ONLY the text that comes before the sentence in the excerpt (the following sentences must not be used here):
+1. if partial names or undefined acronyms/abbreviations can be resolved using that context, use the full name or definition
+2. if the sentence in isolation contains linguistic ambiguity (referential, including temporal, or structural) that a group of readers shown the context would resolve the same way, make the necessary changes
+- Vagueness and generality are NOT linguistic ambiguity. The lack of a full name or a definition in the context is NOT linguistic ambiguity either; leave such terms as they are.
+- If any linguistic ambiguity has no clear resolution in the context, the sentence cannot be disambiguated.
+- Do NOT include any citations, and do NOT use any external knowledge beyond what is stated in the context and sentence.
+
+For example:
+- Context = "John Smith was an early employee who transitioned to management in 2010", Sentence = "At the time, he was an insightful leader of the company's operations and finance teams." -> selected: "At the time, he led the company's operations and finance teams"; disambiguated: "In 2010, John Smith led the company's operations and finance teams."
+- Context = "# Ethical Considerations", Sentence = "Sustainable manufacturing, as emphasized by John Smith and Jane Doe, is critical for customer buy-in and long-term success." -> verifiable, but it is unclear whether John Smith and Jane Doe or the writer claim that it is critical, so it cannot be disambiguated.
+
+After completing this analysis, my output will directly populate the following structured fields:
+
+- processed_sentence: The complete sentence containing only verifiable information (Task 1), or null if there are no verifiable claims.
+- no_verifiable_claims: true if the sentence does not contain any specific and verifiable propositions; otherwise, false.
+- remains_unchanged: true if the original sentence already contains only verifiable information and requires no modifications in Task 1; otherwise, false.
+- disambiguated_sentence: The fully decontextualized version of processed_sentence (Task 2), or null if it cannot be disambiguated or there are no verifiable claims.
+- cannot_be_disambiguated: true if any linguistic ambiguity in processed_sentence cannot be resolved using the preceding context; otherwise, false.
+"""
+
 DECOMPOSITION_SYSTEM_PROMPT = """
 You are an assistant for a group of fact-checkers. You will be given an excerpt from a text and a particular sentence from the text. If it contains "[...]", this means that you are NOT seeing all sentences in the text. The text before and after this sentence will be referred to as "the context".
 
@@ -198,3 +234,19 @@ Claim: Sourcing materials from sustainable suppliers
 C = Sourcing materials from sustainable suppliers
 In isolation, is C a complete, declarative sentence? It's missing a subject and a verb, so C is not a complete, declarative sentence.
 """
+
+BATCH_VALIDATION_SYSTEM_PROMPT = """
+## Overview
+You will be given a numbered list of claims. For each claim C, your task is to determine whether C, in isolation, is a complete, declarative sentence. Judge every claim on its own; the other claims in the list are NOT context for it.
+
+## Examples
+- "Sourcing materials from sustainable suppliers is an example of how companies are improving their sustainability practices" is a complete, declarative sentence.
+- "Sourcing materials from sustainable suppliers" is missing a subject and a verb, so it is not a complete, declarative sentence.
+
+## Output
+Your output will directly populate the following structured field:
+
+- results: one entry per claim, in the order given, each with
+    - index: the number of the claim in the list
+    - is_complete_declarative: true if the claim is a complete, declarative sentence; otherwise, false
+"""
@@ -1,6 +1,9 @@
 """Data models for the claim extraction pipeline.
 
-All the structured types used throughout the workflow.
+All the structured types used throughout the workflow. Intermediate stages
+are kept flat and refer to the source sentence by its index in
+State.sentences, so state updates and checkpoints don't re-serialize nested
+copies of earlier stages.
 """
 
 from operator import add
@@ -10,15 +13,9 @@ from pydantic import BaseModel, Field
 
 
 class ContextualSentence(BaseModel):
-    """A sentence with its surrounding context."""
+    """A sentence of the document; its context is rendered from State.sentences."""
 
     original_sentence: str = Field(description="The raw sentence from the source text")
-    context_for_llm: str = Field(
-        description="Full context for the LLM including surrounding sentences and metadata"
-    )
-    metadata: Optional[str] = Field(
-        default=None, description="Additional metadata about the source"
-    )
     original_index: int = Field(
         description="Index of the sentence in the original text"
     )
@@ -30,8 +27,8 @@ class SelectedContent(BaseModel):
     processed_sentence: str = Field(
         description="Original or modified verifiable sentence after selection"
     )
-    original_context_item: ContextualSentence = Field(
-        description="Reference to the original contextual sentence"
+    original_index: int = Field(
+        description="Index of the source sentence in State.sentences"
     )
 
 
@@ -41,8 +38,8 @@ class DisambiguatedContent(BaseModel):
     disambiguated_sentence: str = Field(
         description="Sentence with ambiguities resolved"
     )
-    original_selected_item: SelectedContent = Field(
-        description="Reference to the original selected content"
+    original_index: int = Field(
+        description="Index of the source sentence in State.sentences"
     )
 
 
@@ -53,11 +50,12 @@ class PotentialClaim(BaseModel):
     disambiguated_sentence: str = Field(
         description="The disambiguated sentence the claim was extracted from"
     )
-    original_sentence: str = Field(
-        description="The original sentence from the answer text"
-    )
     original_index: int = Field(
-        description="Index of the original sentence in the answer text"
+        description="Index of the source sentence in State.sentences"
+    )
+    source_indices: List[int] = Field(
+        default_factory=list,
+        description="Indices of every sentence the claim (or a duplicate of it) came from",
     )
 
 
@@ -77,12 +75,20 @@ class ValidatedClaim(BaseModel):
     original_index: int = Field(
         description="Index of the original sentence in the answer text"
     )
+    source_indices: List[int] = Field(
+        default_factory=list,
+        description="Indices of every sentence the claim (or a duplicate of it) came from",
+    )
 
 
 class State(BaseModel):
     """The workflow graph state object."""
 
     answer_text: str = Field(description="The answer text being analyzed")
+    sentences: List[str] = Field(
+        default_factory=list,
+        description="Document sentence table that context windows are rendered from",
+    )
     contextual_sentences: List[ContextualSentence] = Field(
         default_factory=list, description="Sentences with their surrounding context"
     )
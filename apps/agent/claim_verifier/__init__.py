@@ -3,13 +3,14 @@
 A pipeline for evaluating the accuracy of factual claims using web searches.
 """
 
-from claim_verifier.agent import create_graph, graph
+from claim_verifier.agent import create_graph
 from claim_verifier.schemas import (
     Evidence,
     Verdict,
     ClaimVerifierState,
     VerificationResult,
     IntermediateAssessment,
+    timed_out_verdict,
 )
 
 __all__ = [
@@ -22,4 +23,14 @@ __all__ = [
     "Verdict",
     "VerificationResult",
     "IntermediateAssessment",
+    "timed_out_verdict",
 ]
+
+
+def __getattr__(name: str):
+    # Resolve the compiled graph lazily (see claim_verifier.agent)
+    if name == "graph":
+        from claim_verifier import agent
+
+        return agent.graph
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
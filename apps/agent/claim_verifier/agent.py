@@ -1,8 +1,10 @@
 import logging
+from typing import Optional
 
 from dotenv import load_dotenv
-from langgraph.graph import END, StateGraph
+from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from utils import LLMConfigurable
 
 from claim_verifier.nodes import (
     evaluate_evidence_node,
@@ -26,10 +28,10 @@ def create_graph() -> CompiledStateGraph:
     The pipeline follows these steps:
     1. Generate search query for a claim
     2. Retrieve evidence from web search
-    3. Decide whether to continue searching or evaluate
+    3. Decide whether to continue searching or evaluate (LLM or heuristics)
     4. Either generate new query or make final evaluation
     """
-    workflow = StateGraph(ClaimVerifierState)
+    workflow = StateGraph(ClaimVerifierState, config_schema=LLMConfigurable)
 
     workflow.add_node("generate_search_query", generate_search_query_node)
     workflow.add_node("retrieve_evidence", retrieve_evidence_node)
@@ -40,10 +42,21 @@ def create_graph() -> CompiledStateGraph:
 
     workflow.add_edge("generate_search_query", "retrieve_evidence")
     workflow.add_edge("retrieve_evidence", "search_decision")
-    # search_decision node returns Command objects, so no conditional edge needed
-    workflow.add_edge("evaluate_evidence", END)
+    # search_decision and evaluate_evidence return Command objects, so no
+    # conditional edges are needed; evaluate_evidence ends the run unless the
+    # "merged" decision mode asks it for another search round
 
     return workflow.compile()
 
 
-graph = create_graph()
+_graph: Optional[CompiledStateGraph] = None
+
+
+def __getattr__(name: str):
+    """Compile ``graph`` on first access so importing the module stays cheap."""
+    global _graph
+    if name == "graph":
+        if _graph is None:
+            _graph = create_graph()
+        return _graph
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
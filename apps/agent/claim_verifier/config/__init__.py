@@ -4,10 +4,13 @@ Central storage for all configuration settings.
 """
 
 from claim_verifier.config.nodes import (
+    AUTHORITATIVE_DOMAINS,
+    AUTHORITATIVE_SUFFIXES,
     QUERY_GENERATION_CONFIG,
     EVIDENCE_RETRIEVAL_CONFIG,
     EVIDENCE_EVALUATION_CONFIG,
     ITERATIVE_SEARCH_CONFIG,
+    SEARCH_DECISION_CONFIG,
 )
 
 __all__ = [
@@ -16,4 +19,7 @@ __all__ = [
     "EVIDENCE_RETRIEVAL_CONFIG",
     "EVIDENCE_EVALUATION_CONFIG",
     "ITERATIVE_SEARCH_CONFIG",
+    "SEARCH_DECISION_CONFIG",
+    "AUTHORITATIVE_DOMAINS",
+    "AUTHORITATIVE_SUFFIXES",
 ]
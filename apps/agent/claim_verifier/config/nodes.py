@@ -6,10 +6,13 @@ Contains settings for the claim verification pipeline nodes.
 # Node settings
 QUERY_GENERATION_CONFIG = {
     "temperature": 0.0,  # Zero temp for consistent results
+    "max_seen_sources": 10,  # Already-retrieved URLs listed in iterative prompts
+    "initial_queries": 1,  # Diverse queries searched in parallel in the first round
 }
 
 EVIDENCE_RETRIEVAL_CONFIG = {
     "results_per_query": 3,  # Number of search results to fetch per query
+    "overfetch_results": 3,  # Extra results requested once evidence exists, to replace duplicates
 }
 
 EVIDENCE_EVALUATION_CONFIG = {
@@ -18,4 +21,37 @@ EVIDENCE_EVALUATION_CONFIG = {
 
 ITERATIVE_SEARCH_CONFIG = {
     "max_iterations": 5,
+    # Seconds kept free for the final evaluation when the run has a deadline
+    "evaluation_reserve_seconds": 15,
 }
+
+SEARCH_DECISION_CONFIG = {
+    # "llm": always ask the LLM whether to keep searching
+    # "heuristic": skip the LLM call when cheap evidence signals are decisive
+    # "merged": heuristics first, then let the evaluation call ask for more evidence
+    "mode": "llm",
+    "min_evidence": 2,  # Fewer unique snippets always searches again
+    "sufficient_relevant": 3,  # Relevant snippets needed to stop without the LLM
+    "min_authoritative": 1,  # ...of which at least this many from authoritative sources
+    "relevance_overlap": 0.6,  # Share of claim keywords a snippet must mention to be relevant
+}
+
+# Sources trusted by the sufficiency heuristic
+AUTHORITATIVE_DOMAINS = (
+    "wikipedia.org",
+    "britannica.com",
+    "reuters.com",
+    "apnews.com",
+    "bbc.com",
+    "bbc.co.uk",
+    "nature.com",
+    "science.org",
+    "who.int",
+    "un.org",
+    "nasa.gov",
+    "nih.gov",
+    "snopes.com",
+    "factcheck.org",
+    "politifact.com",
+)
+AUTHORITATIVE_SUFFIXES = (".gov", ".edu", ".int", ".mil", ".gov.uk", ".ac.uk")
@@ -4,29 +4,52 @@ Analyzes evidence snippets to assess if a claim is supported, refuted, or inconc
 """
 
 import logging
-from typing import List
+from typing import List, Literal
 
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph import END
+from langgraph.graph.state import Command
 from pydantic import BaseModel, Field
+from security import release_run_lease
 from utils import (
     call_llm_with_structured_output,
+    deadline_reached,
     get_llm,
+    get_llm_selection,
+    run_within,
+    time_remaining,
     truncate_evidence_for_token_limit,
 )
 
+from claim_verifier.config import ITERATIVE_SEARCH_CONFIG
+from claim_verifier.nodes.search_decision import get_search_decision_mode
 from claim_verifier.prompts import (
     EVIDENCE_EVALUATION_HUMAN_PROMPT,
     EVIDENCE_EVALUATION_SYSTEM_PROMPT,
-    get_current_timestamp,
+    MERGED_DECISION_INSTRUCTIONS,
+    with_current_date,
 )
 from claim_verifier.schemas import (
     ClaimVerifierState,
     Evidence,
+    IntermediateAssessment,
     Verdict,
     VerificationResult,
+    timed_out_verdict,
 )
 
 logger = logging.getLogger(__name__)
 
+# Seconds of the claim budget kept back for the final evaluation call
+EVALUATION_RESERVE = ITERATIVE_SEARCH_CONFIG["evaluation_reserve_seconds"]
+
+# Evaluation model per provider, used unless the run configures a model
+EVALUATION_MODELS = {
+    "openai": "gpt-4o-mini",
+    "gemini": "gemini-2.5-flash",
+    "deepseek": "deepseek-chat",
+}
+
 
 class EvidenceEvaluationOutput(BaseModel):
     verdict: VerificationResult = Field(
@@ -41,6 +64,19 @@ class EvidenceEvaluationOutput(BaseModel):
     )
 
 
+class MergedEvaluationOutput(EvidenceEvaluationOutput):
+    """Evaluation that may ask for another search round instead of a verdict."""
+
+    needs_more_evidence: bool = Field(
+        default=False,
+        description="True only if no confident verdict is possible yet and another search is likely to help",
+    )
+    missing_aspects: List[str] = Field(
+        default_factory=list,
+        description="Specific aspects that need more evidence coverage when needs_more_evidence is true",
+    )
+
+
 def _format_evidence_snippets(snippets: List[Evidence]) -> str:
     if not snippets:
         return "No relevant evidence snippets were found."
@@ -55,9 +91,11 @@ def _format_evidence_snippets(snippets: List[Evidence]) -> str:
     )
 
 
-async def evaluate_evidence_node(state: ClaimVerifierState) -> dict:
+async def evaluate_evidence_node(
+    state: ClaimVerifierState, config: RunnableConfig
+) -> Command[Literal["generate_search_query", "__end__"]]:
     claim = state.claim
-    evidence_snippets = state.evidence
+    evidence_snippets = list(state.evidence.values())
     iteration_count = state.iteration_count
 
     logger.info(
@@ -66,10 +104,19 @@ async def evaluate_evidence_node(state: ClaimVerifierState) -> dict:
         f"after {iteration_count} iterations"
     )
 
-    system_prompt = EVIDENCE_EVALUATION_SYSTEM_PROMPT.format(
-        current_time=get_current_timestamp()
+    # In merged mode the evaluation also decides whether to search again
+    can_search_again = (
+        get_search_decision_mode(config) == "merged"
+        and state.search_decisions[-1:] == ["merged"]
+        and iteration_count < ITERATIVE_SEARCH_CONFIG["max_iterations"]
+        and not deadline_reached(config, reserve=EVALUATION_RESERVE)
     )
 
+    system_prompt = EVIDENCE_EVALUATION_SYSTEM_PROMPT
+    if can_search_again:
+        system_prompt += MERGED_DECISION_INSTRUCTIONS
+    system_prompt = with_current_date(system_prompt)
+
     truncated_evidence = truncate_evidence_for_token_limit(
         evidence_items=evidence_snippets,
         claim_text=claim.claim_text,
@@ -89,26 +136,42 @@ async def evaluate_evidence_node(state: ClaimVerifierState) -> dict:
         ),
     ]
 
-    from utils.settings import settings
-    if settings.llm_provider == "openai":
-        model_name = "gpt-4o-mini"
-    elif settings.llm_provider == "gemini":
-        model_name = "gemini-2.5-flash"
-    elif settings.llm_provider == "deepseek":
-        model_name = "deepseek-chat"
-    else:
-        model_name = "gpt-4o-mini"  # Default fallback
-    
-    llm = get_llm(model_name=model_name, provider=settings.llm_provider)
-
-    response = await call_llm_with_structured_output(
-        llm=llm,
-        output_class=EvidenceEvaluationOutput,
-        messages=messages,
-        context_desc=f"evidence evaluation for claim '{claim.claim_text}'",
+    provider, configured_model = get_llm_selection(config)
+    model_name = configured_model or EVALUATION_MODELS.get(provider, "gpt-4o-mini")
+
+    llm = get_llm(model_name=model_name, provider=provider)
+
+    response = await run_within(
+        call_llm_with_structured_output(
+            llm=llm,
+            output_class=MergedEvaluationOutput if can_search_again else EvidenceEvaluationOutput,
+            messages=messages,
+            context_desc=f"evidence evaluation for claim '{claim.claim_text}'",
+        ),
+        time_remaining(config),
+        None,
+        "evidence evaluation",
     )
 
-    if not response:
+    if can_search_again and response and response.needs_more_evidence:
+        logger.info(
+            f"Evaluation requested more evidence, "
+            f"iteration: {iteration_count + 1}/{ITERATIVE_SEARCH_CONFIG['max_iterations']}"
+        )
+        return Command(
+            goto="generate_search_query",
+            update={
+                "iteration_count": iteration_count + 1,
+                "intermediate_assessment": IntermediateAssessment(
+                    needs_more_evidence=True, missing_aspects=response.missing_aspects
+                ),
+            },
+        )
+
+    if not response and deadline_reached(config):
+        logger.warning(f"Deadline reached evaluating claim: '{claim.claim_text}'")
+        verdict = timed_out_verdict(claim, evidence_snippets)
+    elif not response:
         logger.warning(f"Failed to evaluate evidence for claim: '{claim.claim_text}'")
         verdict = Verdict(
             claim_text=claim.claim_text,
@@ -138,14 +201,12 @@ async def evaluate_evidence_node(state: ClaimVerifierState) -> dict:
             else set()
         )
 
+        # Shallow copies - the snippet text is shared with the evidence store
         sources = [
-            Evidence(
-                url=source.url,
-                text=source.text,
-                title=source.title,
-                is_influential=source.url in influential_urls,
-            )
-            for source in {source.url: source for source in evidence_snippets}.values()
+            source.model_copy(update={"is_influential": True})
+            if source.url in influential_urls
+            else source
+            for source in evidence_snippets
         ]
 
         verdict = Verdict(
@@ -165,5 +226,6 @@ async def evaluate_evidence_node(state: ClaimVerifierState) -> dict:
         f"({len(verdict.sources)} sources, {influential_count} influential)"
     )
 
-    return {"verdict": verdict}
+    await release_run_lease(config)
+    return Command(goto=END, update={"verdict": verdict})
  
\ No newline at end of file
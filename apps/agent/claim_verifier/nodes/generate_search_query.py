@@ -4,21 +4,29 @@ Generates optimized queries to find evidence related to a claim.
 """
 
 import logging
-from typing import Dict
+from typing import Any, Dict, List
 
+from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel, Field
 
+from claim_verifier.config import ITERATIVE_SEARCH_CONFIG, QUERY_GENERATION_CONFIG
 from claim_verifier.prompts import (
     QUERY_GENERATION_HUMAN_PROMPT,
     QUERY_GENERATION_INITIAL_SYSTEM_PROMPT,
+    QUERY_GENERATION_ITERATIVE_CONTEXT,
     QUERY_GENERATION_ITERATIVE_SYSTEM_PROMPT,
-    get_current_timestamp,
+    QUERY_GENERATION_MULTI_SYSTEM_PROMPT,
+    with_current_date,
 )
 from claim_verifier.schemas import ClaimVerifierState
-from utils import get_llm, call_llm_with_structured_output
+from utils import get_llm, call_llm_with_structured_output, run_within, time_remaining
 
 logger = logging.getLogger(__name__)
 
+MAX_SEEN_SOURCES = QUERY_GENERATION_CONFIG["max_seen_sources"]
+INITIAL_QUERIES = QUERY_GENERATION_CONFIG["initial_queries"]
+EVALUATION_RESERVE = ITERATIVE_SEARCH_CONFIG["evaluation_reserve_seconds"]
+
 
 class QueryGenerationOutput(BaseModel):
     """Search query generation response.
@@ -33,10 +41,41 @@ class QueryGenerationOutput(BaseModel):
     )
 
 
+class MultiQueryGenerationOutput(BaseModel):
+    """Several diverse search queries for one claim, searched in parallel."""
+
+    queries: List[str] = Field(
+        description="Distinct search queries that each approach the claim from a different angle: the core assertion with its key entities and figures, evidence that could refute it, and authoritative or primary sources"
+    )
+
+
+def get_initial_query_count(config: RunnableConfig) -> int:
+    """Number of first-round queries, overridable via configurable.initial_queries."""
+    configurable = (config or {}).get("configurable", {})
+    count = int(configurable.get("initial_queries", INITIAL_QUERIES))
+    if count < 1:
+        raise ValueError(f"initial_queries must be at least 1, got {count}")
+    return count
+
+
+def _unique_queries(queries: List[str], limit: int) -> List[str]:
+    """Drop blank and case-insensitive duplicate queries, keeping order."""
+    unique: Dict[str, str] = {}
+    for query in queries:
+        query = query.strip()
+        if query and query.lower() not in unique:
+            unique[query.lower()] = query
+    return list(unique.values())[:limit]
+
+
 async def generate_search_query_node(
-    state: ClaimVerifierState,
-) -> Dict[str, str]:
-    """Generate an effective search query for a claim."""
+    state: ClaimVerifierState, config: RunnableConfig
+) -> Dict[str, Any]:
+    """Generate an effective search query for a claim.
+
+    With initial_queries above 1, the first round asks for that many diverse
+    queries in one call; retrieval then searches them concurrently.
+    """
 
     claim = state.claim
     iteration_count = state.iteration_count
@@ -48,8 +87,7 @@ async def generate_search_query_node(
         f"(Iteration: {iteration_count + 1})"
     )
 
-    from utils.settings import settings
-    llm = get_llm(provider=settings.llm_provider)
+    llm = get_llm(config=config)
 
     # Build context for iterative searching
     context_parts = []
@@ -62,33 +100,75 @@ async def generate_search_query_node(
             f"Missing aspects: {', '.join(intermediate_assessment.missing_aspects)}"
         )
 
+    # Steer away from pages we already have
+    if iteration_count > 0 and state.evidence:
+        seen_sources = list(state.evidence)[-MAX_SEEN_SOURCES:]
+        context_parts.append(f"Already retrieved sources: {', '.join(seen_sources)}")
+
     context = " | ".join(context_parts) if context_parts else ""
 
-    current_time = get_current_timestamp()
+    human_prompt = QUERY_GENERATION_HUMAN_PROMPT.format(claim_text=claim.claim_text)
+
+    # Leave time for the final evaluation; the claim text is the fallback query
+    timeout = time_remaining(config, reserve=EVALUATION_RESERVE)
 
-    system_prompt = (
-        QUERY_GENERATION_INITIAL_SYSTEM_PROMPT.format(current_time=current_time)
-        if iteration_count == 0
-        else QUERY_GENERATION_ITERATIVE_SYSTEM_PROMPT.format(
-            iteration_count=iteration_count + 1,
-            context=context,
-            current_time=current_time,
+    query_count = get_initial_query_count(config) if iteration_count == 0 else 1
+    if query_count > 1:
+        system_prompt = with_current_date(
+            QUERY_GENERATION_MULTI_SYSTEM_PROMPT.format(query_count=query_count)
+        )
+        response = await run_within(
+            call_llm_with_structured_output(
+                llm=llm,
+                output_class=MultiQueryGenerationOutput,
+                messages=[("system", system_prompt), ("human", human_prompt)],
+                context_desc=f"multi-query generation for claim '{claim.claim_text}'",
+            ),
+            timeout,
+            None,
+            "multi-query generation",
+        )
+
+        queries = _unique_queries(response.queries, query_count) if response else []
+        if not queries:
+            logger.warning(f"Failed to generate queries for claim: '{claim.claim_text}'")
+            return {"query": claim.claim_text, "queries": [claim.claim_text]}
+
+        logger.info(f"Generated {len(queries)} search queries: {queries}")
+
+        return {"query": queries[0], "queries": queries, "all_queries": all_queries + queries}
+
+    # Static instructions first so providers can reuse the cached prefix
+    if iteration_count == 0:
+        system_prompt = with_current_date(QUERY_GENERATION_INITIAL_SYSTEM_PROMPT)
+    else:
+        system_prompt = with_current_date(
+            QUERY_GENERATION_ITERATIVE_SYSTEM_PROMPT
+        ) + QUERY_GENERATION_ITERATIVE_CONTEXT.format(
+            iteration_count=iteration_count + 1, context=context
         )
-    )
-    human_prompt = QUERY_GENERATION_HUMAN_PROMPT.format(claim_text=claim.claim_text)
     messages = [("system", system_prompt), ("human", human_prompt)]
 
-    response = await call_llm_with_structured_output(
-        llm=llm,
-        output_class=QueryGenerationOutput,
-        messages=messages,
-        context_desc=f"query generation for claim '{claim.claim_text}'",
+    response = await run_within(
+        call_llm_with_structured_output(
+            llm=llm,
+            output_class=QueryGenerationOutput,
+            messages=messages,
+            context_desc=f"query generation for claim '{claim.claim_text}'",
+        ),
+        timeout,
+        None,
+        "query generation",
     )
 
     if not response or not response.query:
         logger.warning(f"Failed to generate query for claim: '{claim.claim_text}'")
-        return {"query": claim.claim_text}
+        return {"query": claim.claim_text, "queries": [claim.claim_text]}
 
     logger.info(f"Generated search query: {response.query}")
 
-    return {"query": response.query, "all_queries": all_queries + [response.query]}
+    return {
+        "query": response.query,
+        "queries": [response.query],
+        "all_queries": all_queries + [response.query],
+    }
@@ -1,38 +1,74 @@
 """Retrieve evidence node - fetches evidence for claims using the Search Abstraction Layer."""
 
+import asyncio
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional, Union
 
-from search import search
-from claim_verifier.config import EVIDENCE_RETRIEVAL_CONFIG
+from langchain_core.runnables import RunnableConfig
+from search import canonicalize_url, content_fingerprint, search
+from utils import run_within, time_remaining
+from claim_verifier.config import EVIDENCE_RETRIEVAL_CONFIG, ITERATIVE_SEARCH_CONFIG
 from claim_verifier.schemas import ClaimVerifierState, Evidence
 
 logger = logging.getLogger(__name__)
 
 # Retrieval settings
 RESULTS_PER_QUERY = EVIDENCE_RETRIEVAL_CONFIG["results_per_query"]
+OVERFETCH_RESULTS = EVIDENCE_RETRIEVAL_CONFIG["overfetch_results"]
+EVALUATION_RESERVE = ITERATIVE_SEARCH_CONFIG["evaluation_reserve_seconds"]
 
 
 async def retrieve_evidence_node(
-    state: ClaimVerifierState,
-) -> Dict[str, List[Evidence]]:
-    """Retrieve evidence for a claim using the search abstraction layer."""
-    if not state.query:
+    state: ClaimVerifierState, config: Optional[RunnableConfig] = None
+) -> Dict[str, Union[Dict[str, Evidence], List[str]]]:
+    """Retrieve evidence for a claim using the search abstraction layer.
+
+    All queries of the round run concurrently, bounded by the run's deadline.
+    Results are deduplicated against the run's evidence store by canonical
+    URL and content fingerprint; when duplicates are likely, extra results
+    are requested so they can be replaced by new sources, keeping up to
+    results_per_query new results per query. The Evidence objects go into
+    state as-is instead of being dumped to dicts and re-validated.
+    """
+    queries = state.queries or ([state.query] if state.query else [])
+    if not queries:
         logger.warning("No search query to process")
-        return {"evidence": []}
-
-    # Use simple search function
-    search_results = await search(state.query, max_results=RESULTS_PER_QUERY)
-    
-    # Convert SearchResult objects to Evidence format
-    evidence = [
-        Evidence(
-            url=result.url,
-            text=result.content,
-            title=result.title
+        return {"evidence": {}, "evidence_fingerprints": []}
+
+    # Overfetch when duplicates are likely: known evidence or overlapping queries
+    may_duplicate = bool(state.evidence) or len(queries) > 1
+    max_results = RESULTS_PER_QUERY + (OVERFETCH_RESULTS if may_duplicate else 0)
+    timeout = time_remaining(config, reserve=EVALUATION_RESERVE)
+    results_per_query = await asyncio.gather(
+        *(
+            run_within(search(query, max_results=max_results), timeout, [], f"search '{query}'")
+            for query in queries
         )
-        for result in search_results
-    ]
-    
-    logger.info(f"Retrieved {len(evidence)} total evidence snippets")
-    return {"evidence": [item.model_dump() for item in evidence]}
\ No newline at end of file
+    )
+
+    # Convert new SearchResult objects to Evidence format
+    evidence: Dict[str, Evidence] = {}
+    fingerprints = []
+    seen_fingerprints = set(state.evidence_fingerprints)
+
+    for search_results in results_per_query:
+        added = 0
+        for result in search_results:
+            if added == RESULTS_PER_QUERY:
+                break
+
+            key = canonicalize_url(result.url)
+            fingerprint = content_fingerprint(result.content)
+            if key in state.evidence or key in evidence or fingerprint in seen_fingerprints:
+                continue
+
+            evidence[key] = Evidence(url=result.url, text=result.content, title=result.title)
+            fingerprints.append(fingerprint)
+            seen_fingerprints.add(fingerprint)
+            added += 1
+
+    logger.info(
+        f"Retrieved {sum(map(len, results_per_query))} evidence snippets "
+        f"for {len(queries)} queries, {len(evidence)} new"
+    )
+    return {"evidence": evidence, "evidence_fingerprints": fingerprints}
\ No newline at end of file
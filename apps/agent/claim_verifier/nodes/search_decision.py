@@ -1,25 +1,56 @@
 """Search decision node - determines whether to continue searching or make final evaluation.
 
-Assesses evidence sufficiency and confidence to decide next steps.
+Assesses evidence sufficiency and confidence to decide next steps. Depending
+on the decision mode, cheap heuristics over the deduplicated evidence can
+settle the decision without an LLM call.
 """
 
 import logging
-from typing import Literal
+import re
+from typing import Literal, Optional, Sequence, Set
+from urllib.parse import urlsplit
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph.state import Command
 from pydantic import BaseModel, Field
-from utils import call_llm_with_structured_output, get_llm
+from utils import (
+    call_llm_with_structured_output,
+    deadline_reached,
+    get_llm,
+    run_within,
+    time_remaining,
+)
 
-from claim_verifier.config import ITERATIVE_SEARCH_CONFIG
+from claim_verifier.config import (
+    AUTHORITATIVE_DOMAINS,
+    AUTHORITATIVE_SUFFIXES,
+    ITERATIVE_SEARCH_CONFIG,
+    SEARCH_DECISION_CONFIG,
+)
 from claim_verifier.prompts import (
     SEARCH_DECISION_HUMAN_PROMPT,
     SEARCH_DECISION_SYSTEM_PROMPT,
-    get_current_timestamp,
+    with_current_date,
 )
-from claim_verifier.schemas import ClaimVerifierState, IntermediateAssessment
+from claim_verifier.schemas import ClaimVerifierState, Evidence, IntermediateAssessment
 
 logger = logging.getLogger(__name__)
 
+DECISION_MODES = ("llm", "heuristic", "merged")
+
+MIN_EVIDENCE = SEARCH_DECISION_CONFIG["min_evidence"]
+SUFFICIENT_RELEVANT = SEARCH_DECISION_CONFIG["sufficient_relevant"]
+MIN_AUTHORITATIVE = SEARCH_DECISION_CONFIG["min_authoritative"]
+RELEVANCE_OVERLAP = SEARCH_DECISION_CONFIG["relevance_overlap"]
+EVALUATION_RESERVE = ITERATIVE_SEARCH_CONFIG["evaluation_reserve_seconds"]
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:[.,][0-9]+)*")
+_STOPWORDS = frozenset(
+    "the a an and or of in on at to for by with from as is are was were be been has have had "
+    "its it this that these those which who whom than then also into over under about after "
+    "before during their there they he she his her not but".split()
+)
+
 
 class SearchDecisionOutput(BaseModel):
     """Evidence sufficiency assessment for claim verification.
@@ -39,27 +70,149 @@ class SearchDecisionOutput(BaseModel):
     )
 
 
+def get_search_decision_mode(config: Optional[RunnableConfig]) -> str:
+    """Decision mode for this run: configurable.search_decision_mode or the config default."""
+    configurable = (config or {}).get("configurable") or {}
+    mode = configurable.get("search_decision_mode") or SEARCH_DECISION_CONFIG["mode"]
+    if mode not in DECISION_MODES:
+        raise ValueError(
+            f"Unknown search decision mode: {mode}. Supported modes: {list(DECISION_MODES)}"
+        )
+    return mode
+
+
+def _keywords(text: str) -> Set[str]:
+    return {
+        token
+        for token in _TOKEN.findall(text.lower())
+        if token not in _STOPWORDS and (len(token) > 2 or token[0].isdigit())
+    }
+
+
+def _is_authoritative(url: str) -> bool:
+    host = (urlsplit(url).hostname or "").lower()
+    return host.endswith(AUTHORITATIVE_SUFFIXES) or any(
+        host == domain or host.endswith(f".{domain}") for domain in AUTHORITATIVE_DOMAINS
+    )
+
+
+def _heuristic_decision(
+    claim_text: str, evidence: Sequence[Evidence]
+) -> Optional[IntermediateAssessment]:
+    """Decide from cheap signals whether more evidence is needed.
+
+    A snippet is relevant when it mentions most of the claim's keywords.
+    Enough relevant snippets stop the search if some come from authoritative
+    sources or they all agree on the claim's figures; having no relevant
+    snippet at all (or too few snippets) searches again.
+
+    Returns:
+        An assessment when the signals are decisive, None to defer to the LLM
+    """
+    if len(evidence) < MIN_EVIDENCE:
+        return IntermediateAssessment(needs_more_evidence=True)
+
+    claim_keywords = _keywords(claim_text)
+    if not claim_keywords:
+        return None
+    claim_figures = {token for token in claim_keywords if token[0].isdigit()}
+
+    covered: Set[str] = set()
+    relevant = authoritative = agreeing = 0
+    for item in evidence:
+        shared = claim_keywords & _keywords(f"{item.title or ''} {item.text}")
+        covered |= shared
+        if len(shared) / len(claim_keywords) >= RELEVANCE_OVERLAP:
+            relevant += 1
+            authoritative += _is_authoritative(item.url)
+            agreeing += claim_figures <= shared
+
+    if not relevant:
+        missing = sorted(claim_keywords - covered)
+        return IntermediateAssessment(
+            needs_more_evidence=True,
+            missing_aspects=[f"sources mentioning {', '.join(missing)}"] if missing else [],
+        )
+
+    figures_agree = bool(claim_figures) and agreeing == relevant
+    if relevant >= SUFFICIENT_RELEVANT and (authoritative >= MIN_AUTHORITATIVE or figures_agree):
+        return IntermediateAssessment(needs_more_evidence=False)
+
+    return None
+
+
+def _route(
+    assessment: IntermediateAssessment,
+    iteration_count: int,
+    decided_by: str,
+    evidence_count: int,
+) -> Command[Literal["generate_search_query", "evaluate_evidence"]]:
+    """Turn a sufficiency assessment into the next step."""
+    max_iterations = ITERATIVE_SEARCH_CONFIG["max_iterations"]
+
+    if assessment.needs_more_evidence and iteration_count < max_iterations:
+        logger.info(
+            f"Continuing search - more evidence needed ({decided_by}), "
+            f"iteration: {iteration_count + 1}/{max_iterations}, "
+            f"current evidence: {evidence_count} pieces"
+        )
+        return Command(
+            goto="generate_search_query",
+            update={
+                "iteration_count": iteration_count + 1,
+                "intermediate_assessment": assessment,
+                "search_decisions": [decided_by],
+            },
+        )
+
+    logger.info(
+        f"Proceeding to final evaluation - evidence sufficient ({decided_by}), "
+        f"total evidence: {evidence_count} pieces"
+    )
+    return Command(
+        goto="evaluate_evidence",
+        update={"intermediate_assessment": assessment, "search_decisions": [decided_by]},
+    )
+
+
 async def search_decision_node(
-    state: ClaimVerifierState,
+    state: ClaimVerifierState, config: RunnableConfig
 ) -> Command[Literal["generate_search_query", "evaluate_evidence"]]:
     """Decide whether to continue searching or proceed to final evaluation."""
 
     claim = state.claim
-    evidence = state.evidence
+    evidence = list(state.evidence.values())
     iteration_count = state.iteration_count
 
     max_iterations = ITERATIVE_SEARCH_CONFIG["max_iterations"]
+    mode = get_search_decision_mode(config)
 
     # Check stopping conditions
     if iteration_count >= max_iterations:
         logger.info(
             f"Reached maximum iterations ({max_iterations}), proceeding to final evaluation"
         )
-        return Command(goto="evaluate_evidence")
+        return Command(goto="evaluate_evidence", update={"search_decisions": ["limit"]})
+
+    # Evaluate whatever evidence we have once only the evaluation budget is left
+    if deadline_reached(config, reserve=EVALUATION_RESERVE):
+        logger.info(
+            f"Deadline approaching, proceeding to final evaluation with "
+            f"{len(evidence)} pieces of evidence"
+        )
+        return Command(goto="evaluate_evidence", update={"search_decisions": ["deadline"]})
+
+    if mode != "llm":
+        assessment = _heuristic_decision(claim.claim_text, evidence)
+        if assessment is not None:
+            return _route(assessment, iteration_count, "heuristic", len(evidence))
+
+        if mode == "merged":
+            # The evaluation call decides whether to search again
+            return Command(goto="evaluate_evidence", update={"search_decisions": ["merged"]})
 
-    # Assess evidence sufficiency with LLM using configured provider
-    from utils.settings import settings
-    llm = get_llm(provider=settings.llm_provider)
+    # Assess evidence sufficiency with LLM using the run's provider
+    llm = get_llm(config=config)
 
     evidence_summary = "\n".join(
         [
@@ -68,9 +221,7 @@ async def search_decision_node(
         ]
     )
 
-    current_time = get_current_timestamp()
-
-    system_prompt = SEARCH_DECISION_SYSTEM_PROMPT.format(current_time=current_time)
+    system_prompt = with_current_date(SEARCH_DECISION_SYSTEM_PROMPT)
     human_prompt = SEARCH_DECISION_HUMAN_PROMPT.format(
         claim_text=claim.claim_text,
         evidence_count=len(evidence),
@@ -82,45 +233,27 @@ async def search_decision_node(
         ("human", human_prompt),
     ]
 
-    response = await call_llm_with_structured_output(
-        llm=llm,
-        output_class=SearchDecisionOutput,
-        messages=messages,
-        context_desc=f"search decision for claim '{claim.claim_text}'",
+    response = await run_within(
+        call_llm_with_structured_output(
+            llm=llm,
+            output_class=SearchDecisionOutput,
+            messages=messages,
+            context_desc=f"search decision for claim '{claim.claim_text}'",
+        ),
+        time_remaining(config, reserve=EVALUATION_RESERVE),
+        None,
+        "search decision",
     )
 
     if not response:
         logger.warning(
             "Failed to assess evidence sufficiency, proceeding to final evaluation"
         )
-        return Command(goto="evaluate_evidence")
+        return Command(goto="evaluate_evidence", update={"search_decisions": ["llm"]})
 
     assessment = IntermediateAssessment(
         needs_more_evidence=response.needs_more_evidence,
         missing_aspects=response.missing_aspects,
     )
 
-    # Decision logic based on LLM assessment
-    should_continue = response.needs_more_evidence and iteration_count < max_iterations
-
-    if should_continue:
-        logger.info(
-            f"Continuing search - more evidence needed, "
-            f"iteration: {iteration_count + 1}/{max_iterations}, "
-            f"current evidence: {len(evidence)} pieces"
-        )
-        return Command(
-            goto="generate_search_query",
-            update={
-                "iteration_count": iteration_count + 1,
-                "intermediate_assessment": assessment,
-            },
-        )
-    else:
-        logger.info(
-            f"Proceeding to final evaluation - evidence sufficient, "
-            f"total evidence: {len(evidence)} pieces"
-        )
-        return Command(
-            goto="evaluate_evidence", update={"intermediate_assessment": assessment}
-        )
+    return _route(assessment, iteration_count, "llm", len(evidence))
@@ -1,22 +1,32 @@
 """Prompts for the claim verification pipeline.
 
 Contains all system and human prompts for each LLM interaction, organized by workflow stage.
+
+System prompts are static so providers can serve them from their prompt
+cache; per-call values (the date, iteration context) are appended after
+them with the helpers below.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
+
+
+def get_current_date() -> str:
+    """Current UTC date for temporal context in prompts.
 
+    Day granularity keeps the prompt identical across calls made the same day.
+    """
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-def get_current_timestamp() -> str:
-    """Get current timestamp for temporal context in prompts."""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
+
+def with_current_date(system_prompt: str) -> str:
+    """Append the current date after a static system prompt."""
+    return f"{system_prompt}\n\nCurrent date: {get_current_date()}"
 
 
 ### QUERY GENERATION PROMPTS ###
 
 QUERY_GENERATION_INITIAL_SYSTEM_PROMPT = """You are an expert search query generator for fact-checking claims.
 
-Current time: {current_time}
-
 Your task: Create a single, effective search query to find evidence that could verify or refute the given claim.
 
 Requirements:
@@ -35,11 +45,30 @@ Examples:
 
 Return only the search query - no additional text."""
 
+QUERY_GENERATION_MULTI_SYSTEM_PROMPT = """You are an expert search query generator for fact-checking claims.
+
+Your task: Create {query_count} diverse search queries that will be searched in parallel to find evidence that could verify or refute the given claim.
+
+Requirements:
+- Each query covers a different angle, for example:
+  - The core assertion with its key entities, names, dates and figures
+  - Evidence that would contradict or debunk the claim
+  - Authoritative or primary sources (official statistics, government, academic, fact-checking sites)
+- Use search-engine-friendly language (no special characters)
+- Keep each query concise (5-15 words optimal)
+- Do not repeat the same terms across queries more than needed
+- For time-sensitive claims, include relevant temporal constraints
+
+Example for "The unemployment rate in March 2024 was 3.8%":
+- "US unemployment rate March 2024 3.8 percent"
+- "March 2024 jobs report unemployment rate revised"
+- "Bureau of Labor Statistics employment situation March 2024"
+
+Return only the list of search queries - no additional text."""
+
 QUERY_GENERATION_ITERATIVE_SYSTEM_PROMPT = """You are an expert search query generator for fact-checking claims.
 
-Current time: {current_time}
-This is iteration {iteration_count} of an iterative search process.
-Previous context: {context}
+This is a later iteration of an iterative search process; the iteration number and the context from previous searches follow these instructions.
 
 Your task: Generate a NEW search query that explores different angles not covered by previous searches.
 
@@ -48,9 +77,10 @@ Requirements:
 - Use alternative terms and sources from previous queries  
 - Target specific gaps in evidence coverage
 - Avoid repeating similar search terms
+- Find sources other than those already retrieved
 - Consider temporal factors if claim is time-sensitive
 
-Strategy for iteration {iteration_count}:
+Strategy by iteration:
 - If iteration 2: Try alternative phrasing or different scope
 - If iteration 3+: Focus on contradictory evidence or expert analysis
 - Consider different source types (academic, international, technical)
@@ -61,6 +91,12 @@ New: "student debt relief program criticism opposition 2023"
 
 Return only the new search query - no additional text."""
 
+# Appended after the dated iterative system prompt
+QUERY_GENERATION_ITERATIVE_CONTEXT = """
+
+Iteration: {iteration_count}
+Previous context: {context}"""
+
 QUERY_GENERATION_HUMAN_PROMPT = """Claim: {claim_text}
 
 Generate a search query to find evidence for fact-checking this claim."""
@@ -101,8 +137,6 @@ Generate a single, thoughtful query that has a high chance of providing evidence
 
 SEARCH_DECISION_SYSTEM_PROMPT = """You are an expert fact-checker evaluating evidence sufficiency.
 
-Current time: {current_time}
-
 Your task: Determine if the current evidence is sufficient for a confident fact-checking verdict, or if more evidence is needed.
 
 Evidence is SUFFICIENT when:
@@ -143,8 +177,6 @@ Think step by step through the sufficiency criteria before deciding."""
 
 EVIDENCE_EVALUATION_SYSTEM_PROMPT = """You are an expert fact-checker. Evaluate claims based ONLY on the evidence provided - do not use prior knowledge.
 
-Current time: {current_time}
-
 Your task: Assess the factual accuracy of the claim based solely on the provided evidence.
 
 Verdict criteria:
@@ -174,6 +206,13 @@ Source reporting: Always identify which evidence sources were relevant to your d
 
 Think step by step through the evidence before reaching your verdict."""
 
+# Appended to the evaluation system prompt in "merged" search decision mode
+MERGED_DECISION_INSTRUCTIONS = """
+
+Evidence sufficiency: You may also request another search round instead of a verdict.
+Set needs_more_evidence to true only if the evidence is too limited or unclear for any confident verdict AND further searching is likely to help; list what is missing in missing_aspects.
+Otherwise set needs_more_evidence to false and give your verdict as usual."""
+
 EVIDENCE_EVALUATION_HUMAN_PROMPT = """Claim: {claim_text}
 
 Evidence:
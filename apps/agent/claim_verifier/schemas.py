@@ -4,10 +4,10 @@ All the structured types used throughout the verification workflow.
 """
 
 from enum import Enum
-from typing import Annotated, List, Optional
+from operator import add
+from typing import Annotated, Dict, List, Optional, Sequence
 from pydantic import BaseModel, Field
 from claim_extractor.schemas import ValidatedClaim
-from operator import add
 
 
 class VerificationResult(str, Enum):
@@ -51,6 +51,37 @@ class Verdict(BaseModel):
     sources: List[Evidence] = Field(
         default_factory=list, description="List of evidence sources"
     )
+    timed_out: bool = Field(
+        default=False, description="Whether verification stopped at the run's deadline"
+    )
+
+
+def merge_evidence(
+    left: Dict[str, Evidence], right: Dict[str, Evidence]
+) -> Dict[str, Evidence]:
+    """Reducer for the per-run evidence store: add new URLs, keep the first copy seen."""
+    if not right:
+        return left
+    merged = dict(left)
+    for url, item in right.items():
+        merged.setdefault(url, item)
+    return merged
+
+
+def timed_out_verdict(
+    claim: ValidatedClaim, sources: Sequence[Evidence] = ()
+) -> Verdict:
+    """Verdict for a claim whose verification ran out of time."""
+    return Verdict(
+        claim_text=claim.claim_text,
+        disambiguated_sentence=claim.disambiguated_sentence,
+        original_sentence=claim.original_sentence,
+        original_index=claim.original_index,
+        result=VerificationResult.INSUFFICIENT_INFORMATION,
+        reasoning="Verification timed out before the evidence could be evaluated.",
+        sources=list(sources),
+        timed_out=True,
+    )
 
 
 class IntermediateAssessment(BaseModel):
@@ -67,10 +98,21 @@ class ClaimVerifierState(BaseModel):
 
     claim: ValidatedClaim = Field(description="The claim being verified")
     query: Optional[str] = Field(default=None, description="Current search query")
+    queries: List[str] = Field(
+        default_factory=list,
+        description="All queries of the current retrieval round, searched concurrently",
+    )
     all_queries: List[str] = Field(
         default_factory=list, description="All queries used across iterations"
     )
-    evidence: Annotated[List[Evidence], add] = Field(default_factory=list)
+    evidence: Annotated[Dict[str, Evidence], merge_evidence] = Field(
+        default_factory=dict,
+        description="Per-run evidence store keyed by canonical URL, in retrieval order",
+    )
+    evidence_fingerprints: Annotated[List[str], add] = Field(
+        default_factory=list,
+        description="Content fingerprints of stored evidence, to drop mirrored pages",
+    )
     verdict: Optional[Verdict] = Field(
         default=None, description="Final verification result"
     )
@@ -78,3 +120,7 @@ class ClaimVerifierState(BaseModel):
     intermediate_assessment: Optional[IntermediateAssessment] = Field(
         default=None, description="Assessment of evidence sufficiency"
     )
+    search_decisions: Annotated[List[str], add] = Field(
+        default_factory=list,
+        description="How each continue/stop decision was made: llm, heuristic, merged or limit",
+    )
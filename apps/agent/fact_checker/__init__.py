@@ -3,7 +3,7 @@
 Integrates claim extraction and verification into a complete workflow.
 """
 
-from fact_checker.agent import create_graph, graph
+from fact_checker.agent import create_graph
 from fact_checker.schemas import FactCheckReport, State
 
 __all__ = [
@@ -14,3 +14,12 @@ __all__ = [
     "State",
     "FactCheckReport",
 ]
+
+
+def __getattr__(name: str):
+    # Resolve the compiled graph lazily (see fact_checker.agent)
+    if name == "graph":
+        from fact_checker import agent
+
+        return agent.graph
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
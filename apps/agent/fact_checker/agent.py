@@ -1,14 +1,17 @@
 import logging
+from typing import Optional
 
 from dotenv import load_dotenv
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from utils import LLMConfigurable
 
 from fact_checker.nodes import (
     claim_verifier_node,
     dispatch_claims_for_verification,
     extract_claims,
     generate_report_node,
+    select_claims,
 )
 from fact_checker.schemas import State
 
@@ -25,13 +28,15 @@ def create_graph() -> CompiledStateGraph:
 
     The pipeline follows these steps:
     1. Extract claims from input text
-    2. Distribute claims for parallel verification
-    3. Generate final report
+    2. Select the check-worthy claims
+    3. Distribute claims for parallel verification
+    4. Generate final report
     """
-    workflow = StateGraph(State)
+    workflow = StateGraph(State, config_schema=LLMConfigurable)
 
     # Add nodes
     workflow.add_node("extract_claims", extract_claims)
+    workflow.add_node("select_claims", select_claims)
     workflow.add_node("claim_verifier", claim_verifier_node)
     workflow.add_node("generate_report_node", generate_report_node)
 
@@ -39,8 +44,11 @@ def create_graph() -> CompiledStateGraph:
     workflow.set_entry_point("extract_claims")
 
     # Connect the nodes in sequence
+    workflow.add_edge("extract_claims", "select_claims")
     workflow.add_conditional_edges(
-        "extract_claims", dispatch_claims_for_verification, ["claim_verifier", END]
+        "select_claims",
+        dispatch_claims_for_verification,
+        ["claim_verifier", "generate_report_node", END],
     )
     workflow.add_edge("claim_verifier", "generate_report_node")
 
@@ -50,4 +58,14 @@ def create_graph() -> CompiledStateGraph:
     return workflow.compile()
 
 
-graph = create_graph()
+_graph: Optional[CompiledStateGraph] = None
+
+
+def __getattr__(name: str):
+    """Compile ``graph`` on first access so importing the module stays cheap."""
+    global _graph
+    if name == "graph":
+        if _graph is None:
+            _graph = create_graph()
+        return _graph
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,116 @@
+"""Check-worthiness scoring and load shedding for extracted claims.
+
+A fast, local scorer: a logistic model over surface features of the claim
+(numbers, dates, named entities, comparative language, hedging). The default
+weights are hand-set; ``scripts/train_check_worthiness.py`` fits them on the
+thesis dataset's ``contains_factual_claim`` labels and writes a JSON file
+that ``CHECK_WORTHINESS_CONFIG["weights_path"]`` can point to.
+"""
+
+import json
+import logging
+import math
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+
+from claim_extractor import ValidatedClaim
+
+from fact_checker.config import CHECK_WORTHINESS_CONFIG
+
+logger = logging.getLogger(__name__)
+
+SHEDDING_MODES = ("off", "top_n", "threshold", "adaptive")
+
+_NUMBER = re.compile(r"\b\d+(?:[.,]\d+)*\b")
+_PERCENT = re.compile(r"%|\bper ?cent\b", re.IGNORECASE)
+_YEAR = re.compile(r"\b(?:1[0-9]{3}|20[0-9]{2})s?\b")
+_DATE_WORD = re.compile(
+    r"\b(?:january|february|march|april|may|june|july|august|september|october|"
+    r"november|december|century|decade|bc|ad)\b",
+    re.IGNORECASE,
+)
+_CAPITALIZED = re.compile(r"\b[A-Z][a-zA-Z]+\b|\b[A-Z]{2,}\b")
+_COMPARATIVE = re.compile(
+    r"\b(?:more|less|fewer|most|least|than|largest|smallest|biggest|highest|lowest|"
+    r"longest|oldest|first|last|only|best|worst|majority|minority|record|double[sd]?|"
+    r"triple[sd]?|increase[sd]?|decrease[sd]?|rose|fell|grew|ranked|leading)\b",
+    re.IGNORECASE,
+)
+_HEDGE = re.compile(
+    r"\b(?:may|might|could|perhaps|possibly|arguably|believe[sd]?|think|feel|"
+    r"opinion|should|recommend(?:ed|s)?|important|beautiful|popular|considered)\b",
+    re.IGNORECASE,
+)
+
+FEATURES = ("numbers", "percent", "dates", "entities", "comparative", "hedging", "length")
+
+
+def claim_features(text: str) -> Dict[str, float]:
+    """Surface features of a claim, each scaled to roughly [0, 1]."""
+    words = text.split()
+    # Capitalized words after the first one are a cheap proxy for named entities
+    entities = len(_CAPITALIZED.findall(" ".join(words[1:])))
+    return {
+        "numbers": min(len(_NUMBER.findall(text)), 3) / 3,
+        "percent": float(bool(_PERCENT.search(text))),
+        "dates": float(bool(_YEAR.search(text) or _DATE_WORD.search(text))),
+        "entities": min(entities, 3) / 3,
+        "comparative": float(bool(_COMPARATIVE.search(text))),
+        "hedging": float(bool(_HEDGE.search(text))),
+        "length": min(len(words), 30) / 30,
+    }
+
+
+@lru_cache(maxsize=4)
+def _load_weights(path: Optional[str]) -> Tuple[float, Dict[str, float]]:
+    if path:
+        try:
+            with open(path, encoding="utf-8") as f:
+                trained = json.load(f)
+            weights = {name: float(trained["weights"][name]) for name in FEATURES}
+            return float(trained["bias"]), weights
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Could not load check-worthiness weights from {path}: {e}")
+    return CHECK_WORTHINESS_CONFIG["bias"], CHECK_WORTHINESS_CONFIG["weights"]
+
+
+def score_claim(claim: ValidatedClaim) -> float:
+    """Probability-like check-worthiness score in [0, 1]."""
+    bias, weights = _load_weights(CHECK_WORTHINESS_CONFIG["weights_path"])
+    features = claim_features(claim.claim_text)
+    logit = bias + sum(weights[name] * value for name, value in features.items())
+    return 1 / (1 + math.exp(-logit))
+
+
+def get_shedding_mode(config: Optional[RunnableConfig]) -> str:
+    """Load-shedding mode: configurable.check_worthiness_mode or the config default."""
+    configurable = (config or {}).get("configurable") or {}
+    mode = configurable.get("check_worthiness_mode") or CHECK_WORTHINESS_CONFIG["mode"]
+    if mode not in SHEDDING_MODES:
+        raise ValueError(
+            f"Unknown check-worthiness mode: {mode}. Supported: {list(SHEDDING_MODES)}"
+        )
+    return mode
+
+
+def select_checkworthy(scores: Sequence[float], mode: str) -> List[int]:
+    """Indices of the claims to verify, in their original order.
+
+    "top_n" keeps the best-scoring top_n claims, "threshold" those scoring at
+    least min_score, and "adaptive" verifies everything unless there are
+    more than top_n claims, in which case it applies both.
+    """
+    top_n = CHECK_WORTHINESS_CONFIG["top_n"]
+    min_score = CHECK_WORTHINESS_CONFIG["min_score"]
+    indices = list(range(len(scores)))
+
+    if mode == "off" or (mode == "adaptive" and len(scores) <= top_n):
+        return indices
+    if mode in ("threshold", "adaptive"):
+        indices = [index for index in indices if scores[index] >= min_score]
+    if mode in ("top_n", "adaptive"):
+        indices = sorted(sorted(indices, key=lambda index: -scores[index])[:top_n])
+    return indices
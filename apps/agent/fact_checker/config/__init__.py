@@ -0,0 +1,21 @@
+"""Configuration for the fact checker.
+
+Central storage for all configuration settings.
+"""
+
+from fact_checker.config.nodes import (
+    CHECK_WORTHINESS_CONFIG,
+    DEADLINE_CONFIG,
+    DISPATCH_CONFIG,
+    REPORT_STREAMING_CONFIG,
+    VERDICT_CACHE_CONFIG,
+)
+
+__all__ = [
+    # Node configurations
+    "CHECK_WORTHINESS_CONFIG",
+    "DEADLINE_CONFIG",
+    "DISPATCH_CONFIG",
+    "REPORT_STREAMING_CONFIG",
+    "VERDICT_CACHE_CONFIG",
+]
@@ -0,0 +1,65 @@
+"""Node configuration settings.
+
+Contains settings for the fact checker orchestration nodes.
+"""
+
+DEADLINE_CONFIG = {
+    # Seconds for a whole fact-check, None for no deadline. Override per run
+    # with configurable.time_budget_seconds or an absolute configurable.deadline
+    "time_budget_seconds": None,
+    # Seconds for each claim's verification, capped by the document deadline
+    # (configurable.claim_time_budget_seconds)
+    "claim_time_budget_seconds": None,
+    # Share of the remaining document budget that claim extraction may use
+    "extraction_share": 0.5,
+    # How long past its deadline a verifier branch may take before it is
+    # replaced by a timed-out verdict
+    "grace_seconds": 5,
+}
+
+CHECK_WORTHINESS_CONFIG = {
+    # "off": verify every claim, "top_n": only the top_n best-scoring claims,
+    # "threshold": only claims scoring at least min_score, "adaptive": verify
+    # everything unless there are more than top_n claims, then apply both
+    # (configurable.check_worthiness_mode)
+    "mode": "adaptive",
+    "top_n": 50,
+    "min_score": 0.35,
+    # Logistic scorer over local features (see fact_checker/check_worthiness.py)
+    "bias": -1.0,
+    "weights": {
+        "numbers": 1.5,
+        "percent": 1.0,
+        "dates": 1.2,
+        "entities": 1.5,
+        "comparative": 0.6,
+        "hedging": -1.5,
+        "length": 0.5,
+    },
+    # JSON written by scripts/train_check_worthiness.py, overrides bias/weights
+    "weights_path": None,
+}
+
+DISPATCH_CONFIG = {
+    # Claim verifications running at once in the process; further claims
+    # wait in a priority queue and start as running ones finish
+    "max_parallel_claims": 8,
+    # Order in which waiting claims start (configurable.claim_priority):
+    # "sentence_order" or "check_worthiness"
+    "priority": "sentence_order",
+}
+
+VERDICT_CACHE_CONFIG = {
+    # Reuse verdicts for claims already verified with the same LLM, so a
+    # re-submitted or growing document only verifies new claims
+    # (configurable.memoize=False disables it for a run)
+    "enabled": True,
+    "max_entries": 5000,
+    "ttl_seconds": 900,  # Short: evidence on the web changes
+}
+
+REPORT_STREAMING_CONFIG = {
+    "enabled": True,  # Emit report snapshots as custom stream events
+    "max_active_reports": 1000,  # In-flight fact-checks tracked per process
+    "ttl_seconds": 3600,  # Forget fact-checks that never reach the report
+}
@@ -1,12 +1,14 @@
 """Node components for the fact checker workflow."""
 
 from fact_checker.nodes.extract_claims import extract_claims
+from fact_checker.nodes.select_claims import select_claims
 from fact_checker.nodes.dispatch_claims import dispatch_claims_for_verification
 from fact_checker.nodes.claim_verifier import claim_verifier_node
 from fact_checker.nodes.generate_report import generate_report_node
 
 __all__ = [
     "extract_claims",
+    "select_claims",
     "dispatch_claims_for_verification",
     "claim_verifier_node",
     "generate_report_node",
@@ -4,19 +4,58 @@ Interfaces with the claim verifier subsystem to check factual accuracy.
 """
 
 import logging
-from typing import Dict
+from typing import Dict, Optional
 
-from claim_verifier import Verdict
-from claim_verifier import graph as claim_verifier_graph
+from langchain_core.runnables import RunnableConfig
+from langgraph.types import StreamWriter
+from utils import (
+    TTLCache,
+    collect_llm_errors,
+    deadline_from_budget,
+    earliest_deadline,
+    memo_enabled,
+    memo_key,
+    run_within,
+    time_remaining,
+    with_deadline,
+)
+
+import claim_verifier
+from claim_extractor import ValidatedClaim
+from claim_verifier import Verdict, timed_out_verdict
+
+from fact_checker.config import DEADLINE_CONFIG, VERDICT_CACHE_CONFIG
+from fact_checker.report import record_verdict
+from fact_checker.scheduler import claim_scheduler
 
 logger = logging.getLogger(__name__)
 
+_TIMED_OUT = object()
+
+# Verdicts by claim text and LLM selection, reused by later fact-checks
+_VERDICTS: TTLCache[str, Verdict] = TTLCache(
+    max_size=VERDICT_CACHE_CONFIG["max_entries"], ttl=VERDICT_CACHE_CONFIG["ttl_seconds"]
+)
 
-async def claim_verifier_node(inputs: Dict) -> Dict[str, Verdict]:
+
+async def claim_verifier_node(
+    inputs: Dict, config: RunnableConfig, writer: StreamWriter = None
+) -> Dict[str, Verdict]:
     """Process a single claim through the claim verifier.
 
+    The verification waits for a slot in the claim scheduler, so only a
+    bounded number of verifier subgraphs run at once. The claim's deadline
+    is the earlier of the document deadline and the per-claim budget. The
+    verifier degrades on its own as the deadline nears; a branch still
+    running past it plus a grace period gets a timed-out verdict. Each
+    verdict is also streamed as a report snapshot (custom stream mode).
+    A claim verified recently with the same LLM reuses that verdict.
+
     Args:
-        inputs: Dictionary with the claim to verify
+        inputs: Dictionary with the claim to verify, its index and priority,
+            the document deadline and the report id
+        config: Run config, forwarded so the verifier uses the same LLM selection
+        writer: LangGraph custom stream writer, injected when run in the graph
 
     Returns:
         Dictionary with verdict key
@@ -26,20 +65,76 @@ async def claim_verifier_node(inputs: Dict) -> Dict[str, Verdict]:
         logger.warning("No claim provided to verifier")
         return {}
 
+    key = None
+    if memo_enabled(config, VERDICT_CACHE_CONFIG["enabled"]):
+        key = memo_key("verdict", config, claim.claim_text)
+
+    verdict = _VERDICTS.get(key) if key else None
+    if verdict:
+        logger.info(f"Reusing verdict for '{claim.claim_text}'")
+        verdict = _for_claim(verdict, claim)
+    else:
+        async with claim_scheduler.slot(tuple(inputs.get("priority") or ())):
+            with collect_llm_errors() as errors:
+                verdict = await _verify(claim, inputs.get("deadline"), config)
+        # Verdicts degraded by deadlines or LLM errors are not worth reusing
+        if key and verdict and not verdict.timed_out and not errors:
+            _VERDICTS.set(key, verdict)
+
+    if not verdict:
+        logger.warning(f"No verdict returned for claim: '{claim.claim_text}'")
+        return {}
+
+    logger.info(f"Verdict for '{claim.claim_text}': {verdict.result}")
+
+    snapshot = record_verdict(inputs.get("report_id"), inputs.get("claim_index"), verdict)
+    if snapshot and writer:
+        writer(snapshot)
+
+    return {"verification_results": [verdict]}
+
+
+def _for_claim(verdict: Verdict, claim: ValidatedClaim) -> Verdict:
+    """A reused verdict, pointing at the claim's place in the current document."""
+    return verdict.model_copy(
+        update={
+            "disambiguated_sentence": claim.disambiguated_sentence,
+            "original_sentence": claim.original_sentence,
+            "original_index": claim.original_index,
+        }
+    )
+
+
+async def _verify(
+    claim: ValidatedClaim, deadline: Optional[float], config: RunnableConfig
+) -> Optional[Verdict]:
+    """Run the verifier subgraph for one claim within its deadline."""
     logger.info(f"Verifying claim: '{claim.claim_text}'")
 
+    # The per-claim budget starts once the claim leaves the queue
+    configurable = (config or {}).get("configurable") or {}
+    claim_budget = configurable.get(
+        "claim_time_budget_seconds", DEADLINE_CONFIG["claim_time_budget_seconds"]
+    )
+    verifier_config = with_deadline(
+        config, earliest_deadline(deadline, deadline_from_budget(claim_budget))
+    )
+    remaining = time_remaining(verifier_config)
+    timeout = remaining + DEADLINE_CONFIG["grace_seconds"] if remaining is not None else None
+
     verifier_payload = {"claim": claim}
 
     try:
-        verifier_result = await claim_verifier_graph.ainvoke(verifier_payload)
-        verdict = verifier_result.get("verdict")
-
-        if verdict:
-            logger.info(f"Verdict for '{claim.claim_text}': {verdict.result}")
-            return {"verification_results": [verdict]}
-        else:
-            logger.warning(f"No verdict returned for claim: '{claim.claim_text}'")
-            return {}
+        verifier_result = await run_within(
+            claim_verifier.graph.ainvoke(verifier_payload, verifier_config),
+            timeout,
+            _TIMED_OUT,
+            f"verification of '{claim.claim_text}'",
+        )
     except Exception as e:
         logger.error(f"Error in claim verification: {str(e)}")
-        return {}
+        return None
+
+    if verifier_result is _TIMED_OUT:
+        return timed_out_verdict(claim)
+    return verifier_result.get("verdict")
@@ -1,29 +1,45 @@
 """Dispatch claims node - distributes claims for parallel verification.
 
-Sends each claim to a separate verification process.
+Sends each claim to a separate verification process; the claim scheduler
+bounds how many of them run at once.
 """
 
 import logging
 from typing import List
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END
 from langgraph.graph.state import Send
 
+from fact_checker.config import DISPATCH_CONFIG
+from fact_checker.scheduler import dispatch_order, get_claim_priorities
 from fact_checker.schemas import State
 
 logger = logging.getLogger(__name__)
 
 
-def dispatch_claims_for_verification(state: State) -> List[Send] | str:
+def dispatch_claims_for_verification(
+    state: State, config: RunnableConfig = None
+) -> List[Send] | str:
     """Dispatch extracted claims for parallel verification.
 
+    Claims are sent in priority order and carry their priority, so the
+    claim scheduler starts the most important verifications first. The
+    priority is prefixed with the run's dispatch order, keeping runs first
+    come, first served in the process-wide scheduler.
+
     Args:
         state: Current workflow state
+        config: Run config; configurable.claim_priority overrides the priority policy
 
     Returns:
-        Either a list of Send objects or END
+        A list of Send objects, the report node when every claim was shed, or END
     """
-    claims = state.extracted_claims
+    claims = state.claims_to_verify
+
+    if not claims and state.unchecked_claims:
+        logger.warning("No check-worthy claims to verify, reporting them as not checked")
+        return "generate_report_node"
 
     if not claims:
         logger.warning("No claims to verify, ending process")
@@ -31,5 +47,23 @@ def dispatch_claims_for_verification(state: State) -> List[Send] | str:
 
     logger.info(f"Dispatching {len(claims)} claims for parallel verification")
 
+    configurable = (config or {}).get("configurable") or {}
+    policy = configurable.get("claim_priority") or DISPATCH_CONFIG["priority"]
+    priorities = get_claim_priorities(claims, policy, state.claim_scores)
+    order = sorted(range(len(claims)), key=priorities.__getitem__)
+    run_order = dispatch_order()
+
     # Create Send objects for each claim to be verified in parallel
-    return [Send("claim_verifier", {"claim": claim}) for claim in claims]
+    return [
+        Send(
+            "claim_verifier",
+            {
+                "claim": claims[index],
+                "claim_index": index,
+                "priority": (run_order, *priorities[index]),
+                "deadline": state.deadline,
+                "report_id": state.report_id,
+            },
+        )
+        for index in order
+    ]
@@ -1,34 +1,64 @@
 """Extract claims node for fact checker."""
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from claim_extractor import graph as claim_extractor_graph
+from langchain_core.runnables import RunnableConfig
+from utils import (
+    deadline_from_budget,
+    earliest_deadline,
+    get_deadline,
+    run_within,
+    time_remaining,
+    with_deadline,
+)
 
+import claim_extractor
+
+from fact_checker.config import DEADLINE_CONFIG
 from fact_checker.schemas import State
 
 logger = logging.getLogger(__name__)
 
 
-async def extract_claims(state: State) -> Dict[str, Any]:
+def _document_deadline(config: RunnableConfig) -> Optional[float]:
+    """Deadline of the whole fact-check from the run config or the defaults."""
+    configurable = (config or {}).get("configurable") or {}
+    budget = configurable.get("time_budget_seconds", DEADLINE_CONFIG["time_budget_seconds"])
+    return earliest_deadline(get_deadline(config), deadline_from_budget(budget))
+
+
+async def extract_claims(state: State, config: RunnableConfig) -> Dict[str, Any]:
     """Extract claims from the answer text.
 
     Args:
         state: Current workflow state containing text to extract claims from
+        config: Run config, forwarded so the extractor uses the same LLM selection
 
     Returns:
-        Dictionary with extracted_claims key
+        Dictionary with extracted_claims and deadline keys
     """
     logger.info("Starting claim extraction process")
 
+    # Fix the document deadline once so every later node shares it
+    deadline = _document_deadline(config)
+    extraction_config = with_deadline(config, deadline)
+    remaining = time_remaining(extraction_config)
+    timeout = remaining * DEADLINE_CONFIG["extraction_share"] if remaining is not None else None
+
     extractor_payload = {"answer_text": state.answer}
 
     try:
-        extractor_result = await claim_extractor_graph.ainvoke(extractor_payload)
+        extractor_result = await run_within(
+            claim_extractor.graph.ainvoke(extractor_payload, extraction_config),
+            timeout,
+            {},
+            "claim extraction",
+        )
         validated_claims = extractor_result.get("validated_claims", [])
         logger.info(f"Extracted {len(validated_claims)} validated claims")
-        return {"extracted_claims": validated_claims}
+        return {"extracted_claims": validated_claims, "deadline": deadline}
     except Exception as e:
         logger.error(f"Claim extraction failed: {e}")
         # Return empty list so the pipeline can continue
-        return {"extracted_claims": []}
+        return {"extracted_claims": [], "deadline": deadline}
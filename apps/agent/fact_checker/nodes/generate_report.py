@@ -4,52 +4,45 @@ Compiles verification results into a final report with summary.
 """
 
 import logging
-from datetime import datetime
 from typing import Dict
 
-from claim_verifier.schemas import VerificationResult
+from langchain_core.runnables import RunnableConfig
+from langgraph.types import StreamWriter
+from security import release_run_lease
+
+from fact_checker.report import build_report, finish_report
 from fact_checker.schemas import FactCheckReport, State
 
 logger = logging.getLogger(__name__)
 
 
-async def generate_report_node(state: State) -> Dict[str, FactCheckReport]:
+async def generate_report_node(
+    state: State, config: RunnableConfig = None, writer: StreamWriter = None
+) -> Dict[str, FactCheckReport]:
     """Generate the final fact-checking report.
 
+    The report is rebuilt from the reduced state rather than from the
+    streamed snapshots, and a final snapshot reconciles streaming clients.
+
     Args:
         state: Current workflow state
+        config: Run config, carrying the run lease to release
+        writer: LangGraph custom stream writer, injected when run in the graph
 
     Returns:
         Dictionary with final_report key
     """
     logger.info("Generating final fact-check report")
 
-    # Count claims by verification result
-    result_counts = {
-        VerificationResult.SUPPORTED: 0,
-        VerificationResult.REFUTED: 0,
-    }
-
     for verdict in state.verification_results:
-        if verdict.result in result_counts:
-            logger.info(f"Verdict for '{verdict.claim_text}': {verdict.result}")
-            result_counts[verdict.result] += 1
-
-    # Generate summary text
-    summary = (
-        f"Fact-check complete. Of {len(state.verification_results)} claims verified: "
-        f"{result_counts[VerificationResult.SUPPORTED]} supported, "
-        f"{result_counts[VerificationResult.REFUTED]} refuted"
-    )
-
-    # Create the final report
-    report = FactCheckReport(
-        answer=state.answer,
-        claims_verified=len(state.verification_results),
-        verified_claims=state.verification_results,
-        summary=summary,
-        timestamp=datetime.now(),
-    )
-
-    logger.info(f"Report generated: {summary}")
+        logger.info(f"Verdict for '{verdict.claim_text}': {verdict.result}")
+
+    report = build_report(state.answer, state.verification_results, state.unchecked_claims)
+
+    snapshot = finish_report(state.report_id, report)
+    if writer:
+        writer(snapshot)
+
+    logger.info(f"Report generated: {report.summary}")
+    await release_run_lease(config)
     return {"final_report": report}
@@ -0,0 +1,60 @@
+"""Select claims node - decides which extracted claims get verified.
+
+Scores claims by check-worthiness and sheds the least check-worthy ones
+when there are more than the configured budget allows.
+"""
+
+import logging
+from typing import Any, Dict
+
+from langchain_core.runnables import RunnableConfig
+
+from fact_checker.check_worthiness import get_shedding_mode, score_claim, select_checkworthy
+from fact_checker.config import REPORT_STREAMING_CONFIG
+from fact_checker.report import start_report
+from fact_checker.schemas import State
+from security import release_run_lease
+
+logger = logging.getLogger(__name__)
+
+
+async def select_claims(state: State, config: RunnableConfig) -> Dict[str, Any]:
+    """Pick the claims to verify and start tracking the report.
+
+    Args:
+        state: Current workflow state with the extracted claims
+        config: Run config; configurable.check_worthiness_mode overrides the mode
+
+    Returns:
+        Dictionary with claims_to_verify, claim_scores, unchecked_claims and
+        report_id keys
+    """
+    claims = state.extracted_claims
+    scores = [score_claim(claim) for claim in claims]
+    keep = select_checkworthy(scores, get_shedding_mode(config))
+
+    kept = set(keep)
+    claims_to_verify = [claims[index] for index in keep]
+    unchecked_claims = [claim for index, claim in enumerate(claims) if index not in kept]
+
+    if unchecked_claims:
+        logger.info(
+            f"Verifying {len(claims_to_verify)} of {len(claims)} claims, "
+            f"{len(unchecked_claims)} not checked"
+        )
+
+    if not claims:
+        # Nothing to verify or report: the run ends after this node
+        await release_run_lease(config)
+
+    report_id = (
+        start_report(claims_to_verify)
+        if claims_to_verify and REPORT_STREAMING_CONFIG["enabled"]
+        else None
+    )
+    return {
+        "claims_to_verify": claims_to_verify,
+        "claim_scores": [scores[index] for index in keep],
+        "unchecked_claims": unchecked_claims,
+        "report_id": report_id,
+    }
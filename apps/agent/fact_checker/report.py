@@ -0,0 +1,148 @@
+"""Report building and incremental report snapshots.
+
+The final report and the snapshots streamed while claims are still being
+verified are built by the same functions, so the last snapshot always
+matches the final report.
+
+Progress is tracked in this process's memory only (_PROGRESS); it is not
+shared between workers or replicas. Snapshots work because a run executes
+all its nodes in one worker process. If a run is resumed elsewhere (e.g.
+after a restart), verdicts recorded there produce no snapshots; the final
+report is built from graph state and is unaffected.
+"""
+
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from claim_extractor import ValidatedClaim
+from claim_verifier import Verdict
+from claim_verifier.schemas import VerificationResult
+from utils import TTLCache
+
+from fact_checker.config import REPORT_STREAMING_CONFIG
+from fact_checker.schemas import FactCheckReport
+
+SNAPSHOT_EVENT = "report_snapshot"
+
+
+class ReportProgress:
+    """Claims of one fact-check and the verdicts received for them so far."""
+
+    def __init__(self, claims: Sequence[ValidatedClaim]):
+        self.claims = list(claims)
+        self.verdicts: Dict[int, Verdict] = {}
+
+    def verdicts_so_far(self) -> List[Verdict]:
+        """Verdicts in claim order, independent of completion order."""
+        return [self.verdicts[index] for index in sorted(self.verdicts)]
+
+    def pending_claims(self) -> List[ValidatedClaim]:
+        return [claim for index, claim in enumerate(self.claims) if index not in self.verdicts]
+
+
+# Progress of in-flight fact-checks in this process; the TTL bounds runs that
+# never reach the report
+_PROGRESS: TTLCache[str, ReportProgress] = TTLCache(
+    max_size=REPORT_STREAMING_CONFIG["max_active_reports"],
+    ttl=REPORT_STREAMING_CONFIG["ttl_seconds"],
+)
+
+
+def summarize_verdicts(
+    verdicts: Sequence[Verdict], total: Optional[int] = None, unchecked: int = 0
+) -> str:
+    """Summary line for the report; ``total`` marks a partial (in-progress) summary."""
+    supported = sum(verdict.result == VerificationResult.SUPPORTED for verdict in verdicts)
+    refuted = sum(verdict.result == VerificationResult.REFUTED for verdict in verdicts)
+
+    if total is None:
+        summary = (
+            f"Fact-check complete. Of {len(verdicts)} claims verified: "
+            f"{supported} supported, {refuted} refuted"
+        )
+    else:
+        summary = (
+            f"Fact-check in progress. {len(verdicts)} of {total} claims verified: "
+            f"{supported} supported, {refuted} refuted"
+        )
+
+    timed_out = sum(verdict.timed_out for verdict in verdicts)
+    if timed_out:
+        summary += f" ({timed_out} timed out)"
+    if unchecked:
+        summary += f"; {unchecked} not checked"
+    return summary
+
+
+def build_report(
+    answer: str, verdicts: Sequence[Verdict], unchecked: Sequence[ValidatedClaim] = ()
+) -> FactCheckReport:
+    """The final fact-check report for the given verdicts and unchecked claims."""
+    return FactCheckReport(
+        answer=answer,
+        claims_verified=len(verdicts),
+        verified_claims=list(verdicts),
+        unchecked_claims=list(unchecked),
+        summary=summarize_verdicts(verdicts, unchecked=len(unchecked)),
+        timestamp=datetime.now(),
+    )
+
+
+def _snapshot(
+    verdicts: Sequence[Verdict],
+    pending: Sequence[ValidatedClaim],
+    summary: str,
+    final: bool,
+    unchecked: Sequence[ValidatedClaim] = (),
+) -> Dict[str, Any]:
+    counts = {result.value: 0 for result in VerificationResult}
+    for verdict in verdicts:
+        counts[VerificationResult(verdict.result).value] += 1
+
+    return {
+        "type": SNAPSHOT_EVENT,
+        "final": final,
+        "claims_total": len(verdicts) + len(pending),
+        "claims_verified": len(verdicts),
+        "counts": counts,
+        "summary": summary,
+        "verified_claims": [verdict.model_dump(mode="json") for verdict in verdicts],
+        "pending_claims": [claim.model_dump(mode="json") for claim in pending],
+        "unchecked_claims": [claim.model_dump(mode="json") for claim in unchecked],
+    }
+
+
+def start_report(claims: Sequence[ValidatedClaim]) -> str:
+    """Track a new fact-check's claims and return its report id."""
+    report_id = uuid.uuid4().hex
+    _PROGRESS.set(report_id, ReportProgress(claims))
+    return report_id
+
+
+def record_verdict(
+    report_id: Optional[str], claim_index: Optional[int], verdict: Verdict
+) -> Optional[Dict[str, Any]]:
+    """Record a claim's verdict and return the updated report snapshot.
+
+    Returns None when the fact-check is not tracked (e.g. it expired or the
+    verdict comes from another process); the final report still covers it.
+    """
+    progress = _PROGRESS.get(report_id) if report_id else None
+    if progress is None or claim_index is None:
+        return None
+
+    progress.verdicts[claim_index] = verdict
+    verdicts = progress.verdicts_so_far()
+    pending = progress.pending_claims()
+    summary = summarize_verdicts(verdicts, total=len(progress.claims))
+    return _snapshot(verdicts, pending, summary, final=False)
+
+
+def finish_report(report_id: Optional[str], report: FactCheckReport) -> Dict[str, Any]:
+    """Stop tracking a fact-check and return the snapshot of its final report."""
+    if report_id:
+        _PROGRESS.invalidate(report_id)
+    return _snapshot(
+        report.verified_claims, [], report.summary, final=True, unchecked=report.unchecked_claims
+    )
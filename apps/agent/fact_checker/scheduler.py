@@ -0,0 +1,143 @@
+"""Bounded, prioritised scheduling of claim verifications.
+
+``dispatch_claims_for_verification`` still fans out one ``Send`` per claim,
+but each ``claim_verifier`` branch waits for a slot here before starting the
+verifier subgraph. At most ``max_parallel`` verifications run at once in the
+process; when one finishes, its slot goes to the waiting claim with the
+best (lowest) priority.
+
+The queue is shared by all runs in the process, while priority policies
+only order the claims of one run. Dispatched priorities therefore start
+with the run's dispatch order (see ``dispatch_order``): earlier runs are
+served first, so a stream of new documents cannot starve an older one.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, List, Sequence, Tuple
+
+from claim_extractor import ValidatedClaim
+
+from fact_checker.config import DISPATCH_CONFIG
+
+logger = logging.getLogger(__name__)
+
+Priority = Tuple[float, ...]
+
+_dispatch_sequence = itertools.count()
+
+
+def _sentence_order(
+    claims: Sequence[ValidatedClaim], scores: Sequence[float]
+) -> List[Priority]:
+    """Claims from earlier sentences first, in extraction order within a sentence."""
+    return [(claim.original_index, index) for index, claim in enumerate(claims)]
+
+
+def _check_worthiness(
+    claims: Sequence[ValidatedClaim], scores: Sequence[float]
+) -> List[Priority]:
+    """Most check-worthy claims first, ties in sentence order."""
+    if len(scores) != len(claims):
+        return _sentence_order(claims, scores)
+    return [
+        (-score, claim.original_index, index)
+        for index, (claim, score) in enumerate(zip(claims, scores))
+    ]
+
+
+# Priority policies: map the claims and their check-worthiness scores to
+# sortable priorities, lower first
+CLAIM_PRIORITIES: Dict[
+    str, Callable[[Sequence[ValidatedClaim], Sequence[float]], List[Priority]]
+] = {
+    "sentence_order": _sentence_order,
+    "check_worthiness": _check_worthiness,
+}
+
+
+def get_claim_priorities(
+    claims: Sequence[ValidatedClaim], policy: str, scores: Sequence[float] = ()
+) -> List[Priority]:
+    """Priority of each claim under ``policy``; raises ValueError for unknown policies."""
+    if policy not in CLAIM_PRIORITIES:
+        raise ValueError(
+            f"Unknown claim priority: {policy}. Supported: {list(CLAIM_PRIORITIES)}"
+        )
+    return CLAIM_PRIORITIES[policy](claims, scores)
+
+
+def dispatch_order() -> int:
+    """Process-wide, increasing number for a run dispatching its claims."""
+    return next(_dispatch_sequence)
+
+
+class ClaimScheduler:
+    """Priority-ordered semaphore bounding concurrent claim verifications.
+
+    Not thread-safe; intended for use from a single event loop.
+    """
+
+    def __init__(self, max_parallel: int):
+        if max_parallel < 1:
+            raise ValueError(f"max_parallel must be at least 1, got {max_parallel}")
+        self.max_parallel = max_parallel
+        self._running = 0
+        self._waiting: List[Tuple[Priority, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def waiting(self) -> int:
+        return sum(not future.done() for _, _, future in self._waiting)
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority) -> AsyncIterator[None]:
+        """Hold one of the verification slots for the duration of the block."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: Priority) -> None:
+        if self._running < self.max_parallel and not self.waiting:
+            self._running += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting, (priority, next(self._sequence), future))
+        try:
+            # The releasing branch hands its slot over without decrementing
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        while self._waiting:
+            _, _, future = heapq.heappop(self._waiting)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._running -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of slot usage."""
+        return {
+            "max_parallel": self.max_parallel,
+            "running": self._running,
+            "waiting": self.waiting,
+        }
+
+
+# Shared by all fact-checks in the process, so concurrent runs cannot
+# together exceed the memory and provider-quota budget
+claim_scheduler = ClaimScheduler(DISPATCH_CONFIG["max_parallel_claims"])
@@ -21,6 +21,10 @@ class FactCheckReport(BaseModel):
     verified_claims: List[Verdict] = Field(
         description="Results for each verified claim"
     )
+    unchecked_claims: List[ValidatedClaim] = Field(
+        default_factory=list,
+        description="Claims not checked because they scored low on check-worthiness under load",
+    )
     summary: str = Field(description="A concise summary of the fact-checking results")
     timestamp: datetime = Field(
         default_factory=datetime.now, description="When the fact-check was performed"
@@ -34,9 +38,25 @@ class State(BaseModel):
     extracted_claims: List[ValidatedClaim] = Field(
         default_factory=list, description="Claims extracted from the text"
     )
+    claims_to_verify: List[ValidatedClaim] = Field(
+        default_factory=list, description="Extracted claims selected for verification"
+    )
+    claim_scores: List[float] = Field(
+        default_factory=list, description="Check-worthiness score of each claim to verify"
+    )
+    unchecked_claims: List[ValidatedClaim] = Field(
+        default_factory=list, description="Extracted claims skipped by load shedding"
+    )
     verification_results: Annotated[List[Verdict], add] = Field(
         default_factory=list, description="Verification results for each claim"
     )
     final_report: Optional[FactCheckReport] = Field(
         default=None, description="The final fact-checking report"
     )
+    deadline: Optional[float] = Field(
+        default=None,
+        description="Wall-clock time (epoch seconds) by which the report is due, if any",
+    )
+    report_id: Optional[str] = Field(
+        default=None, description="Id of the in-flight report for streamed snapshots"
+    )
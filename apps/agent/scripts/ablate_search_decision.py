@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Ablation of the claim verifier's search decision modes on the benchmark claims.
+
+Runs every claim through the verifier once per mode ("llm", "heuristic",
+"merged") and reports accuracy against the ground-truth verdicts next to the
+LLM calls each mode needed, so saved calls can be weighed against any
+accuracy change.
+
+Usage:
+    python scripts/ablate_search_decision.py [--benchmark PATH] [--provider openai]
+        [--modes llm heuristic merged] [--limit N] [--output results.csv]
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claim_extractor.schemas import ValidatedClaim
+from claim_verifier import graph as claim_verifier_graph
+from claim_verifier.nodes.search_decision import DECISION_MODES
+
+DEFAULT_BENCHMARK = (
+    Path(__file__).resolve().parents[3]
+    / "results/thesis_dataset_empty/my_thesis_benchmark_claims_verification.csv"
+)
+
+
+def count_llm_calls(result: Dict[str, Any]) -> Dict[str, int]:
+    """Reconstruct the LLM calls of one verifier run from its final state."""
+    decisions = result.get("search_decisions", [])
+    merged = decisions.count("merged")
+    evaluations = merged + (0 if decisions[-1:] == ["merged"] else 1)
+    query_generations = result.get("iteration_count", 0) + 1
+    decision_calls = decisions.count("llm")
+    return {
+        "query_calls": query_generations,
+        "decision_calls": decision_calls,
+        "evaluation_calls": evaluations,
+        "total_calls": query_generations + decision_calls + evaluations,
+    }
+
+
+async def run_claim(claim: ValidatedClaim, provider: str, mode: str) -> Dict[str, Any]:
+    started = time.perf_counter()
+    result = await claim_verifier_graph.ainvoke(
+        {"claim": claim},
+        config={"configurable": {"llm_provider": provider, "search_decision_mode": mode}},
+    )
+    verdict = result.get("verdict")
+    return {
+        "verdict": verdict.result.value if verdict else "",
+        "iterations": result.get("iteration_count", 0),
+        "decisions": "|".join(result.get("search_decisions", [])),
+        "seconds": round(time.perf_counter() - started, 2),
+        **count_llm_calls(result),
+    }
+
+
+def summarize(rows: List[Dict[str, Any]], modes: List[str]) -> None:
+    baseline = {row["claim_id"]: row["verdict"] for row in rows if row["mode"] == "llm"}
+    baseline_calls = sum(row["total_calls"] for row in rows if row["mode"] == "llm")
+
+    print("-" * 100)
+    print(
+        f"{'mode':<10} {'claims':>6} {'accuracy':>9} {'agree llm':>10} {'decision':>9} "
+        f"{'total':>7} {'saved':>7} {'iters':>6} {'sec/claim':>10}"
+    )
+    for mode in modes:
+        mode_rows = [row for row in rows if row["mode"] == mode]
+        if not mode_rows:
+            continue
+        n = len(mode_rows)
+        correct = sum(row["verdict"] == row["ground_truth"] for row in mode_rows)
+        compared = [row for row in mode_rows if row["claim_id"] in baseline]
+        agree = sum(row["verdict"] == baseline[row["claim_id"]] for row in compared)
+        total_calls = sum(row["total_calls"] for row in mode_rows)
+        saved = f"{baseline_calls - total_calls:>7}" if baseline else f"{'-':>7}"
+        print(
+            f"{mode:<10} {n:>6} {correct / n:>9.1%} "
+            f"{(agree / len(compared)) if compared else 0:>10.1%} "
+            f"{sum(row['decision_calls'] for row in mode_rows):>9} {total_calls:>7} {saved} "
+            f"{sum(row['iterations'] for row in mode_rows) / n:>6.2f} "
+            f"{sum(row['seconds'] for row in mode_rows) / n:>10.1f}"
+        )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Ablate claim verifier search decision modes")
+    parser.add_argument("--benchmark", type=Path, default=DEFAULT_BENCHMARK)
+    parser.add_argument("--provider", default="openai", choices=["openai", "gemini", "deepseek"])
+    parser.add_argument("--modes", nargs="+", default=list(DECISION_MODES), choices=DECISION_MODES)
+    parser.add_argument("--limit", type=int, help="Only use the first N claims")
+    parser.add_argument("--output", type=Path, help="Write per-claim results to this CSV")
+    args = parser.parse_args()
+
+    with open(args.benchmark, newline="", encoding="utf-8") as f:
+        claims = list(csv.DictReader(f))[: args.limit]
+
+    rows: List[Dict[str, Any]] = []
+    for mode in args.modes:
+        print(f"Running {len(claims)} claims in '{mode}' mode with {args.provider}...")
+        for row in claims:
+            claim = ValidatedClaim(**json.loads(row["validated_claim_object"]))
+            try:
+                outcome = await run_claim(claim, args.provider, mode)
+            except Exception as e:
+                print(f"[WARNING] {row['claim_id']} failed in '{mode}' mode: {e}")
+                continue
+            rows.append(
+                {
+                    "claim_id": row["claim_id"],
+                    "mode": mode,
+                    "ground_truth": row["ground_truth_verdict"],
+                    **outcome,
+                }
+            )
+
+    summarize(rows, args.modes)
+
+    if args.output and rows:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"Per-claim results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
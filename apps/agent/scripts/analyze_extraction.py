@@ -4,6 +4,10 @@ Script to analyze extraction results from all three LLMs and determine the winne
 
 This script compares extraction performance against BingCheck ground truth
 and creates extraction_metrics.csv with performance metrics for all LLMs.
+
+With --compare-modes, it instead compares the two-stage and the fused
+selection/disambiguation runs (see run_extraction_phase.py --extraction-mode)
+per provider on accuracy, LLM calls per sentence and latency.
 """
 
 import argparse
@@ -64,6 +68,12 @@ def load_dataset_with_extractions(dataset_path: str) -> pd.DataFrame:
         'deepseek_extracted_claims_json'
     ]
     
+    # Fused-mode runs are optional and only present after an A/B run
+    json_fields += [
+        f"{field.split('_', 1)[0]}_fused_{field.split('_', 1)[1]}" for field in json_fields
+    ]
+    json_fields = [field for field in json_fields if field in df.columns]
+
     for field in json_fields:
         def safe_json_parse(x):
             if pd.isna(x) or x == '' or x == 'null' or x == '[]':
@@ -246,6 +256,80 @@ def create_extractions_comparison_summary(
     return summary
 
 
+def summarize_cost(df: pd.DataFrame, provider_prefix: str) -> Dict[str, float]:
+    """Mean LLM calls, latency and prompt cache use per sentence for one provider/mode column prefix."""
+    calls_col, latency_col = f"{provider_prefix}_llm_calls", f"{provider_prefix}_latency_s"
+    if calls_col not in df.columns or latency_col not in df.columns:
+        return {}
+    calls = pd.to_numeric(df[calls_col], errors="coerce")
+    latency = pd.to_numeric(df[latency_col], errors="coerce")
+    return {
+        'mean_llm_calls': float(calls.mean()),
+        'total_llm_calls': int(calls.sum()),
+        'mean_latency_s': float(latency.mean()),
+        'median_latency_s': float(latency.median()),
+        'p95_latency_s': float(latency.quantile(0.95)),
+        **summarize_prompt_cache(df, provider_prefix),
+    }
+
+
+def summarize_prompt_cache(df: pd.DataFrame, provider_prefix: str) -> Dict[str, float]:
+    """Input tokens and the share served from the provider's prompt cache, if recorded."""
+    input_col = f"{provider_prefix}_input_tokens"
+    cached_col = f"{provider_prefix}_cached_input_tokens"
+    if input_col not in df.columns or cached_col not in df.columns:
+        return {}
+    input_tokens = pd.to_numeric(df[input_col], errors="coerce").sum()
+    cached_tokens = pd.to_numeric(df[cached_col], errors="coerce").sum()
+    return {
+        'total_input_tokens': int(input_tokens),
+        'cached_input_tokens': int(cached_tokens),
+        'prompt_cache_hit_rate': float(cached_tokens / input_tokens) if input_tokens else 0.0,
+    }
+
+
+def compare_extraction_modes(dataset_path: str, output_path: str):
+    """A/B comparison of the two-stage and fused extraction modes per provider."""
+    print("Comparing two-stage and fused extraction modes...")
+
+    unique_output_path = generate_unique_filename(output_path)
+    if unique_output_path != output_path:
+        print(f"[WARNING] Output file already exists. Using unique filename: {unique_output_path}")
+
+    df = load_dataset_with_extractions(dataset_path)
+    print(f"Loaded dataset with {len(df)} sentences")
+
+    rows = []
+    for provider_prefix in ['gpt4', 'gemini', 'deepseek']:
+        for mode, prefix in [('two_stage', provider_prefix), ('fused', f"{provider_prefix}_fused")]:
+            if f"{prefix}_binary_result" not in df.columns:
+                continue
+            metrics = calculate_extraction_metrics(df, prefix)
+            if not metrics:
+                continue
+            rows.append({
+                'provider': provider_prefix,
+                'mode': mode,
+                'accuracy': metrics['accuracy'],
+                'f1_score': metrics['f1_score'],
+                'precision_positive': metrics['precision_positive'],
+                'recall_positive': metrics['recall_positive'],
+                'total_samples': metrics['total_samples'],
+                **summarize_cost(df, prefix),
+            })
+
+    if not rows:
+        print("[WARNING] No extraction results to compare")
+        return None, unique_output_path
+
+    comparison = pd.DataFrame(rows)
+    print("\nTwo-stage vs fused extraction:")
+    print(comparison.to_string(index=False))
+    comparison.to_csv(unique_output_path, index=False)
+    print(f"\nMode comparison saved to {unique_output_path}")
+    return comparison, unique_output_path
+
+
 def analyze_extraction_phase(dataset_path: str, output_path: str):
     """Analyze extraction results and create metrics summary."""
     print("Analyzing extraction phase results...")
@@ -324,6 +408,11 @@ def main():
         default="../../extraction_metrics.csv",
         help="Path to save extraction metrics CSV file"
     )
+    parser.add_argument(
+        "--compare-modes",
+        action="store_true",
+        help="Compare two-stage and fused extraction runs instead of providers"
+    )
 
     args = parser.parse_args()
 
@@ -335,6 +424,11 @@ def main():
         print(f"[ERROR] Dataset file not found: {args.dataset}")
         sys.exit(1)
 
+    if args.compare_modes:
+        _, actual_output_path = compare_extraction_modes(args.dataset, args.output)
+        print(f"Results saved to: {actual_output_path}")
+        return
+
     # Analyze extraction results and get the actual output path used
     summary, actual_output_path = analyze_extraction_phase(args.dataset, args.output)
 
@@ -7,10 +7,11 @@ from typing import Optional
 
 from security.api_keys import (
     generate_secure_api_key,
-    get_api_keys,
+    iter_api_keys,
     revoke_api_key,
     store_api_key,
 )
+from security.rate_limit import get_usage
 from utils.redis import test_redis_connection
 
 
@@ -23,6 +24,7 @@ def print_usage() -> None:
         python api_key.py generate [description]  - Generate new API key
         python api_key.py list                   - List all API keys
         python api_key.py revoke <api_key>       - Revoke an API key
+        python api_key.py usage <api_key>        - Show rate limit usage for a key
         python api_key.py test                   - Test Redis connection
 
     Examples:
@@ -52,21 +54,24 @@ async def handle_generate(description: Optional[str] = None) -> None:
 
 async def handle_list() -> None:
     """Handle listing API keys."""
-    api_keys = await get_api_keys()
+    count = 0
 
-    if not api_keys:
-        print("No API keys found in Redis.")
-        return
-
-    print(f"Found {len(api_keys)} API key(s):")
-    print("-" * 60)
-
-    for key_data in api_keys:
+    # Stream keys as they arrive instead of loading the whole set first
+    async for key_data in iter_api_keys():
+        if count == 0:
+            print("-" * 60)
         print(f"Key: {key_data['key']}")
         print(f"Description: {key_data['description']}")
         print(f"Created: {key_data['created_at']}")
         print(f"Active: {key_data['active']}")
         print("-" * 60)
+        count += 1
+
+    if not count:
+        print("No API keys found in Redis.")
+        return
+
+    print(f"Found {count} API key(s).")
 
 
 async def handle_revoke(api_key: str) -> None:
@@ -77,6 +82,24 @@ async def handle_revoke(api_key: str) -> None:
         print(f"[ERROR] API key '{api_key}' not found.")
 
 
+async def handle_usage(api_key: str) -> None:
+    """Handle showing usage counters for an API key."""
+    usage = await get_usage(api_key)
+
+    print(f"Usage for API key '{api_key}':")
+    print("-" * 60)
+    print(
+        f"Requests in window: {usage['requests_in_window']}/{usage['request_limit']} "
+        f"(last {usage['window_seconds']:g}s)"
+    )
+    print(f"Active runs: {usage['active_runs']}/{usage['run_limit']}")
+    print(f"Total requests: {usage['total_requests']}")
+    print(f"Total runs: {usage['total_runs']}")
+    print(f"Rejected (rate limit): {usage['rate_limited']}")
+    print(f"Rejected (concurrency): {usage['concurrency_limited']}")
+    print("-" * 60)
+
+
 async def handle_test() -> None:
     """Handle Redis connection test."""
     if await test_redis_connection():
@@ -118,6 +141,13 @@ async def main() -> None:
                 return
             await ensure_redis_connection(handle_revoke, sys.argv[2])
 
+        elif command == "usage":
+            if len(sys.argv) < 3:
+                print("[ERROR] Please provide an API key.")
+                print("Usage: python api_key.py usage <api_key>")
+                return
+            await ensure_redis_connection(handle_usage, sys.argv[2])
+
         elif command == "test":
             await handle_test()
 
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Fuzz and throughput benchmark for the DeepSeek JSON response parsing.
+
+Builds a corpus of DeepSeek-style responses from the thesis results (the
+DeepSeek verdicts and extracted claims, serialised the way JSON mode returns
+them, some wrapped in prose or code fences) or loads captured raw responses
+with --responses. It then:
+
+- checks that the current parser (utils/json_output.py) parses everything
+  the previous regex and brace-depth implementation did, the same way,
+- fuzzes it: braces and quotes injected into string values and surrounding
+  prose must not change the parsed object, truncated responses must parse
+  to nothing,
+- measures the throughput of both implementations.
+
+Usage:
+    python scripts/benchmark_json_parsing.py [--responses PATH] [--fuzz N] [--repeat N]
+"""
+
+import argparse
+import csv
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pydantic import BaseModel
+
+from claim_extractor.nodes.decomposition import DecompositionOutput
+from claim_extractor.nodes.disambiguation import DisambiguationOutput
+from claim_verifier.nodes.evaluate_evidence import EvidenceEvaluationOutput
+from utils import json_output
+from utils.json_output import extract_json_object, normalize_enum_values
+
+RESULTS_DIR = Path(__file__).resolve().parents[3] / "results" / "thesis_datasets_with_LLM_results"
+
+SCHEMAS: Dict[str, Type[BaseModel]] = {
+    schema.__name__: schema
+    for schema in (DecompositionOutput, DisambiguationOutput, EvidenceEvaluationOutput)
+}
+
+PROSE = [
+    "Here is the JSON you asked for:",
+    "Sure! Output format is {field: value}.",
+    'The claim says "it {was}" true; my answer:',
+]
+
+
+# The implementation this benchmark compares against, as it was before the
+# single-pass scanner: fence regex, char-by-char brace depth, json.loads and a
+# recursive normalisation copy with a fixed enum table.
+
+_LEGACY_ENUMS = {
+    "supported": "Supported",
+    "refuted": "Refuted",
+    "insufficient information": "Insufficient Information",
+    "insufficient_information": "Insufficient Information",
+}
+
+
+def _legacy_segment(text: str) -> Optional[str]:
+    if not text:
+        return None
+    text = text.strip()
+    fence_match = re.search(r"```(?:json)?\s*(.*?)```", text, re.DOTALL | re.IGNORECASE)
+    if fence_match:
+        return fence_match.group(1).strip()
+    start = text.find("{")
+    if start == -1:
+        return None
+    depth = 0
+    for idx in range(start, len(text)):
+        char = text[idx]
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : idx + 1]
+    return None
+
+
+def _legacy_normalize(data: Any) -> Any:
+    if not isinstance(data, dict):
+        return data
+    normalized = {}
+    for key, value in data.items():
+        if isinstance(value, str):
+            normalized[key] = _LEGACY_ENUMS.get(value.lower(), value)
+        elif isinstance(value, dict):
+            normalized[key] = _legacy_normalize(value)
+        elif isinstance(value, list):
+            normalized[key] = [_legacy_normalize(item) if isinstance(item, dict) else item for item in value]
+        else:
+            normalized[key] = value
+    return normalized
+
+
+def legacy_parse(text: str, schema: Type[BaseModel]) -> Optional[BaseModel]:
+    segment = _legacy_segment(text)
+    if not segment:
+        return None
+    try:
+        data = json.loads(segment)
+        if not data:
+            return None
+        return schema(**_legacy_normalize(data))
+    except (json.JSONDecodeError, TypeError, ValueError):
+        return None
+
+
+def parse(text: str, schema: Type[BaseModel]) -> Optional[BaseModel]:
+    """The DeepSeek wrapper's current parsing path."""
+    data = extract_json_object(text)
+    if not data:
+        return None
+    try:
+        return schema(**normalize_enum_values(data, schema))
+    except (TypeError, ValueError):
+        return None
+
+
+def _read_csv(path: Path) -> List[Dict[str, str]]:
+    csv.field_size_limit(sys.maxsize)
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def load_payloads(results_dir: Path) -> List[Tuple[str, Dict[str, Any]]]:
+    """(schema name, response object) pairs rebuilt from DeepSeek thesis results."""
+    payloads = []
+    for path in sorted(results_dir.glob("*benchmark_claims*.csv")):
+        for row in _read_csv(path):
+            if not row.get("deepseek_verdict") or not row.get("deepseek_reasoning"):
+                continue
+            try:
+                sources = json.loads(row.get("deepseek_sources") or "[]")
+            except json.JSONDecodeError:
+                sources = []
+            payloads.append(
+                (
+                    "EvidenceEvaluationOutput",
+                    {
+                        "verdict": row["deepseek_verdict"],
+                        "reasoning": row["deepseek_reasoning"],
+                        "influential_source_indices": list(range(1, len(sources) + 1)),
+                    },
+                )
+            )
+    for path in sorted(results_dir.glob("*dataset_run*.csv")):
+        for row in _read_csv(path):
+            try:
+                claims = json.loads(row.get("deepseek_extracted_claims_json") or "[]")
+            except json.JSONDecodeError:
+                continue
+            if not claims:
+                continue
+            payloads.append(
+                ("DecompositionOutput", {"claims": [c["claim_text"] for c in claims], "no_claims": False})
+            )
+            payloads.append(
+                (
+                    "DisambiguationOutput",
+                    {"disambiguated_sentence": claims[0]["disambiguated_sentence"], "cannot_be_disambiguated": False},
+                )
+            )
+    return payloads
+
+
+def render(payload: Dict[str, Any], rng: random.Random) -> str:
+    """Serialise a response object the ways DeepSeek returns them."""
+    payload = dict(payload)
+    if "verdict" in payload:
+        payload["verdict"] = rng.choice(
+            [payload["verdict"], payload["verdict"].upper(), payload["verdict"].upper().replace(" ", "_")]
+        )
+    style = rng.random()
+    if style < 0.6:
+        return json.dumps(payload, ensure_ascii=False)
+    if style < 0.8:
+        return json.dumps(payload, indent=2)
+    if style < 0.9:
+        return f"{rng.choice(PROSE)}\n```json\n{json.dumps(payload, indent=2)}\n```"
+    return f"{rng.choice(PROSE)} {json.dumps(payload)}"
+
+
+def load_corpus(args, rng: random.Random) -> List[Tuple[str, Type[BaseModel]]]:
+    """(response text, schema) pairs to parse."""
+    if args.responses:
+        corpus = []
+        with open(args.responses, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    corpus.append((record["content"], SCHEMAS[record["schema"]]))
+        return corpus
+    return [(render(payload, rng), SCHEMAS[name]) for name, payload in load_payloads(args.results_dir)]
+
+
+def compare(corpus: List[Tuple[str, Type[BaseModel]]]) -> Tuple[int, int]:
+    """Responses only the current parser recovers, and responses it gets wrong."""
+    recovered = regressions = 0
+    for text, schema in corpus:
+        old, new = legacy_parse(text, schema), parse(text, schema)
+        if (old and old.model_dump()) == (new and new.model_dump()):
+            continue
+        if old is None:
+            recovered += 1
+            continue
+        regressions += 1
+        if regressions <= 3:
+            print(f"  differs on: {text[:120]!r}")
+            print(f"    previous: {old!r}\n    current:  {new!r}")
+    return recovered, regressions
+
+
+def _mutate_strings(value: Any, rng: random.Random) -> Any:
+    noise = ["{", "}", '"', '\\"}', "{{", "}\\n{", "```"]
+    if isinstance(value, str):
+        pos = rng.randint(0, len(value))
+        return value[:pos] + rng.choice(noise) + value[pos:]
+    if isinstance(value, list):
+        return [_mutate_strings(item, rng) for item in value]
+    if isinstance(value, dict):
+        return {key: _mutate_strings(item, rng) for key, item in value.items()}
+    return value
+
+
+def fuzz(payloads: List[Tuple[str, Dict[str, Any]]], rounds: int, rng: random.Random) -> int:
+    """Count fuzz cases the current scanner gets wrong."""
+    failures = 0
+    for _ in range(rounds):
+        _, payload = rng.choice(payloads)
+        mutated = _mutate_strings(payload, rng)
+        body = json.dumps(mutated, indent=rng.choice([None, 2]))
+        prose = rng.choice(PROSE) + rng.choice(["", " (see {notes}) ", " } "])
+        text = rng.choice([body, f"{prose}\n{body}\nThanks.", f"{prose}\n```json\n{body}\n```"])
+
+        # Noise inside strings and around the object must not change it
+        if extract_json_object(text) != mutated:
+            failures += 1
+            print(f"  mutated object misparsed: {text[:120]!r}")
+
+        # A truncated object must not parse to one of its fragments
+        cut = text[: text.index(body) + rng.randint(1, len(body) - 1)]
+        if extract_json_object(cut) is not None:
+            failures += 1
+            print(f"  truncated response parsed: {cut[-120:]!r}")
+    return failures
+
+
+def throughput(corpus: List[Tuple[str, Type[BaseModel]]], parser: Callable, repeat: int) -> float:
+    """Responses parsed per second."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text, schema in corpus:
+            parser(text, schema)
+    return repeat * len(corpus) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuzz and benchmark DeepSeek JSON response parsing")
+    parser.add_argument("--results-dir", type=Path, default=RESULTS_DIR, help="Thesis results with DeepSeek outputs")
+    parser.add_argument("--responses", type=Path, help='Captured responses, JSONL of {"schema", "content"}')
+    parser.add_argument("--fuzz", type=int, default=5000, help="Fuzz cases to run")
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over the corpus when timing")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = load_corpus(args, rng)
+    if not corpus:
+        print("[ERROR] No responses to benchmark")
+        sys.exit(1)
+    print(f"Corpus: {len(corpus)} responses (orjson {'on' if json_output.orjson else 'off'})")
+
+    recovered, regressions = compare(corpus)
+    print(f"Only parsed by the current parser: {recovered}")
+    print(f"Parsed differently from the previous parser: {regressions}")
+
+    failures = 0
+    if args.fuzz and not args.responses:
+        failures = fuzz(load_payloads(args.results_dir), args.fuzz, rng)
+        print(f"Fuzz failures: {failures}/{args.fuzz}")
+
+    legacy_rate = throughput(corpus, legacy_parse, args.repeat)
+    current_rate = throughput(corpus, parse, args.repeat)
+    print(f"Previous parser: {legacy_rate:,.0f} responses/s")
+    print(f"Current parser:  {current_rate:,.0f} responses/s ({current_rate / legacy_rate:.1f}x)")
+
+    if failures or regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
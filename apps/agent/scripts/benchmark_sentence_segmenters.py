@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark the sentence segmenters against the BingCheck gold segmentation.
+
+Each answer is rebuilt by joining its gold sentences with spaces (newlines
+before list items, which the gold data keeps as separate sentences), segmented
+with every registered segmenter, and scored on boundary precision/recall
+and exact sentence matches. Throughput is measured on the same documents.
+
+Usage:
+    python scripts/benchmark_sentence_segmenters.py [--dataset PATH] [--limit N]
+"""
+
+import argparse
+import csv
+import sys
+import time
+from collections import defaultdict
+import re
+from pathlib import Path
+from typing import Dict, List, Set
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claim_extractor.nodes.sentence_splitter import SEGMENTERS, get_segmenter
+
+DEFAULT_DATASET = (
+    Path(__file__).resolve().parents[3]
+    / "thesis_latex_files/sources/ground_truth_data-BingCheck/bingcheck.csv"
+)
+
+LIST_ITEM = re.compile(r"^(?:[-*+]|\d{1,3}[.)])\s+")
+
+
+def load_documents(dataset: Path) -> List[List[str]]:
+    """Load gold sentences grouped by answer, in sentence order."""
+    answers: Dict[str, List[tuple]] = defaultdict(list)
+    with open(dataset, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            answers[row["answer_id"]].append((int(row["sentence_id"]), row["sentence"].strip()))
+
+    return [[sentence for _, sentence in sorted(rows)] for rows in answers.values()]
+
+
+def rebuild_text(sentences: List[str]) -> str:
+    """Reassemble an answer, putting list items back on their own lines."""
+    parts = [sentences[0]]
+    for sentence in sentences[1:]:
+        parts.append("\n" if LIST_ITEM.match(sentence) else " ")
+        parts.append(sentence)
+    return "".join(parts)
+
+
+def _boundaries(sentences: List[str]) -> Set[int]:
+    """Character offsets where each sentence ends, ignoring whitespace and list markers."""
+    offsets, position = set(), 0
+    for sentence in sentences[:-1]:
+        position += len("".join(LIST_ITEM.sub("", sentence).split()))
+        offsets.add(position)
+    return offsets
+
+
+def evaluate(name: str, documents: List[List[str]]) -> Dict[str, float]:
+    """Segment every document and score it against the gold sentences."""
+    segmenter = get_segmenter(name)
+    texts = [rebuild_text(sentences) for sentences in documents]
+
+    # Load resources outside the timed loop
+    segmenter.segment(texts[0])
+
+    started = time.perf_counter()
+    predictions = [segmenter.segment(text) for text in texts]
+    elapsed = time.perf_counter() - started
+
+    true_positives = predicted = expected = exact = 0
+    for gold, predicted_sentences in zip(documents, predictions):
+        gold_boundaries = _boundaries(gold)
+        predicted_boundaries = _boundaries(predicted_sentences)
+        true_positives += len(gold_boundaries & predicted_boundaries)
+        predicted += len(predicted_boundaries)
+        expected += len(gold_boundaries)
+        exact += len(
+            {LIST_ITEM.sub("", s) for s in gold} & {LIST_ITEM.sub("", s) for s in predicted_sentences}
+        )
+
+    precision = true_positives / predicted if predicted else 0.0
+    recall = true_positives / expected if expected else 0.0
+    return {
+        "docs_per_s": len(texts) / elapsed,
+        "chars_per_s": sum(len(t) for t in texts) / elapsed,
+        "precision": precision,
+        "recall": recall,
+        "f1": 2 * precision * recall / (precision + recall) if precision + recall else 0.0,
+        "exact": exact / sum(len(gold) for gold in documents),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark sentence segmenters")
+    parser.add_argument("--dataset", type=Path, default=DEFAULT_DATASET)
+    parser.add_argument("--limit", type=int, help="Only use the first N answers")
+    args = parser.parse_args()
+
+    documents = load_documents(args.dataset)[: args.limit]
+    sentence_count = sum(len(d) for d in documents)
+    print(f"{len(documents)} answers, {sentence_count} gold sentences")
+    print("-" * 78)
+    print(
+        f"{'segmenter':<10} {'docs/s':>10} {'chars/s':>12} "
+        f"{'precision':>10} {'recall':>8} {'F1':>8} {'exact':>8}"
+    )
+
+    for name in SEGMENTERS:
+        try:
+            r = evaluate(name, documents)
+        except LookupError as e:
+            print(f"{name:<10} skipped - resources unavailable ({type(e).__name__})")
+            continue
+        print(
+            f"{name:<10} {r['docs_per_s']:>10.0f} {r['chars_per_s']:>12.0f} "
+            f"{r['precision']:>10.3f} {r['recall']:>8.3f} {r['f1']:>8.3f} {r['exact']:>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Measure how large the claim extractor state gets on long documents.
+
+Builds the updates each node would emit for a synthetic document in which
+every sentence survives every stage (the worst case), then reports the
+serialized size and serialization time of each `updates` event and of the
+final checkpointed state, using LangGraph's checkpoint serializer.
+
+Usage:
+    python scripts/measure_state_size.py [--sentences N] [--claims-per-sentence K]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from claim_extractor.schemas import (
+    ContextualSentence,
+    DisambiguatedContent,
+    PotentialClaim,
+    SelectedContent,
+    State,
+    ValidatedClaim,
+)
+
+
+def build_updates(sentence_count: int, claims_per_sentence: int) -> List[Tuple[str, Dict[str, Any]]]:
+    """Node updates for a document where nothing is filtered out."""
+    sentences = [
+        f"In {1900 + i % 120}, the population of city number {i} grew by {i % 17}.5 percent "
+        f"according to the national statistics office."
+        for i in range(sentence_count)
+    ]
+    contextual = [
+        ContextualSentence(original_sentence=sentence, original_index=i)
+        for i, sentence in enumerate(sentences)
+    ]
+    selected = [
+        SelectedContent(processed_sentence=item.original_sentence, original_index=item.original_index)
+        for item in contextual
+    ]
+    disambiguated = [
+        DisambiguatedContent(
+            disambiguated_sentence=item.processed_sentence, original_index=item.original_index
+        )
+        for item in selected
+    ]
+    potential = [
+        PotentialClaim(
+            claim_text=f"Claim {k}: {item.disambiguated_sentence}",
+            disambiguated_sentence=item.disambiguated_sentence,
+            original_index=item.original_index,
+        )
+        for item in disambiguated
+        for k in range(claims_per_sentence)
+    ]
+    validated = [
+        ValidatedClaim(
+            claim_text=claim.claim_text,
+            is_complete_declarative=True,
+            disambiguated_sentence=claim.disambiguated_sentence,
+            original_sentence=sentences[claim.original_index],
+            original_index=claim.original_index,
+        )
+        for claim in potential
+    ]
+
+    return [
+        ("sentence_splitter", {"sentences": sentences, "contextual_sentences": contextual}),
+        ("selection", {"selected_contents": selected}),
+        ("disambiguation", {"disambiguated_contents": disambiguated}),
+        ("decomposition", {"potential_claims": potential}),
+        ("validation", {"validated_claims": validated}),
+    ]
+
+
+def measure(value: Any, serde: JsonPlusSerializer, repeat: int) -> Tuple[int, float]:
+    """Serialized size in bytes and mean serialization time in milliseconds."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        _, data = serde.dumps_typed(value)
+    return len(data), (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure claim extractor state size")
+    parser.add_argument("--sentences", type=int, default=400)
+    parser.add_argument("--claims-per-sentence", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    serde = JsonPlusSerializer()
+    updates = build_updates(args.sentences, args.claims_per_sentence)
+
+    print(f"{args.sentences} sentences, {args.claims_per_sentence} claims each")
+    print("-" * 50)
+    print(f"{'update':<20} {'bytes':>12} {'ms':>10}")
+
+    values: Dict[str, Any] = {}
+    for node, update in updates:
+        size, elapsed_ms = measure(update, serde, args.repeat)
+        values.update(update)
+        print(f"{node:<20} {size:>12,} {elapsed_ms:>10.2f}")
+
+    answer_text = " ".join(values["sentences"])
+    size, elapsed_ms = measure(State(answer_text=answer_text, **values), serde, args.repeat)
+    print("-" * 50)
+    print(f"{'final state':<20} {size:>12,} {elapsed_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Measure agent cold start: import and compile the server graphs in a fresh
+interpreter with `python -X importtime` and report the slowest imports.
+
+Exits non-zero when the total exceeds the budget, so it can guard deploys.
+
+Usage:
+    python scripts/profile_cold_start.py [--budget SECONDS] [--top N]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Set, Tuple
+
+AGENT_DIR = Path(__file__).resolve().parent.parent
+
+# Mirrors what the LangGraph server does on boot: load each file in
+# langgraph.json by path, look the variable up in the module __dict__ (module
+# __getattr__ is never consulted) and call it if it is a graph factory
+SERVER_STARTUP = """
+import importlib.util, json
+from langgraph.pregel import Pregel
+for name, spec in json.load(open("langgraph.json"))["graphs"].items():
+    path, variable = spec.rsplit(":", 1)
+    module_spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    graph = module.__dict__[variable]
+    graph = graph if isinstance(graph, Pregel) else graph()
+    assert isinstance(graph, Pregel), name
+"""
+
+# Cold-start budget for a 1 shared-CPU fly.io machine
+DEFAULT_BUDGET_SECONDS = 3.0
+
+# Imported lazily on first use - must never be loaded just by starting the server
+LAZY_MODULES = (
+    "aiohttp",
+    "langchain_exa",
+    "langchain_tavily",
+    "langchain_openai",
+    "langchain_google_genai",
+    "langchain.chat_models",
+    "nltk",
+    "torch",
+    "transformers",
+)
+
+
+def profile_imports(
+    statement: str = SERVER_STARTUP,
+) -> Tuple[float, List[Tuple[int, int, str]], Set[str]]:
+    """Run a statement in a fresh interpreter with -X importtime.
+
+    Returns:
+        (wall-clock seconds, [(cumulative_us, self_us, module), ...], loaded modules)
+        The importtime log also lists failed optional imports, so "loaded"
+        comes from sys.modules instead.
+    """
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"{statement}\nimport sys; print('\\n'.join(sys.modules))",
+        ],
+        cwd=AGENT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - started
+
+    imports = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        imports.append((int(cumulative_us), int(self_us), module.strip()))
+
+    return elapsed, imports, set(completed.stdout.split())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Profile agent cold start")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS)
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    elapsed, imports, loaded = profile_imports()
+
+    print(f"Cold start: {elapsed:.2f}s (budget {args.budget:.2f}s), {len(imports)} modules")
+    print("-" * 60)
+    for cumulative_us, self_us, module in sorted(imports, reverse=True)[: args.top]:
+        print(f"{cumulative_us / 1000:9.1f} ms  {self_us / 1000:8.1f} ms  {module}")
+    print("-" * 60)
+
+    eager = [module for module in LAZY_MODULES if module in loaded]
+    if eager:
+        print(f"[ERROR] Loaded at startup but should be lazy: {', '.join(eager)}")
+    if elapsed > args.budget:
+        print(f"[ERROR] Cold start over budget by {elapsed - args.budget:.2f}s")
+
+    sys.exit(1 if eager or elapsed > args.budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,17 @@
 """
 Script to run the extraction phase for all three LLMs (OpenAI, Gemini, DeepSeek)
 on the thesis dataset with per-sentence updates and resume capability for cost protection.
+
+With --extraction-mode fused, results go to separate `<provider>_fused_*`
+columns so both modes can be compared with `analyze_extraction.py --compare-modes`.
+Each run also records the LLM call count, input tokens (and how many of
+them the provider served from its prompt cache) and latency per sentence.
+
+With --batch, all sentences run concurrently and their LLM calls go through
+the provider's batch API, one batch per pipeline stage, which is cheaper and
+not bound by real-time rate limits. Batches and their results are kept in a
+state file next to the dataset, so an interrupted batch run resumes where it
+stopped when started again.
 """
 
 import argparse
@@ -11,6 +22,7 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import os
+import time
 
 import pandas as pd
 
@@ -19,6 +31,17 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from claim_extractor import graph as claim_extractor_graph
 from claim_extractor.schemas import ValidatedClaim
+from utils import BATCH_PROVIDERS, LLMUsageTracker, batch_llm_calls, get_batch_backend
+
+
+EXTRACTION_MODES = ["two_stage", "fused"]
+
+
+def column_prefix(provider_prefix: str, extraction_mode: str) -> str:
+    """Result column prefix; the default two-stage mode keeps the original columns."""
+    if extraction_mode == "two_stage":
+        return provider_prefix
+    return f"{provider_prefix}_{extraction_mode}"
 
 
 def generate_unique_filename(base_path: str) -> str:
@@ -50,42 +73,44 @@ def generate_unique_filename(base_path: str) -> str:
         counter += 1
 
 
-def get_llm_provider(provider: str):
-    """Get the configured LLM provider for dynamic switching during execution."""
-    from utils.settings import settings
-
-    # Store the original provider
-    original_provider = settings.llm_provider
-
-    # Update the provider setting
-    settings.llm_provider = provider
-
-    return settings
-
-
-async def run_extraction_for_sentence(sentence: str, provider: str) -> Dict[str, Any]:
+async def run_extraction_for_sentence(
+    sentence: str, provider: str, extraction_mode: str = "two_stage", batch: bool = False
+) -> Dict[str, Any]:
     """
     Run claim extraction for a single sentence using the specified LLM provider.
 
     Args:
         sentence: The sentence to analyze
         provider: The LLM provider to use ('openai', 'gemini', 'deepseek')
+        extraction_mode: 'two_stage' (selection, then disambiguation) or 'fused'
+        batch: Whether the call runs in batch mode; call counts, tokens and
+            latency are then not recorded, as they do not reflect real-time use
 
     Returns:
         Dictionary with extraction results or None if error
     """
-    # Update provider for this execution
-    from utils.settings import settings
-    original_provider = settings.llm_provider
-    settings.llm_provider = provider
-
     try:
         payload = {
             "answer_text": sentence,
             "metadata": f"extraction-{provider}"
         }
 
-        result = await claim_extractor_graph.ainvoke(payload)
+        # Select the provider and mode per run instead of mutating global settings;
+        # memoisation is off so every sentence is really extracted and timed
+        usage = LLMUsageTracker()
+        started = time.perf_counter()
+        result = await claim_extractor_graph.ainvoke(
+            payload,
+            config={
+                "configurable": {
+                    "llm_provider": provider,
+                    "extraction_mode": extraction_mode,
+                    "memoize": False,
+                },
+                "callbacks": [usage],
+            },
+        )
+        latency = time.perf_counter() - started
 
         selected_contents = result.get('selected_contents', [])
         validated_claims = result.get('validated_claims', [])
@@ -100,26 +125,33 @@ async def run_extraction_for_sentence(sentence: str, provider: str) -> Dict[str,
         return {
             'extracted_claims_json': json.dumps(claims_json),
             'binary_result': contains_factual_claims,
-            'num_claims': num_validated_claims
+            'num_claims': num_validated_claims,
+            'llm_calls': None if batch else usage.calls,
+            'input_tokens': None if batch else usage.input_tokens,
+            'cached_input_tokens': None if batch else usage.cached_input_tokens,
+            'latency_s': None if batch else round(latency, 3),
         }
     except Exception as e:
         print(f"Error in extraction for provider {provider} on sentence: {sentence[:50]}... - {e}")
         # Return None to indicate error - this allows for retries since the row will remain unprocessed
         return None
-    finally:
-        # Restore original provider
-        settings.llm_provider = original_provider
 
 
-def add_extraction_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Add extraction result columns to the dataframe if they don't exist."""
-    required_columns = [
-        'gpt4_extracted_claims_json', 'gpt4_binary_result', 'gpt4_num_claims',
-        'gemini_extracted_claims_json', 'gemini_binary_result', 'gemini_num_claims',
-        'deepseek_extracted_claims_json', 'deepseek_binary_result', 'deepseek_num_claims'
+def extraction_columns(extraction_mode: str = "two_stage") -> List[str]:
+    """Result columns written for each provider in the given mode."""
+    return [
+        f"{column_prefix(provider_prefix, extraction_mode)}_{suffix}"
+        for provider_prefix in ['gpt4', 'gemini', 'deepseek']
+        for suffix in [
+            'extracted_claims_json', 'binary_result', 'num_claims',
+            'llm_calls', 'input_tokens', 'cached_input_tokens', 'latency_s',
+        ]
     ]
-    
-    for col in required_columns:
+
+
+def add_extraction_columns(df: pd.DataFrame, extraction_mode: str = "two_stage") -> pd.DataFrame:
+    """Add extraction result columns to the dataframe if they don't exist."""
+    for col in extraction_columns(extraction_mode):
         if col not in df.columns:
             df[col] = None  # Initialize with null values
     
@@ -144,20 +176,41 @@ def has_extraction_result_for_sentence(df: pd.DataFrame, idx: int, provider_pref
     return pd.notna(value) and value is not None
 
 
+def write_extraction_result(
+    df: pd.DataFrame, idx: int, provider_prefix: str, result: Dict[str, Any]
+) -> None:
+    """Store one sentence's extraction result in its provider/mode columns."""
+    for key, value in result.items():
+        df.at[idx, f"{provider_prefix}_{key}"] = value
+
+
+def batch_state_path(dataset_path: str, provider_prefix: str) -> str:
+    """State file of a provider's batch run, kept next to the dataset so reruns find it."""
+    dataset_path = Path(dataset_path)
+    return str(dataset_path.with_name(f"{dataset_path.stem}.{provider_prefix}.batch.json"))
+
+
+def rotate_batch_state(state_path: str) -> None:
+    """Set a previous run's batch state aside, so a fresh run makes new LLM calls."""
+    if Path(state_path).exists():
+        archived = generate_unique_filename(str(Path(state_path).with_suffix(".previous.json")))
+        Path(state_path).replace(archived)
+        print(f"[OK] Previous batch state moved to {archived}")
+
+
 async def run_extraction_for_provider(
     df: pd.DataFrame, 
     provider: str, 
     provider_prefix: str, 
-    output_path: str
+    output_path: str,
+    extraction_mode: str = "two_stage"
 ) -> pd.DataFrame:
     """Run extraction for a single provider across all sentences with per-sentence updates."""
-    print(f"Starting extraction for {provider.upper()} provider...")
-    
-    # Get provider-specific columns
-    json_col = f"{provider_prefix}_extracted_claims_json"
-    binary_col = f"{provider_prefix}_binary_result"
-    num_claims_col = f"{provider_prefix}_num_claims"
+    print(f"Starting {extraction_mode} extraction for {provider.upper()} provider...")
     
+    # Get provider- and mode-specific columns
+    provider_prefix = column_prefix(provider_prefix, extraction_mode)
+
     total_sentences = len(df)
     processed_count = 0
     
@@ -172,15 +225,12 @@ async def run_extraction_for_provider(
         sentence = row['sentence']
         
         # Run extraction for this sentence
-        result = await run_extraction_for_sentence(sentence, provider)
+        result = await run_extraction_for_sentence(sentence, provider, extraction_mode)
         
         # Only update if we got a successful result
         if result is not None:
             # Update the dataframe with results
-            df.at[idx, json_col] = result['extracted_claims_json']
-            df.at[idx, binary_col] = result['binary_result']
-            df.at[idx, num_claims_col] = result['num_claims']
-        
+            write_extraction_result(df, idx, provider_prefix, result)
             processed_count += 1
         else:
             # Keep the cell as None to allow for retries
@@ -197,36 +247,82 @@ async def run_extraction_for_provider(
     return df
 
 
+async def run_extraction_for_provider_batched(
+    df: pd.DataFrame,
+    provider: str,
+    provider_prefix: str,
+    output_path: str,
+    state_path: str,
+    extraction_mode: str = "two_stage",
+    poll_seconds: float = 30.0,
+) -> pd.DataFrame:
+    """Run extraction for all unprocessed sentences through the provider's batch API.
+
+    All sentences run concurrently, so their LLM calls are collected into one
+    provider batch per pipeline stage (see utils/batch.py).
+    """
+    print(f"Starting {extraction_mode} batch extraction for {provider.upper()} provider...")
+
+    provider_prefix = column_prefix(provider_prefix, extraction_mode)
+    pending = [
+        (idx, row['sentence'])
+        for idx, row in df.iterrows()
+        if not has_extraction_result_for_sentence(df, idx, provider_prefix)
+    ]
+    print(f"{len(pending)} of {len(df)} sentences to process, batch state in {state_path}")
+
+    async def extract(idx: int, sentence: str):
+        return idx, await run_extraction_for_sentence(sentence, provider, extraction_mode, batch=True)
+
+    processed_count = 0
+    backend = get_batch_backend(provider)
+    async with batch_llm_calls(backend, state_path, poll_seconds=poll_seconds) as dispatcher:
+        for next_result in asyncio.as_completed([extract(idx, sentence) for idx, sentence in pending]):
+            idx, result = await next_result
+            if result is None:
+                print(f"[WARNING] Error processing sentence {idx + 1}, keeping as None for retry")
+                continue
+            write_extraction_result(df, idx, provider_prefix, result)
+            processed_count += 1
+
+    df.to_csv(output_path, index=False)
+    print(
+        f"[DONE] Completed batch extraction for {provider.upper()}: {processed_count} sentences processed, "
+        f"{dispatcher.submitted_requests} requests in {dispatcher.submitted_batches} batches, "
+        f"{dispatcher.reused_results} results reused from earlier runs"
+    )
+    return df
+
+
 async def run_extraction_phase(
     dataset_path: str,
     output_path: str,
     providers: List[str] = ['openai', 'gemini', 'deepseek'],
-    fresh_run: bool = False
+    fresh_run: bool = False,
+    extraction_mode: str = "two_stage",
+    batch: bool = False,
+    poll_seconds: float = 30.0,
 ):
-    """Run extraction phase for all providers with per-sentence updates."""
+    """Run extraction phase for all providers with per-sentence updates (or in batch mode)."""
     print("Starting extraction phase with all LLMs...")
     print(f"Dataset: {dataset_path}")
     print(f"Output: {output_path}")
     print(f"Providers: {providers}")
     print(f"Fresh Run Mode: {fresh_run}")
+    print(f"Extraction Mode: {extraction_mode}")
+    print(f"Batch Mode: {batch}")
 
     # Load the dataset
     df = pd.read_csv(dataset_path)
     print(f"Loaded dataset with {len(df)} sentences")
 
     # Add required columns if they don't exist
-    df = add_extraction_columns(df)
+    df = add_extraction_columns(df, extraction_mode)
 
     # If fresh run is requested, clear all existing extraction results
     if fresh_run:
         print("Preparing for fresh run - clearing existing results...")
-        required_columns = [
-            'gpt4_extracted_claims_json', 'gpt4_binary_result', 'gpt4_num_claims',
-            'gemini_extracted_claims_json', 'gemini_binary_result', 'gemini_num_claims',
-            'deepseek_extracted_claims_json', 'deepseek_binary_result', 'deepseek_num_claims'
-        ]
-
-        for col in required_columns:
+        for col in extraction_columns(extraction_mode):
             if col in df.columns:
                 df[col] = None  # Reset to None to force re-processing
         print("[OK] Existing extraction results cleared")
@@ -250,7 +346,26 @@ async def run_extraction_phase(
         print(f"\nProcessing provider: {provider.upper()}")
 
         # Run extraction for this provider
-        df = await run_extraction_for_provider(df, provider, provider_prefix, unique_output_path)
+        use_batch = batch and provider in BATCH_PROVIDERS
+        if batch and not use_batch:
+            print(f"[WARNING] No batch API support for {provider}, running it in real time")
+        if use_batch:
+            state_path = batch_state_path(dataset_path, column_prefix(provider_prefix, extraction_mode))
+            if fresh_run:
+                rotate_batch_state(state_path)
+            df = await run_extraction_for_provider_batched(
+                df,
+                provider,
+                provider_prefix,
+                unique_output_path,
+                state_path,
+                extraction_mode,
+                poll_seconds,
+            )
+        else:
+            df = await run_extraction_for_provider(
+                df, provider, provider_prefix, unique_output_path, extraction_mode
+            )
 
     # Final save
     df.to_csv(unique_output_path, index=False)
@@ -279,6 +394,23 @@ async def main():
         action="store_true",
         help="Force a fresh run, clearing existing extraction results and re-processing all sentences"
     )
+    parser.add_argument(
+        "--extraction-mode",
+        choices=EXTRACTION_MODES,
+        default="two_stage",
+        help="Two-stage selection/disambiguation or the fused single-call stage"
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Send LLM calls through the provider batch API (OpenAI only); rerun to resume"
+    )
+    parser.add_argument(
+        "--poll-seconds",
+        type=float,
+        default=30.0,
+        help="Interval between batch status polls in batch mode"
+    )
 
     args = parser.parse_args()
 
@@ -295,7 +427,10 @@ async def main():
     actual_output_path = await run_extraction_phase(
         args.dataset,
         args.output,
-        fresh_run=args.fresh_run
+        fresh_run=args.fresh_run,
+        extraction_mode=args.extraction_mode,
+        batch=args.batch,
+        poll_seconds=args.poll_seconds,
     )
 
     print("[DONE] Extraction phase completed successfully!")
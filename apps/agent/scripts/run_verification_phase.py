@@ -3,7 +3,15 @@
 Script to run the verification phase for all three LLMs on the benchmark claims.
 
 This script runs claim verification for all LLMs on the standardized benchmark,
-with per-claim updates and resume capability for cost protection.
+with per-claim updates and resume capability for cost protection. Input tokens
+per claim, and how many of them the provider served from its prompt cache,
+are recorded next to each verdict.
+
+With --batch, claims are verified concurrently and their LLM calls go through
+the provider's batch API, one batch per verification round (searches stay
+real-time, so --max-concurrent bounds how many claims search at once).
+Batches and their results are kept in a state file next to the benchmark, so
+an interrupted batch run resumes where it stopped when started again.
 """
 
 import argparse
@@ -21,6 +29,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from claim_verifier import graph as claim_verifier_graph
 from claim_extractor.schemas import ValidatedClaim
 from claim_verifier.schemas import VerificationResult, Evidence
+from utils import BATCH_PROVIDERS, LLMUsageTracker, batch_llm_calls, get_batch_backend
 
 
 def generate_unique_filename(base_path: str) -> str:
@@ -83,11 +92,6 @@ async def run_verification_for_claim(claim_data: Dict, provider: str) -> Dict[st
     Returns:
         Dictionary with verification results or None if error
     """
-    # Update provider for this execution
-    from utils.settings import settings
-    original_provider = settings.llm_provider
-    settings.llm_provider = provider
-
     try:
         # Create ValidatedClaim object from the claim data
         validated_claim = ValidatedClaim(**claim_data)
@@ -96,7 +100,15 @@ async def run_verification_for_claim(claim_data: Dict, provider: str) -> Dict[st
             "claim": validated_claim
         }
 
-        result = await claim_verifier_graph.ainvoke(payload)
+        # Select the provider per run instead of mutating global settings
+        usage = LLMUsageTracker()
+        result = await claim_verifier_graph.ainvoke(
+            payload, config={"configurable": {"llm_provider": provider}, "callbacks": [usage]}
+        )
+        token_counts = {
+            'input_tokens': usage.input_tokens,
+            'cached_input_tokens': usage.cached_input_tokens,
+        }
 
         if result:
             # Extract verification result components
@@ -107,7 +119,8 @@ async def run_verification_for_claim(claim_data: Dict, provider: str) -> Dict[st
                     'reasoning': verdict.reasoning,
                     'sources_count': len(verdict.sources) if hasattr(verdict, 'sources') else 0,
                     'sources': serialize_sources(getattr(verdict, 'sources', [])),
-                    'original_claim': validated_claim.claim_text
+                    'original_claim': validated_claim.claim_text,
+                    **token_counts,
                 }
             else:
                 return {
@@ -115,7 +128,8 @@ async def run_verification_for_claim(claim_data: Dict, provider: str) -> Dict[st
                     'reasoning': 'No reasoning provided',
                     'sources_count': 0,
                     'sources': json.dumps([]),
-                    'original_claim': validated_claim.claim_text
+                    'original_claim': validated_claim.claim_text,
+                    **token_counts,
                 }
         else:
             return {
@@ -123,15 +137,20 @@ async def run_verification_for_claim(claim_data: Dict, provider: str) -> Dict[st
                 'reasoning': 'No result from verifier',
                 'sources_count': 0,
                 'sources': json.dumps([]),
-                'original_claim': validated_claim.claim_text
+                'original_claim': validated_claim.claim_text,
+                **token_counts,
             }
     except Exception as e:
         print(f"Error in verification for provider {provider} on claim: {claim_data.get('claim_text', '')[:50]}... - {e}")
         # Return None to indicate error - this allows for retries since the row will remain unprocessed
         return None
-    finally:
-        # Restore original provider
-        settings.llm_provider = original_provider
+
+
+TOKEN_COLUMNS = [
+    f"{provider_prefix}_{suffix}"
+    for provider_prefix in ['gpt4', 'gemini', 'deepseek']
+    for suffix in ['input_tokens', 'cached_input_tokens']
+]
 
 
 def clear_verification_results_for_fresh_run(df: pd.DataFrame) -> pd.DataFrame:
@@ -142,7 +161,7 @@ def clear_verification_results_for_fresh_run(df: pd.DataFrame) -> pd.DataFrame:
         'gpt4_verdict', 'gpt4_reasoning', 'gpt4_sources',
         'gemini_verdict', 'gemini_reasoning', 'gemini_sources',
         'deepseek_verdict', 'deepseek_reasoning', 'deepseek_sources'
-    ]
+    ] + TOKEN_COLUMNS
 
     for col in verification_columns:
         if col in df.columns:
@@ -159,7 +178,7 @@ def add_verification_columns(df: pd.DataFrame) -> pd.DataFrame:
         'gpt4_verdict', 'gpt4_reasoning', 'gpt4_sources',
         'gemini_verdict', 'gemini_reasoning', 'gemini_sources',
         'deepseek_verdict', 'deepseek_reasoning', 'deepseek_sources'
-    ]
+    ] + TOKEN_COLUMNS
 
     for col in required_columns:
         if col not in df.columns:
@@ -192,11 +211,6 @@ async def run_verification_for_provider(
     """Run verification for a single provider across all claims with per-claim updates."""
     print(f"Starting verification for {provider.upper()} provider...")
     
-    # Get provider-specific columns
-    verdict_col = f"{provider_prefix}_verdict"
-    reasoning_col = f"{provider_prefix}_reasoning"
-    sources_col = f"{provider_prefix}_sources"
-    
     total_claims = len(df)
     processed_count = 0
     
@@ -226,9 +240,7 @@ async def run_verification_for_provider(
         # Only update if we got a successful result
         if result is not None:
             # Update the dataframe with results
-            df.at[idx, verdict_col] = result['verdict']
-            df.at[idx, reasoning_col] = result['reasoning']
-            df.at[idx, sources_col] = result.get('sources', json.dumps([]))
+            write_verification_result(df, idx, provider_prefix, result)
             
             processed_count += 1
         else:
@@ -246,13 +258,100 @@ async def run_verification_for_provider(
     return df
 
 
+def write_verification_result(
+    df: pd.DataFrame, idx: int, provider_prefix: str, result: Dict[str, Any]
+) -> None:
+    """Store one claim's verification result in its provider columns."""
+    df.at[idx, f"{provider_prefix}_verdict"] = result['verdict']
+    df.at[idx, f"{provider_prefix}_reasoning"] = result['reasoning']
+    df.at[idx, f"{provider_prefix}_sources"] = result.get('sources', json.dumps([]))
+    df.at[idx, f"{provider_prefix}_input_tokens"] = result['input_tokens']
+    df.at[idx, f"{provider_prefix}_cached_input_tokens"] = result['cached_input_tokens']
+
+
+def batch_state_path(benchmark_path: str, provider_prefix: str) -> str:
+    """State file of a provider's batch run, kept next to the benchmark so reruns find it."""
+    benchmark_path = Path(benchmark_path)
+    return str(benchmark_path.with_name(f"{benchmark_path.stem}.{provider_prefix}.batch.json"))
+
+
+def rotate_batch_state(state_path: str) -> None:
+    """Set a previous run's batch state aside, so a fresh run makes new LLM calls."""
+    if Path(state_path).exists():
+        archived = generate_unique_filename(str(Path(state_path).with_suffix(".previous.json")))
+        Path(state_path).replace(archived)
+        print(f"[OK] Previous batch state moved to {archived}")
+
+
+async def run_verification_for_provider_batched(
+    df: pd.DataFrame,
+    provider: str,
+    provider_prefix: str,
+    output_path: str,
+    state_path: str,
+    max_concurrent: int = 50,
+    poll_seconds: float = 30.0,
+) -> pd.DataFrame:
+    """Run verification for all unprocessed claims through the provider's batch API.
+
+    Up to ``max_concurrent`` claims are verified at once; their LLM calls are
+    collected into provider batches (see utils/batch.py).
+    """
+    print(f"Starting batch verification for {provider.upper()} provider...")
+
+    pending = []
+    for idx, row in df.iterrows():
+        if has_verification_result_for_claim(df, idx, provider_prefix):
+            continue
+        claim_data_str = row['validated_claim_object']
+        if pd.isna(claim_data_str) or claim_data_str == '':
+            print(f"[WARNING] Skipping claim {idx + 1} - no claim data")
+            continue
+        try:
+            pending.append((idx, json.loads(claim_data_str)))
+        except json.JSONDecodeError:
+            print(f"[WARNING] Skipping claim {idx + 1} - invalid JSON")
+    print(f"{len(pending)} of {len(df)} claims to process, batch state in {state_path}")
+
+    slots = asyncio.Semaphore(max_concurrent)
+
+    async def verify(idx: int, claim_data: Dict):
+        async with slots:
+            return idx, await run_verification_for_claim(claim_data, provider)
+
+    processed_count = 0
+    backend = get_batch_backend(provider)
+    async with batch_llm_calls(backend, state_path, poll_seconds=poll_seconds) as dispatcher:
+        for next_result in asyncio.as_completed([verify(idx, data) for idx, data in pending]):
+            idx, result = await next_result
+            if result is None:
+                print(f"[WARNING] Error processing claim {idx + 1}, keeping as None for retry")
+                continue
+            # Token counts come from real-time calls only
+            result.update(input_tokens=None, cached_input_tokens=None)
+            write_verification_result(df, idx, provider_prefix, result)
+            processed_count += 1
+
+    df.to_csv(output_path, index=False)
+    print(
+        f"[DONE] Completed batch verification for {provider.upper()}: {processed_count} claims processed, "
+        f"{dispatcher.submitted_requests} requests in {dispatcher.submitted_batches} batches, "
+        f"{dispatcher.reused_results} results reused from earlier runs"
+    )
+    return df
+
+
 async def run_verification_phase(
     df: pd.DataFrame,
     benchmark_path: str,
     output_path: str,
-    providers: List[str] = ['openai', 'gemini', 'deepseek']
+    providers: List[str] = ['openai', 'gemini', 'deepseek'],
+    fresh_run: bool = False,
+    batch: bool = False,
+    max_concurrent: int = 50,
+    poll_seconds: float = 30.0,
 ):
-    """Run verification phase for all providers with per-claim updates."""
+    """Run verification phase for all providers with per-claim updates (or in batch mode)."""
     print("Starting verification phase with all LLMs...")
     print(f"Benchmark: {benchmark_path}")
     print(f"Output: {output_path}")
@@ -277,7 +376,24 @@ async def run_verification_phase(
         print(f"\nProcessing provider: {provider.upper()}")
         
         # Run verification for this provider
-        df = await run_verification_for_provider(df, provider, provider_prefix, output_path)
+        use_batch = batch and provider in BATCH_PROVIDERS
+        if batch and not use_batch:
+            print(f"[WARNING] No batch API support for {provider}, running it in real time")
+        if use_batch:
+            state_path = batch_state_path(benchmark_path, provider_prefix)
+            if fresh_run:
+                rotate_batch_state(state_path)
+            df = await run_verification_for_provider_batched(
+                df,
+                provider,
+                provider_prefix,
+                output_path,
+                state_path,
+                max_concurrent,
+                poll_seconds,
+            )
+        else:
+            df = await run_verification_for_provider(df, provider, provider_prefix, output_path)
     
     # Final save
     df.to_csv(output_path, index=False)
@@ -304,6 +420,23 @@ async def main():
         action="store_true",
         help="Clear all existing verification results and re-process all claims"
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Send LLM calls through the provider batch API (OpenAI only); rerun to resume"
+    )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=50,
+        help="Claims verified at once in batch mode (their searches run in real time)"
+    )
+    parser.add_argument(
+        "--poll-seconds",
+        type=float,
+        default=30.0,
+        help="Interval between batch status polls in batch mode"
+    )
 
     args = parser.parse_args()
 
@@ -327,7 +460,15 @@ async def main():
         print(f"Using unique output path for fresh run: {args.output}")
 
     # Run verification phase
-    await run_verification_phase(df, args.benchmark, args.output)
+    await run_verification_phase(
+        df,
+        args.benchmark,
+        args.output,
+        fresh_run=args.fresh_run,
+        batch=args.batch,
+        max_concurrent=args.max_concurrent,
+        poll_seconds=args.poll_seconds,
+    )
 
     print("[DONE] Verification phase completed successfully!")
 
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Evaluate and fit the check-worthiness scorer on labelled sentences.
+
+Scores every sentence with the local features from
+fact_checker/check_worthiness.py and reports ROC AUC plus precision/recall
+at the configured min_score against the `contains_factual_claim` labels of
+the thesis dataset. With --output, logistic-regression weights are fitted on
+BingCheck (minus the thesis answers) and written as JSON for
+CHECK_WORTHINESS_CONFIG["weights_path"]; fitting needs the analysis
+dependency group (scikit-learn).
+
+Usage:
+    python scripts/train_check_worthiness.py [--train PATH] [--test PATH] [--output weights.json]
+"""
+
+import argparse
+import csv
+import json
+import math
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fact_checker.check_worthiness import FEATURES, claim_features
+from fact_checker.config import CHECK_WORTHINESS_CONFIG
+
+ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_TRAIN = ROOT / "thesis_latex_files/sources/ground_truth_data-BingCheck/bingcheck.csv"
+DEFAULT_TEST = ROOT / "results/thesis_dataset_empty/my_thesis_dataset_extraction.csv"
+
+
+def load_rows(path: Path) -> List[Dict[str, str]]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def labelled(rows: List[Dict[str, str]]) -> Tuple[List[str], List[int]]:
+    texts = [row["sentence"] for row in rows]
+    labels = [int(row["contains_factual_claim"].strip().lower() == "true") for row in rows]
+    return texts, labels
+
+
+def score(text: str, bias: float, weights: Dict[str, float]) -> float:
+    features = claim_features(text)
+    logit = bias + sum(weights[name] * features[name] for name in FEATURES)
+    return 1 / (1 + math.exp(-logit))
+
+
+def roc_auc(scores: List[float], labels: List[int]) -> float:
+    """Probability that a random positive outscores a random negative."""
+    positives = [s for s, label in zip(scores, labels) if label]
+    negatives = [s for s, label in zip(scores, labels) if not label]
+    if not positives or not negatives:
+        return float("nan")
+    wins = sum((p > n) + 0.5 * (p == n) for p in positives for n in negatives)
+    return wins / (len(positives) * len(negatives))
+
+
+def report(
+    name: str, texts: List[str], labels: List[int], bias: float, weights: Dict[str, float]
+) -> None:
+    scores = [score(text, bias, weights) for text in texts]
+    threshold = CHECK_WORTHINESS_CONFIG["min_score"]
+    kept = [label for s, label in zip(scores, labels) if s >= threshold]
+    precision = sum(kept) / len(kept) if kept else 0.0
+    recall = sum(kept) / sum(labels) if sum(labels) else 0.0
+    print(
+        f"{name:<10} AUC {roc_auc(scores, labels):.3f} | at min_score {threshold}: "
+        f"kept {len(kept)}/{len(texts)}, precision {precision:.3f}, recall {recall:.3f}"
+    )
+
+
+def fit(texts: List[str], labels: List[int]) -> Tuple[float, Dict[str, float]]:
+    try:
+        from sklearn.linear_model import LogisticRegression
+    except ImportError:
+        sys.exit("Fitting needs scikit-learn: poetry install --with analysis")
+
+    matrix = [[claim_features(text)[name] for name in FEATURES] for text in texts]
+    model = LogisticRegression(max_iter=1000).fit(matrix, labels)
+    return float(model.intercept_[0]), dict(zip(FEATURES, map(float, model.coef_[0])))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Evaluate/fit the check-worthiness scorer")
+    parser.add_argument("--train", type=Path, default=DEFAULT_TRAIN)
+    parser.add_argument("--test", type=Path, default=DEFAULT_TEST)
+    parser.add_argument("--output", type=Path, help="Fit weights and write them to this JSON file")
+    args = parser.parse_args()
+
+    test_rows = load_rows(args.test)
+    test_texts, test_labels = labelled(test_rows)
+    print(f"Test set: {len(test_texts)} sentences, {sum(test_labels)} with factual claims")
+    report(
+        "default",
+        test_texts,
+        test_labels,
+        CHECK_WORTHINESS_CONFIG["bias"],
+        CHECK_WORTHINESS_CONFIG["weights"],
+    )
+
+    if not args.output:
+        return
+
+    # Keep the thesis answers out of the training data
+    test_answers = {row["answer_id"] for row in test_rows}
+    train_texts, train_labels = labelled(
+        [row for row in load_rows(args.train) if row["answer_id"] not in test_answers]
+    )
+    bias, weights = fit(train_texts, train_labels)
+    report("trained", test_texts, test_labels, bias, weights)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        trained = {
+            "bias": bias,
+            "weights": weights,
+            "trained_on": str(args.train),
+            "samples": len(train_texts),
+        }
+        json.dump(trained, f, indent=2)
+    print(f"Weights saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
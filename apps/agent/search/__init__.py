@@ -1,5 +1,6 @@
 """Simple search abstraction layer."""
 
+from search.dedup import canonicalize_url, content_fingerprint
 from search.provider import search
 
-__all__ = ["search"]
\ No newline at end of file
+__all__ = ["search", "canonicalize_url", "content_fingerprint"]
@@ -0,0 +1,76 @@
+"""URL canonicalization and content fingerprints for deduplicating results."""
+
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track the visit and never change the page
+TRACKING_PARAMS = frozenset(
+    {
+        "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+        "ref_src", "ref_url", "referrer", "spm", "_ga", "_gl", "cmpid", "ncid",
+        "sr_share", "amp", "outputtype",
+    }
+)
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_", "oly_")
+
+_HOST_PREFIXES = ("www.", "m.", "amp.", "mobile.")
+_AMP_PATH = re.compile(r"/(?:amp|amp\.html)$|\.amp(?=\.html?$|$)")
+# Google AMP cache: https://<x>.cdn.ampproject.org/c/s/<host>/<path>
+_AMP_CACHE = re.compile(r"^[^/]+\.cdn\.ampproject\.org/(?:[a-z]/)*(?:s/)?", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def canonicalize_url(url: str) -> str:
+    """Reduce a URL to a canonical form for duplicate detection.
+
+    Drops the scheme distinction, "www."/mobile/AMP hosts and AMP paths,
+    default ports, fragments, tracking parameters and trailing slashes, and
+    sorts the remaining query parameters. Meant for comparison only - it is
+    not guaranteed to be a working URL. URLs that cannot be parsed are
+    returned stripped but otherwise unchanged.
+    """
+    url = url.strip()
+    if not url:
+        return url
+
+    try:
+        parts = urlsplit(url if "://" in url else f"https://{url}")
+    except ValueError:  # e.g. an unclosed IPv6 bracket
+        return url
+
+    host_and_path = f"{parts.netloc}{parts.path}"
+    amp_cache = _AMP_CACHE.match(host_and_path)
+    if amp_cache:
+        try:
+            parts = urlsplit(f"https://{host_and_path[amp_cache.end():]}?{parts.query}")
+        except ValueError:
+            return url
+
+    host = (parts.hostname or "").lower()
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix) and host.count(".") > 1:
+            host = host[len(prefix):]
+            break
+    try:
+        port = parts.port
+    except ValueError:  # out of range or not a number: keep it as written
+        port = parts.netloc.rpartition(":")[2]
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+
+    path = _AMP_PATH.sub("", parts.path).rstrip("/")
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def content_fingerprint(text: str) -> str:
+    """Hash of case- and whitespace-normalized text, for spotting mirrored content."""
+    normalized = _WHITESPACE.sub(" ", text).strip().lower()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
@@ -5,12 +5,11 @@ import logging
 import os
 from typing import List
 
-import aiohttp
-from langchain_exa import ExaSearchRetriever
-from langchain_tavily import TavilySearch
-
 from search.models import SearchResult
 
+# Provider clients (aiohttp, langchain_exa, langchain_tavily) are imported on
+# first use so only the configured provider's SDK is ever loaded.
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +22,8 @@ def _validate_max_results(max_results: int) -> int:
 
 async def _retry_request(func, max_retries: int = 2):
     """Retry network requests with exponential backoff."""
+    import aiohttp
+
     for attempt in range(max_retries + 1):
         try:
             return await func()
@@ -65,6 +66,8 @@ async def _search_brave(query: str, max_results: int) -> List[SearchResult]:
     api_key = os.getenv("BRAVE_API_KEY")
     if not api_key:
         raise ValueError("BRAVE_API_KEY not found in environment")
+
+    import aiohttp
     
     url = "https://api.search.brave.com/res/v1/web/search"
     headers = {"X-Subscription-Token": api_key}
@@ -106,6 +109,8 @@ async def _search_exa(query: str, max_results: int) -> List[SearchResult]:
     api_key = os.getenv("EXA_API_KEY")
     if not api_key:
         raise ValueError("EXA_API_KEY not found in environment")
+
+    from langchain_exa import ExaSearchRetriever
     
     retriever = ExaSearchRetriever(
         k=max_results,
@@ -131,6 +136,8 @@ async def _search_tavily(query: str, max_results: int) -> List[SearchResult]:
     api_key = os.getenv("TAVILY_API_KEY")
     if not api_key:
         raise ValueError("TAVILY_API_KEY not found in environment")
+
+    from langchain_tavily import TavilySearch
     
     search_client = TavilySearch(
         api_key=api_key,
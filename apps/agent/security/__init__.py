@@ -3,15 +3,21 @@
 from .api_keys import (
     generate_secure_api_key,
     get_api_keys,
+    iter_api_keys,
     revoke_api_key,
     store_api_key,
     validate_api_key,
 )
+from .rate_limit import get_usage, meter_request, release_run_lease
 
 __all__ = [
     "generate_secure_api_key",
     "get_api_keys",
+    "iter_api_keys",
     "revoke_api_key",
     "store_api_key",
     "validate_api_key",
+    "get_usage",
+    "meter_request",
+    "release_run_lease",
 ]
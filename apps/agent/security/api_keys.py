@@ -3,6 +3,9 @@
 import secrets
 import string
 from datetime import datetime
+from typing import AsyncIterator, Iterable
+
+import redis.asyncio as redis
 
 from utils.redis import redis_client
 
@@ -10,7 +13,11 @@ from utils.redis import redis_client
 API_KEY_LENGTH = 32
 API_KEY_PREFIX = "api_key:"
 API_KEYS_SET = "api_keys"
+# Pub/sub channel telling auth processes to drop a key from their local cache
+API_KEY_INVALIDATION_CHANNEL = "api_keys:invalidate"
 ALPHABET = string.ascii_letters + string.digits
+# Keys fetched per SSCAN page / pipeline round trip when listing
+LIST_BATCH_SIZE = 500
 
 
 def generate_secure_api_key(length: int = API_KEY_LENGTH) -> str:
@@ -29,32 +36,61 @@ async def store_api_key(api_key: str, description: str = "") -> None:
 
         await client.hset(f"{API_KEY_PREFIX}{api_key}", mapping=key_data)
         await client.sadd(API_KEYS_SET, api_key)
+        # Clear any negative cache entry so the new key works immediately
+        await client.publish(API_KEY_INVALIDATION_CHANNEL, api_key)
+
+
+async def _fetch_key_metadata(
+    client: redis.Redis, api_keys: Iterable[bytes]
+) -> list[dict]:
+    """Fetch metadata for a batch of keys in a single pipelined round trip."""
+    key_strs = [api_key.decode() for api_key in api_keys]
+
+    async with client.pipeline(transaction=False) as pipe:
+        for key_str in key_strs:
+            pipe.hgetall(f"{API_KEY_PREFIX}{key_str}")
+        results = await pipe.execute()
+
+    return [
+        {
+            "key": key_str,
+            "description": key_data.get(b"description", b"").decode(),
+            "created_at": key_data.get(b"created_at", b"").decode(),
+            "active": key_data.get(b"active", b"").decode(),
+        }
+        for key_str, key_data in zip(key_strs, results)
+        if key_data
+    ]
 
 
-async def get_api_keys() -> list[dict]:
-    """Get all stored API keys with their metadata."""
-    async with redis_client() as client:
-        api_keys = await client.smembers(API_KEYS_SET)
+async def iter_api_keys(batch_size: int = LIST_BATCH_SIZE) -> AsyncIterator[dict]:
+    """Stream stored API keys with their metadata.
 
-        if not api_keys:
-            return []
-
-        keys_data = []
-        for api_key in api_keys:
-            key_str = api_key.decode()
-            key_data = await client.hgetall(f"{API_KEY_PREFIX}{key_str}")
+    Walks the key set with SSCAN and fetches each page's metadata with one
+    pipeline, so memory and latency stay flat regardless of how many keys exist.
+    SSCAN may return a member more than once, so repeats are skipped.
+    """
+    async with redis_client() as client:
+        seen: set[bytes] = set()
+        batch: list[bytes] = []
+        async for api_key in client.sscan_iter(API_KEYS_SET, count=batch_size):
+            if api_key in seen:
+                continue
+            seen.add(api_key)
+            batch.append(api_key)
+            if len(batch) >= batch_size:
+                for key_data in await _fetch_key_metadata(client, batch):
+                    yield key_data
+                batch = []
+
+        if batch:
+            for key_data in await _fetch_key_metadata(client, batch):
+                yield key_data
 
-            if key_data:
-                keys_data.append(
-                    {
-                        "key": key_str,
-                        "description": key_data.get(b"description", b"").decode(),
-                        "created_at": key_data.get(b"created_at", b"").decode(),
-                        "active": key_data.get(b"active", b"").decode(),
-                    }
-                )
 
-        return keys_data
+async def get_api_keys() -> list[dict]:
+    """Get all stored API keys with their metadata."""
+    return [key_data async for key_data in iter_api_keys()]
 
 
 async def revoke_api_key(api_key: str) -> bool:
@@ -65,6 +101,7 @@ async def revoke_api_key(api_key: str) -> bool:
 
         await client.delete(f"{API_KEY_PREFIX}{api_key}")
         await client.srem(API_KEYS_SET, api_key)
+        await client.publish(API_KEY_INVALIDATION_CHANNEL, api_key)
         return True
 
 
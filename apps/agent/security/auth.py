@@ -1,34 +1,93 @@
+import asyncio
+import logging
+import re
+from typing import Optional
+
 import redis.asyncio as redis
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator
 
 from langgraph_sdk import Auth
+from utils.cache import TTLCache
+from utils.redis import get_redis, redis_client
 from utils.settings import settings
-from security.api_keys import API_KEY_PREFIX
+from security.api_keys import API_KEY_INVALIDATION_CHANNEL, API_KEY_PREFIX
+from security.rate_limit import CONCURRENCY_LIMITED, meter_request
+
+logger = logging.getLogger(__name__)
 
 auth = Auth()
 
 BEARER_SCHEME = "bearer"
 
+# POST paths that start a run and therefore consume a concurrency slot
+RUN_CREATE_PATH = re.compile(r"^(/threads/[^/]+)?/runs(/stream|/wait|/batch)?/?$")
 
-@asynccontextmanager
-async def redis_client() -> AsyncGenerator[redis.Redis, None]:
-    """Redis client context manager for proper connection handling."""
-    client = redis.from_url(str(settings.redis_uri))
-    try:
-        yield client
-    finally:
-        await client.aclose()
+# Log cache statistics every N lookups
+CACHE_STATS_LOG_INTERVAL = 1000
+
+# Validated (True) and rejected (False) keys; rejections use a shorter TTL
+api_key_cache: TTLCache[str, bool] = TTLCache(
+    max_size=settings.api_key_cache_size, ttl=settings.api_key_cache_ttl
+)
+
+_invalidation_listener: Optional[asyncio.Task] = None
+
+
+async def _listen_for_invalidations() -> None:
+    """Drop cached keys when they are revoked or (re)created elsewhere."""
+    while True:
+        pubsub = get_redis().pubsub()
+        try:
+            await pubsub.subscribe(API_KEY_INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    api_key_cache.invalidate(message["data"].decode())
+        except asyncio.CancelledError:
+            raise
+        except redis.RedisError as e:
+            # Messages may have been missed while disconnected
+            logger.warning(f"API key invalidation listener lost connection: {e}")
+            api_key_cache.clear()
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.aclose()
+
+
+def _ensure_invalidation_listener() -> None:
+    """Start the pub/sub listener on the running loop if it isn't running."""
+    global _invalidation_listener
+    if _invalidation_listener is None or _invalidation_listener.done():
+        _invalidation_listener = asyncio.create_task(_listen_for_invalidations())
+
+
+def _record_lookup() -> None:
+    lookups = api_key_cache.hits + api_key_cache.misses
+    if lookups and lookups % CACHE_STATS_LOG_INTERVAL == 0:
+        logger.info(f"API key cache stats: {api_key_cache.stats()}")
 
 
 async def _verify_api_key(api_key: str) -> bool:
-    """Verify API key exists in Redis."""
+    """Verify API key exists in Redis, consulting the local cache first."""
+    _ensure_invalidation_listener()
+
+    cached = api_key_cache.get(api_key)
+    _record_lookup()
+    if cached is not None:
+        return cached
+
     try:
         async with redis_client() as client:
-            return bool(await client.exists(f"{API_KEY_PREFIX}{api_key}"))
+            is_valid = bool(await client.exists(f"{API_KEY_PREFIX}{api_key}"))
     except redis.RedisError:
+        # Don't cache infrastructure failures
         return False
 
+    api_key_cache.set(
+        api_key,
+        is_valid,
+        ttl=None if is_valid else settings.api_key_cache_negative_ttl,
+    )
+    return is_valid
+
 
 def _parse_authorization(authorization: str) -> str:
     """Parse and validate authorization header, returning the token."""
@@ -46,9 +105,35 @@ def _parse_authorization(authorization: str) -> str:
     return token
 
 
+async def _enforce_quota(api_key: str, method: str, path: str) -> Optional[str]:
+    """Apply the per-key request rate limit and concurrent-run quota.
+
+    Returns:
+        The run lease for run-creating requests that took a slot, else None
+    """
+    is_run = method.upper() == "POST" and bool(RUN_CREATE_PATH.match(path))
+    result = await meter_request(api_key, is_run=is_run)
+
+    if result.allowed:
+        return result.run_lease
+
+    if result.status == CONCURRENCY_LIMITED:
+        raise Auth.exceptions.HTTPException(
+            429, f"Too many concurrent runs ({result.active_runs} active)"
+        )
+
+    raise Auth.exceptions.HTTPException(
+        429,
+        "Rate limit exceeded",
+        headers={"Retry-After": str(max(1, round(result.retry_after_seconds)))},
+    )
+
+
 @auth.authenticate
-async def get_current_user(authorization: str | None) -> Auth.types.MinimalUserDict:
-    """Authenticate user via API key stored in Redis."""
+async def get_current_user(
+    authorization: str | None, method: str = "GET", path: str = ""
+) -> Auth.types.MinimalUserDict:
+    """Authenticate user via API key stored in Redis and meter its usage."""
     if not authorization:
         raise Auth.exceptions.HTTPException(401, "Missing authorization header")
 
@@ -57,4 +142,11 @@ async def get_current_user(authorization: str | None) -> Auth.types.MinimalUserD
     if not await _verify_api_key(token):
         raise Auth.exceptions.HTTPException(401, "Invalid API key")
 
-    return {"identity": f"{API_KEY_PREFIX}{token[:8]}..."}
+    user = {"identity": f"{API_KEY_PREFIX}{token[:8]}..."}
+    if settings.rate_limit_enabled:
+        run_lease = await _enforce_quota(token, method, path)
+        if run_lease:
+            # Reaches the run as configurable.langgraph_auth_user, see release_run_lease
+            user["run_lease"] = run_lease
+
+    return user
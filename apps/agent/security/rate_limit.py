@@ -0,0 +1,191 @@
+"""Per-API-key request rate limiting and concurrent-run quotas.
+
+Both checks run in one atomic Lua script, so metering an authenticated
+request costs a single Redis round trip.
+
+Concurrent runs are tracked as leases: each run-creating request takes a
+slot, which the auth handler hands to the run as langgraph_auth_user's
+run_lease. The graphs' final nodes release it with release_run_lease; runs
+that fail before then keep the slot until RATE_LIMIT_RUN_LEASE_SECONDS.
+"""
+
+import hashlib
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+import redis.asyncio as redis
+from langchain_core.runnables import RunnableConfig
+from langgraph.constants import NS_SEP
+
+from utils.redis import redis_client
+from utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Key prefixes
+RATE_WINDOW_PREFIX = "rate:"
+RUN_LEASES_PREFIX = "runs:"
+USAGE_PREFIX = "usage:"
+
+# Script outcomes
+ALLOWED = 1
+RATE_LIMITED = 0
+CONCURRENCY_LIMITED = -1
+
+# KEYS: rate window zset, run lease zset, usage counters hash
+# ARGV: now_ms, window_ms, max_requests, member, max_runs, lease_ms, is_run
+# Returns: {status, requests_in_window, retry_after_ms, active_runs}
+METER_REQUEST_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local max_requests = tonumber(ARGV[3])
+local member = ARGV[4]
+local max_runs = tonumber(ARGV[5])
+local lease = tonumber(ARGV[6])
+local is_run = ARGV[7] == "1"
+
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now - window)
+local requests = redis.call("ZCARD", KEYS[1])
+if requests >= max_requests then
+    local oldest = redis.call("ZRANGE", KEYS[1], 0, 0, "WITHSCORES")
+    redis.call("HINCRBY", KEYS[3], "rate_limited", 1)
+    return {0, requests, tonumber(oldest[2]) + window - now, 0}
+end
+
+local runs = 0
+if is_run then
+    redis.call("ZREMRANGEBYSCORE", KEYS[2], "-inf", now)
+    runs = redis.call("ZCARD", KEYS[2])
+    if runs >= max_runs then
+        redis.call("HINCRBY", KEYS[3], "concurrency_limited", 1)
+        return {-1, requests, 0, runs}
+    end
+    redis.call("ZADD", KEYS[2], now + lease, member)
+    redis.call("PEXPIRE", KEYS[2], lease)
+    redis.call("HINCRBY", KEYS[3], "runs", 1)
+    runs = runs + 1
+end
+
+redis.call("ZADD", KEYS[1], now, member)
+redis.call("PEXPIRE", KEYS[1], window)
+redis.call("HINCRBY", KEYS[3], "requests", 1)
+return {1, requests + 1, 0, runs}
+"""
+
+
+@dataclass
+class MeterResult:
+    """Outcome of metering one request."""
+
+    status: int
+    requests_in_window: int
+    retry_after_seconds: float
+    active_runs: int
+    run_lease: Optional[str] = None
+
+    @property
+    def allowed(self) -> bool:
+        return self.status == ALLOWED
+
+
+def _run_leases_key(api_key: str) -> str:
+    """Lease set of a key, named by digest since leases travel in run config."""
+    return f"{RUN_LEASES_PREFIX}{hashlib.sha256(api_key.encode()).hexdigest()}"
+
+
+async def meter_request(api_key: str, is_run: bool = False) -> MeterResult:
+    """Count a request against the key's sliding window and run quota.
+
+    Args:
+        api_key: The authenticated API key
+        is_run: Whether the request starts a run and needs a concurrency slot
+
+    Returns:
+        MeterResult, with the run's lease if it took a slot; fails open
+        (allowed) if Redis is unavailable
+    """
+    now_ms = int(time.time() * 1000)
+    member = f"{now_ms}-{uuid.uuid4().hex}"
+    keys = [
+        f"{RATE_WINDOW_PREFIX}{api_key}",
+        _run_leases_key(api_key),
+        f"{USAGE_PREFIX}{api_key}",
+    ]
+    args = [
+        now_ms,
+        int(settings.rate_limit_window_seconds * 1000),
+        settings.rate_limit_requests,
+        member,
+        settings.rate_limit_max_concurrent_runs,
+        int(settings.rate_limit_run_lease_seconds * 1000),
+        "1" if is_run else "0",
+    ]
+
+    try:
+        async with redis_client() as client:
+            script = client.register_script(METER_REQUEST_SCRIPT)
+            status, requests, retry_after_ms, runs = await script(keys=keys, args=args)
+    except redis.RedisError as e:
+        # Metering is protective, not authoritative - don't lock everyone out
+        logger.warning(f"Rate limiter unavailable, allowing request: {e}")
+        return MeterResult(ALLOWED, 0, 0.0, 0)
+
+    run_lease = f"{keys[1]}|{member}" if is_run and int(status) == ALLOWED else None
+    return MeterResult(int(status), int(requests), int(retry_after_ms) / 1000, int(runs), run_lease)
+
+
+def _run_lease(config: Optional[RunnableConfig]) -> Optional[str]:
+    configurable = (config or {}).get("configurable") or {}
+    if NS_SEP in configurable.get("checkpoint_ns", ""):
+        return None  # Running as a subgraph: the parent run still holds the slot
+    user = configurable.get("langgraph_auth_user")
+    try:
+        return user["run_lease"] if user is not None else None
+    except (KeyError, TypeError):
+        return None
+
+
+async def release_run_lease(config: Optional[RunnableConfig]) -> None:
+    """Free the run's concurrency slot; called from a graph's final node(s).
+
+    A no-op for unauthenticated runs (local scripts, tests) and subgraphs.
+    """
+    run_lease = _run_lease(config)
+    if not run_lease:
+        return
+
+    key, member = run_lease.rsplit("|", 1)
+    try:
+        async with redis_client() as client:
+            await client.zrem(key, member)
+    except redis.RedisError as e:
+        # The lease still expires on its own
+        logger.warning(f"Could not release run lease: {e}")
+
+
+async def get_usage(api_key: str) -> dict:
+    """Read current window usage, active runs and lifetime counters for a key."""
+    now_ms = int(time.time() * 1000)
+    window_ms = int(settings.rate_limit_window_seconds * 1000)
+
+    async with redis_client() as client:
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.zcount(f"{RATE_WINDOW_PREFIX}{api_key}", now_ms - window_ms + 1, "+inf")
+            pipe.zcount(_run_leases_key(api_key), now_ms + 1, "+inf")
+            pipe.hgetall(f"{USAGE_PREFIX}{api_key}")
+            requests_in_window, active_runs, counters = await pipe.execute()
+
+    return {
+        "requests_in_window": requests_in_window,
+        "request_limit": settings.rate_limit_requests,
+        "window_seconds": settings.rate_limit_window_seconds,
+        "active_runs": active_runs,
+        "run_limit": settings.rate_limit_max_concurrent_runs,
+        "total_requests": int(counters.get(b"requests", 0)),
+        "total_runs": int(counters.get(b"runs", 0)),
+        "rate_limited": int(counters.get(b"rate_limited", 0)),
+        "concurrency_limited": int(counters.get(b"concurrency_limited", 0)),
+    }
@@ -0,0 +1,23 @@
+"""Claim factories shared by the unit tests."""
+
+from typing import Optional
+
+from claim_extractor.schemas import PotentialClaim, ValidatedClaim
+
+
+def potential_claim(text: str, index: int = 0) -> PotentialClaim:
+    """A decomposed claim whose disambiguated sentence is the claim itself."""
+    return PotentialClaim(claim_text=text, disambiguated_sentence=text, original_index=index)
+
+
+def validated_claim(
+    text: str, index: int = 0, original_sentence: Optional[str] = None
+) -> ValidatedClaim:
+    """A valid claim taken verbatim from its sentence unless one is given."""
+    return ValidatedClaim(
+        claim_text=text,
+        is_complete_declarative=True,
+        disambiguated_sentence=text,
+        original_sentence=text if original_sentence is None else original_sentence,
+        original_index=index,
+    )
@@ -0,0 +1,83 @@
+"""Unit tests for listing API keys in pipelined SSCAN pages."""
+
+import unittest
+from contextlib import asynccontextmanager
+from unittest import mock
+
+from security import api_keys
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.keys = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def hgetall(self, key):
+        self.keys.append(key)
+
+    async def execute(self):
+        self.client.executed.append(list(self.keys))
+        return [self.client.hashes.get(key, {}) for key in self.keys]
+
+
+class FakeRedis:
+    def __init__(self, members):
+        self.members = members
+        self.hashes = {
+            f"{api_keys.API_KEY_PREFIX}{member.decode()}": {
+                b"description": member.upper(),
+                b"created_at": b"2024-01-01",
+                b"active": b"true",
+            }
+            for member in members
+        }
+        self.executed = []
+
+    async def sscan_iter(self, name, count=None):
+        for member in self.members:
+            yield member
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class IterApiKeysTests(unittest.IsolatedAsyncioTestCase):
+    async def _list(self, members, batch_size):
+        self.fake = FakeRedis(members)
+
+        @asynccontextmanager
+        async def fake_client():
+            yield self.fake
+
+        with mock.patch.object(api_keys, "redis_client", fake_client):
+            return [key_data async for key_data in api_keys.iter_api_keys(batch_size)]
+
+    async def test_fetches_each_page_with_one_pipeline(self):
+        listed = await self._list([b"k1", b"k2", b"k3", b"k4", b"k5"], batch_size=2)
+
+        self.assertEqual([key["key"] for key in listed], ["k1", "k2", "k3", "k4", "k5"])
+        self.assertEqual(listed[0]["description"], "K1")
+        self.assertEqual(
+            self.fake.executed,
+            [
+                ["api_key:k1", "api_key:k2"],
+                ["api_key:k3", "api_key:k4"],
+                ["api_key:k5"],
+            ],
+        )
+
+    async def test_skips_members_sscan_returns_twice(self):
+        listed = await self._list([b"k1", b"k2", b"k1", b"k3", b"k2"], batch_size=2)
+
+        self.assertEqual([key["key"] for key in listed], ["k1", "k2", "k3"])
+        self.assertEqual(self.fake.executed, [["api_key:k1", "api_key:k2"], ["api_key:k3"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+"""Unit tests for the API key validation cache and request metering in the auth handler."""
+
+import unittest
+from contextlib import asynccontextmanager
+from unittest import mock
+
+from langgraph_sdk import Auth
+
+from security import auth, rate_limit, release_run_lease
+from security.rate_limit import ALLOWED, CONCURRENCY_LIMITED, RATE_LIMITED, MeterResult
+from utils.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TTLCacheTests(unittest.TestCase):
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = TTLCache(max_size=10, ttl=5, clock=clock)
+        cache.set("a", True)
+        cache.set("b", False, ttl=1)
+
+        clock.now = 2
+        self.assertTrue(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+
+        clock.now = 6
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 2)
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+
+class FakeRedis:
+    def __init__(self, keys):
+        self.keys = set(keys)
+        self.calls = 0
+
+    async def exists(self, key):
+        self.calls += 1
+        return int(key in self.keys)
+
+
+class AuthCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.fake = FakeRedis({f"{auth.API_KEY_PREFIX}good"})
+
+        @asynccontextmanager
+        async def fake_client():
+            yield self.fake
+
+        self.cache = TTLCache(max_size=10, ttl=60)
+        patches = [
+            mock.patch.object(auth, "redis_client", fake_client),
+            mock.patch.object(auth, "api_key_cache", self.cache),
+            mock.patch.object(auth, "_ensure_invalidation_listener", lambda: None),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_valid_and_invalid_keys_are_cached(self):
+        for _ in range(3):
+            self.assertTrue(await auth._verify_api_key("good"))
+            self.assertFalse(await auth._verify_api_key("bad"))
+
+        self.assertEqual(self.fake.calls, 2)
+        self.assertEqual(self.cache.hits, 4)
+
+    async def test_invalidation_forces_fresh_lookup(self):
+        self.assertTrue(await auth._verify_api_key("good"))
+
+        # Simulate a revocation message from another process
+        self.fake.keys.clear()
+        self.cache.invalidate("good")
+
+        self.assertFalse(await auth._verify_api_key("good"))
+        self.assertEqual(self.fake.calls, 2)
+
+
+class QuotaEnforcementTests(unittest.IsolatedAsyncioTestCase):
+    async def _enforce(self, result, method="POST", path="/threads/t1/runs/stream"):
+        calls = []
+
+        async def fake_meter(api_key, is_run=False):
+            calls.append(is_run)
+            return result
+
+        with mock.patch.object(auth, "meter_request", fake_meter):
+            await auth._enforce_quota("key", method, path)
+        return calls
+
+    async def test_only_run_creation_takes_a_slot(self):
+        allowed = MeterResult(ALLOWED, 1, 0.0, 1)
+        self.assertEqual(await self._enforce(allowed), [True])
+        self.assertEqual(await self._enforce(allowed, path="/runs/wait"), [True])
+        self.assertEqual(await self._enforce(allowed, method="GET"), [False])
+        self.assertEqual(await self._enforce(allowed, path="/threads/t1/state"), [False])
+
+    async def test_rejections_map_to_429(self):
+        with self.assertRaises(Auth.exceptions.HTTPException) as ctx:
+            await self._enforce(MeterResult(RATE_LIMITED, 120, 12.4, 0))
+        self.assertEqual(ctx.exception.status_code, 429)
+        self.assertEqual(ctx.exception.headers["Retry-After"], "12")
+
+        with self.assertRaises(Auth.exceptions.HTTPException) as ctx:
+            await self._enforce(MeterResult(CONCURRENCY_LIMITED, 3, 0.0, 3))
+        self.assertEqual(ctx.exception.status_code, 429)
+
+
+class FakeLeases:
+    def __init__(self, key, members):
+        self.leases = {key: set(members)}
+
+    async def zrem(self, key, member):
+        self.leases.get(key, set()).discard(member)
+
+
+class RunLeaseTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.fake = FakeLeases("runs:abc", {"1-a", "2-b"})
+
+        @asynccontextmanager
+        async def fake_client():
+            yield self.fake
+
+        patcher = mock.patch.object(rate_limit, "redis_client", fake_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_run_creation_hands_its_lease_to_the_run(self):
+        async def fake_meter(api_key, is_run=False):
+            return MeterResult(ALLOWED, 1, 0.0, 1, "runs:abc|1-a" if is_run else None)
+
+        with mock.patch.multiple(
+            auth, meter_request=fake_meter, _verify_api_key=mock.AsyncMock(return_value=True)
+        ):
+            run_user = await auth.get_current_user("Bearer key", "POST", "/threads/t1/runs/stream")
+            other_user = await auth.get_current_user("Bearer key", "GET", "/threads/t1/state")
+
+        self.assertEqual(run_user["run_lease"], "runs:abc|1-a")
+        self.assertNotIn("run_lease", other_user)
+
+    async def test_final_node_releases_only_the_top_level_runs_lease(self):
+        user = {"identity": "apikey:key...", "run_lease": "runs:abc|1-a"}
+
+        await release_run_lease({"configurable": {"langgraph_auth_user": user, "checkpoint_ns": "a:1|b:2"}})
+        await release_run_lease({"configurable": {}})
+        self.assertEqual(self.fake.leases["runs:abc"], {"1-a", "2-b"})
+
+        await release_run_lease({"configurable": {"langgraph_auth_user": user, "checkpoint_ns": "a:1"}})
+        self.assertEqual(self.fake.leases["runs:abc"], {"2-b"})
+
+
+if __name__ == "__main__":
+    unittest.main()
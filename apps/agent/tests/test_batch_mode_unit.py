@@ -0,0 +1,199 @@
+"""Unit tests for the provider batch-API mode, using the local stand-in backend."""
+
+import asyncio
+import json
+import tempfile
+import unittest
+from contextlib import ExitStack
+from pathlib import Path
+from unittest import mock
+
+from pydantic import BaseModel
+
+from claim_extractor.agent import create_graph
+from claim_extractor.memo import clear_memo
+from claim_extractor.nodes import decomposition, disambiguation, selection, validation
+from utils import (
+    LocalBatchBackend,
+    OpenAIBatchBackend,
+    batch_llm_calls,
+    call_llm_with_structured_output,
+    get_batch_backend,
+)
+
+SENTENCES = [
+    "Jane Doe founded TurboCorp in 2010.",
+    "The Eiffel Tower is in Paris.",
+    "Water boils at 100 degrees Celsius.",
+]
+
+OPTIONS = {"collect_seconds": 0.01, "poll_seconds": 0}
+
+
+class FakeLLM:
+    model_name = "gpt-test"
+    temperature = 0.2
+
+    def with_structured_output(self, output_class):
+        raise AssertionError("batch mode must not call the real-time API")
+
+
+class Answer(BaseModel):
+    text: str
+
+
+def _respond(request):
+    human = request.messages[-1]["content"]
+    if request.schema_name == "SelectionOutput":
+        sentence = human.rsplit("Sentence:", 1)[1].strip()
+        return json.dumps(
+            {"processed_sentence": sentence, "no_verifiable_claims": False, "remains_unchanged": True}
+        )
+    if request.schema_name == "DisambiguationOutput":
+        sentence = human.rsplit("Sentence:", 1)[1].strip()
+        return json.dumps({"disambiguated_sentence": sentence, "cannot_be_disambiguated": False})
+    if request.schema_name == "DecompositionOutput":
+        return json.dumps({"claims": [human.rsplit("Sentence:", 1)[1].strip()], "no_claims": False})
+    if request.schema_name == "BatchValidationOutput":
+        count = len(human.split("Claims:", 1)[1].strip().splitlines())
+        return json.dumps(
+            {"results": [{"index": i, "is_complete_declarative": True} for i in range(1, count + 1)]}
+        )
+    if request.schema_name == "ValidationOutput":
+        return json.dumps({"is_complete_declarative": True})
+    return json.dumps({"text": human.upper()})
+
+
+class BatchedExtractionTests(unittest.TestCase):
+    def setUp(self):
+        clear_memo()
+
+    def test_concurrent_runs_share_one_batch_per_stage(self):
+        backend = LocalBatchBackend(_respond)
+
+        async def run():
+            graph = create_graph()
+            async with batch_llm_calls(backend, **OPTIONS):
+                return await asyncio.gather(
+                    *[
+                        graph.ainvoke(
+                            {"answer_text": sentence},
+                            {"configurable": {"sentence_segmenter": "regex", "memoize": False}},
+                        )
+                        for sentence in SENTENCES
+                    ]
+                )
+
+        with ExitStack() as stack:
+            for module in (selection, disambiguation, decomposition, validation):
+                stack.enter_context(mock.patch.object(module, "get_llm", lambda **kwargs: FakeLLM()))
+            results = asyncio.run(run())
+
+        self.assertEqual(
+            [[claim.claim_text for claim in result["validated_claims"]] for result in results],
+            [[sentence] for sentence in SENTENCES],
+        )
+        stages = [{request.schema_name for request in batch} for batch in backend.batches.values()]
+        self.assertEqual(
+            stages,
+            [{"SelectionOutput"}, {"DisambiguationOutput"}, {"DecompositionOutput"}, {"ValidationOutput"}],
+        )
+        # Three voting completions per sentence for selection, each with its own id
+        first_batch = next(iter(backend.batches.values()))
+        self.assertEqual(len({request.custom_id for request in first_batch}), 3 * len(SENTENCES))
+
+
+class BatchDispatcherTests(unittest.TestCase):
+    def _ask(self, backend, prompts, state_path=None, timeout=None):
+        async def run():
+            async with batch_llm_calls(backend, state_path, **OPTIONS):
+                calls = asyncio.gather(
+                    *[
+                        call_llm_with_structured_output(FakeLLM(), Answer, [("human", prompt)])
+                        for prompt in prompts
+                    ]
+                )
+                return await asyncio.wait_for(calls, timeout)
+
+        return asyncio.run(run())
+
+    def test_resumes_from_recorded_results_without_resubmitting(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            state_path = str(Path(tmp) / "batch_state.json")
+            first = self._ask(LocalBatchBackend(_respond), ["a", "b"], state_path)
+
+            def unreachable(request):
+                raise AssertionError("resubmitted")
+
+            backend = LocalBatchBackend(unreachable)
+            second = self._ask(backend, ["a", "b"], state_path)
+
+        self.assertEqual([answer.text for answer in second], ["A", "B"])
+        self.assertEqual(second, first)
+        self.assertEqual(backend.batches, {})
+
+    def test_resumes_polling_a_batch_submitted_before_an_interruption(self):
+        backend = LocalBatchBackend(_respond, pending_polls=10**9)
+        with tempfile.TemporaryDirectory() as tmp:
+            state_path = str(Path(tmp) / "batch_state.json")
+            with self.assertRaises(asyncio.TimeoutError):
+                self._ask(backend, ["a"], state_path, timeout=0.2)
+
+            backend.pending_polls = 0
+            answers = self._ask(backend, ["a"], state_path)
+
+        self.assertEqual([answer.text for answer in answers], ["A"])
+        self.assertEqual(len(backend.batches), 1)
+
+    def test_failed_requests_return_none_and_are_resubmitted_on_rerun(self):
+        def flaky(request):
+            if "b" in request.messages[-1]["content"]:
+                raise RuntimeError("server error")
+            return _respond(request)
+
+        backend = LocalBatchBackend(flaky)
+        with tempfile.TemporaryDirectory() as tmp:
+            state_path = str(Path(tmp) / "batch_state.json")
+            answers = self._ask(backend, ["a", "b"], state_path)
+            backend.respond = _respond
+            retried = self._ask(backend, ["a", "b"], state_path)
+
+        self.assertEqual(answers[0].text, "A")
+        self.assertIsNone(answers[1])
+        self.assertEqual(retried[1].text, "B")
+        self.assertEqual([len(batch) for batch in backend.batches.values()], [2, 1])
+
+
+class OpenAIBatchBackendTests(unittest.TestCase):
+    def test_parses_output_and_error_lines(self):
+        ok = OpenAIBatchBackend._parse_line(
+            json.dumps(
+                {
+                    "custom_id": "x-0",
+                    "response": {
+                        "status_code": 200,
+                        "body": {"choices": [{"message": {"content": '{"text": "A"}'}}]},
+                    },
+                }
+            )
+        )
+        failed = OpenAIBatchBackend._parse_line(
+            json.dumps(
+                {
+                    "custom_id": "x-1",
+                    "response": {"status_code": 429, "body": {"error": {"message": "rate limited"}}},
+                }
+            )
+        )
+
+        self.assertEqual((ok.custom_id, ok.content, ok.error), ("x-0", '{"text": "A"}', None))
+        self.assertIsNone(failed.content)
+        self.assertIn("rate limited", failed.error)
+
+    def test_rejects_providers_without_batch_support(self):
+        with self.assertRaises(ValueError):
+            get_batch_backend("deepseek")
+
+
+if __name__ == "__main__":
+    unittest.main()
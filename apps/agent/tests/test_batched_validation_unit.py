@@ -0,0 +1,107 @@
+"""Unit tests for batched claim validation and the local pre-filter."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from claim_extractor.config import VALIDATION_CONFIG
+from claim_extractor.memo import clear_memo
+from claim_extractor.nodes import validation
+from claim_extractor.schemas import State
+
+from factories import potential_claim
+
+
+class PrefilterTests(unittest.TestCase):
+    def test_rejects_obvious_non_sentences(self):
+        self.assertEqual(validation.prefilter_rejection("Is the Earth flat?"), "question")
+        self.assertEqual(validation.prefilter_rejection("Key findings:"), "heading")
+        self.assertEqual(validation.prefilter_rejection("TurboCorp"), "fragment")
+
+    def test_leaves_possible_sentences_to_the_llm(self):
+        for text in (
+            "Prices rose.",
+            "In 2010, John Smith led the company's finance team",
+            "Sourcing materials from sustainable suppliers",
+            "John Smith, the CEO of Company X",
+            # Plural subjects with base-form verbs, validated by the LLM in the thesis runs
+            "People celebrate Holi by dancing",
+            "People celebrate Holi by singing",
+            "Bees make honey from nectar",
+        ):
+            self.assertIsNone(validation.prefilter_rejection(text), text)
+
+
+class BatchingTests(unittest.TestCase):
+    def test_batches_by_claim_count_and_token_budget(self):
+        claims = [potential_claim(f"Claim number {i} is true.") for i in range(5)]
+        with mock.patch.dict(VALIDATION_CONFIG, {"max_batch_claims": 2}):
+            self.assertEqual([len(b) for b in validation._batch_claims(claims)], [2, 2, 1])
+        with mock.patch.dict(VALIDATION_CONFIG, {"max_batch_tokens": 15}):
+            self.assertEqual([len(b) for b in validation._batch_claims(claims)], [2, 2, 1])
+
+
+class ValidationNodeTests(unittest.TestCase):
+    def setUp(self):
+        clear_memo()
+
+    def _run(self, claims, batch_results):
+        calls = []
+
+        async def fake_llm(llm, output_class, messages, context_desc):
+            calls.append(output_class.__name__)
+            if output_class is validation.BatchValidationOutput:
+                return output_class(results=batch_results)
+            claim = messages[-1][1].split("Claim:", 1)[1].strip()
+            return output_class(is_complete_declarative="not" not in claim)
+
+        state = State(
+            answer_text="...",
+            sentences=[claim.claim_text for claim in claims],
+            potential_claims=claims,
+        )
+        with mock.patch.multiple(
+            validation, call_llm_with_structured_output=fake_llm, get_llm=mock.DEFAULT
+        ):
+            update = asyncio.run(validation.validation_node(state, {}))
+        return [claim.claim_text for claim in update["validated_claims"]], calls
+
+    def test_validates_remaining_claims_in_one_call(self):
+        claims = [
+            potential_claim("The Earth orbits the Sun.", 0),
+            potential_claim("Is the Moon made of cheese?", 1),
+            potential_claim("Water boils at 100 degrees Celsius.", 2),
+            potential_claim("Sourcing materials from sustainable suppliers", 3),
+        ]
+        results = [
+            {"index": 3, "is_complete_declarative": False},
+            {"index": 1, "is_complete_declarative": True},
+            {"index": 2, "is_complete_declarative": True},
+        ]
+
+        valid, calls = self._run(claims, results)
+
+        self.assertEqual(calls, ["BatchValidationOutput"])
+        self.assertEqual(valid, ["The Earth orbits the Sun.", "Water boils at 100 degrees Celsius."])
+
+    def test_unanswered_and_conflicting_claims_fall_back_to_single_calls(self):
+        claims = [
+            potential_claim("The Earth orbits the Sun.", 0),
+            potential_claim("Mars is not a planet.", 1),
+            potential_claim("Water boils at 100 degrees Celsius.", 2),
+        ]
+        results = [
+            {"index": 1, "is_complete_declarative": True},
+            {"index": 3, "is_complete_declarative": True},
+            {"index": 3, "is_complete_declarative": False},
+            {"index": 7, "is_complete_declarative": True},
+        ]
+
+        valid, calls = self._run(claims, results)
+
+        self.assertEqual(calls, ["BatchValidationOutput", "ValidationOutput", "ValidationOutput"])
+        self.assertEqual(valid, ["The Earth orbits the Sun.", "Water boils at 100 degrees Celsius."])
+
+
+if __name__ == "__main__":
+    unittest.main()
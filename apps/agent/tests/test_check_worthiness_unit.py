@@ -0,0 +1,77 @@
+"""Unit tests for check-worthiness scoring and load shedding."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from fact_checker.check_worthiness import get_shedding_mode, score_claim, select_checkworthy
+from fact_checker.config import CHECK_WORTHINESS_CONFIG
+from fact_checker.nodes import select_claims
+from fact_checker.report import build_report
+from fact_checker.scheduler import get_claim_priorities
+from fact_checker.schemas import State
+
+from factories import validated_claim
+
+
+class ScoreTests(unittest.TestCase):
+    def test_specific_factual_claims_outscore_vague_ones(self):
+        specific = score_claim(
+            validated_claim("In 2023, Tesla delivered 1.8 million cars, 38% more than in 2022.")
+        )
+        vague = score_claim(validated_claim("The design might be considered beautiful."))
+
+        self.assertGreater(specific, 0.8)
+        self.assertLess(vague, CHECK_WORTHINESS_CONFIG["min_score"])
+
+    def test_unknown_mode_raises(self):
+        with self.assertRaises(ValueError):
+            get_shedding_mode({"configurable": {"check_worthiness_mode": "random"}})
+
+
+class SelectionTests(unittest.TestCase):
+    SCORES = [0.9, 0.1, 0.5, 0.7]
+
+    def test_top_n_keeps_best_in_original_order(self):
+        with mock.patch.dict(CHECK_WORTHINESS_CONFIG, top_n=2):
+            self.assertEqual(select_checkworthy(self.SCORES, "top_n"), [0, 3])
+
+    def test_threshold_and_off(self):
+        self.assertEqual(select_checkworthy(self.SCORES, "threshold"), [0, 2, 3])
+        self.assertEqual(select_checkworthy(self.SCORES, "off"), [0, 1, 2, 3])
+
+    def test_adaptive_sheds_only_above_the_budget(self):
+        with mock.patch.dict(CHECK_WORTHINESS_CONFIG, top_n=4):
+            self.assertEqual(select_checkworthy(self.SCORES, "adaptive"), [0, 1, 2, 3])
+        with mock.patch.dict(CHECK_WORTHINESS_CONFIG, top_n=2):
+            self.assertEqual(select_checkworthy(self.SCORES, "adaptive"), [0, 3])
+
+    def test_check_worthiness_priority_puts_best_first(self):
+        claims = [validated_claim("a", 0), validated_claim("b", 1)]
+        priorities = get_claim_priorities(claims, "check_worthiness", [0.2, 0.9])
+        self.assertLess(priorities[1], priorities[0])
+
+
+class SelectClaimsNodeTests(unittest.TestCase):
+    def test_skipped_claims_are_reported_as_not_checked(self):
+        claims = [
+            validated_claim("The Eiffel Tower in Paris was completed in 1889.", 0),
+            validated_claim("It might be considered beautiful.", 1),
+        ]
+        update = asyncio.run(
+            select_claims(
+                State(answer="...", extracted_claims=claims),
+                {"configurable": {"check_worthiness_mode": "threshold"}},
+            )
+        )
+
+        self.assertEqual(update["claims_to_verify"], claims[:1])
+        self.assertEqual(update["unchecked_claims"], claims[1:])
+
+        report = build_report("...", [], update["unchecked_claims"])
+        self.assertEqual(report.unchecked_claims, claims[1:])
+        self.assertTrue(report.summary.endswith("1 not checked"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""Unit tests for exact and near-duplicate claim collapsing."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from claim_extractor.config import DEDUP_CONFIG
+from claim_extractor.dedup import dedupe_claims, duplicate_groups, jaccard, normalize_claim_text, shingles
+from claim_extractor.memo import clear_memo
+from claim_extractor.nodes import decomposition, validation
+from claim_extractor.schemas import DisambiguatedContent, State
+
+from factories import potential_claim
+
+
+class DuplicateGroupTests(unittest.TestCase):
+    def test_normalization_ignores_case_punctuation_and_whitespace(self):
+        self.assertEqual(
+            normalize_claim_text("  The [Boston] council   didn't vote."),
+            "the boston council did not vote",
+        )
+        self.assertEqual(normalize_claim_text("Inflation hit 3.5%."), "inflation hit 3.5%")
+
+    def test_groups_exact_and_near_duplicates(self):
+        texts = [
+            "The Boston local council expects its law to pass in January 2025.",
+            "the Boston local council expects its law to pass in January 2025",
+            "[Boston] local council expects its law to pass in January 2025",
+            "The Eiffel Tower is in Paris.",
+        ]
+        self.assertEqual(duplicate_groups(texts), [[0, 1, 2], [3]])
+
+    def test_never_merges_claims_with_different_numbers_or_negation(self):
+        texts = [
+            "Company X grew its revenue by 20% in 2020.",
+            "Company X grew its revenue by 20% in 2021.",
+            "Company X grew its revenue by 20% in 2020, analysts say.",
+            "Mars is a planet in the solar system.",
+            "Mars is not a planet in the solar system.",
+        ]
+        groups = duplicate_groups(texts)
+        self.assertIn([1], groups)
+        self.assertIn([3], groups)
+        self.assertIn([4], groups)
+
+    def test_never_merges_long_claims_differing_in_one_content_word(self):
+        pairs = [
+            "Michael Phelps won the 200 m butterfly final at the 2012 Summer Olympics held in "
+            "London, England, setting a record.",
+            "The Amazon rainforest, which spans nine countries in South America, is the largest "
+            "tropical rainforest in the world by total area.",
+            "According to the 2023 census estimates, the city of Lagos in Nigeria has a larger "
+            "population than any other city on the African continent.",
+        ]
+        swaps = [("won", "lost"), ("largest", "smallest"), ("larger", "smaller")]
+        for first, (word, opposite) in zip(pairs, swaps):
+            second = first.replace(word, opposite)
+            with self.subTest(word=word):
+                similarity = jaccard(
+                    shingles(normalize_claim_text(first), DEDUP_CONFIG["shingle_size"]),
+                    shingles(normalize_claim_text(second), DEDUP_CONFIG["shingle_size"]),
+                )
+                self.assertGreaterEqual(similarity, DEDUP_CONFIG["threshold"])
+                self.assertEqual(duplicate_groups([first, second]), [[0], [1]])
+
+
+class DedupeClaimsTests(unittest.TestCase):
+    def setUp(self):
+        clear_memo()
+
+    def test_keeps_first_occurrence_with_provenance(self):
+        claims = [
+            potential_claim("The Eiffel Tower is in Paris.", 2),
+            potential_claim("Water boils at 100 degrees Celsius.", 3),
+            potential_claim("the Eiffel Tower is in Paris", 5),
+        ]
+
+        unique = dedupe_claims(claims)
+
+        self.assertEqual([claim.claim_text for claim in unique], [claims[0].claim_text, claims[1].claim_text])
+        self.assertEqual(unique[0].original_index, 2)
+        self.assertEqual(unique[0].source_indices, [2, 5])
+        self.assertEqual(unique[1].source_indices, [3])
+
+    def test_duplicates_are_not_sent_to_validation(self):
+        sentences = ["The Eiffel Tower is in Paris.", "It is in Paris, France's capital."]
+        responses = {
+            sentences[0]: ["The Eiffel Tower is in Paris."],
+            sentences[1]: ["The Eiffel Tower is in Paris", "Paris is the capital of France."],
+        }
+        validated = []
+
+        async def fake_llm(llm, output_class, messages, context_desc):
+            if output_class is decomposition.DecompositionOutput:
+                sentence = messages[-1][1].rsplit("Sentence:", 1)[1].strip()
+                return output_class(claims=responses[sentence], no_claims=False)
+            claims = messages[-1][1].split("Claims:", 1)[1].strip().splitlines()
+            validated.extend(claims)
+            return output_class(
+                results=[{"index": i, "is_complete_declarative": True} for i in range(1, len(claims) + 1)]
+            )
+
+        state = State(
+            answer_text=" ".join(sentences),
+            sentences=sentences,
+            disambiguated_contents=[
+                DisambiguatedContent(disambiguated_sentence=sentence, original_index=i)
+                for i, sentence in enumerate(sentences)
+            ],
+        )
+        patches = [
+            mock.patch.multiple(module, call_llm_with_structured_output=fake_llm, get_llm=mock.DEFAULT)
+            for module in (decomposition, validation)
+        ]
+        with patches[0], patches[1]:
+            update = asyncio.run(decomposition.decomposition_node(state, {}))
+            state.potential_claims = update["potential_claims"]
+            result = asyncio.run(validation.validation_node(state, {}))
+
+        self.assertEqual(
+            validated, ["1. The Eiffel Tower is in Paris.", "2. Paris is the capital of France."]
+        )
+        self.assertEqual(result["validated_claims"][0].source_indices, [0, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
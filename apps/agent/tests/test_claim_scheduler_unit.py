@@ -0,0 +1,132 @@
+"""Unit tests for bounded, prioritised claim verification dispatch."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from fact_checker.nodes import claim_verifier, dispatch_claims_for_verification
+from fact_checker.scheduler import ClaimScheduler, get_claim_priorities
+from fact_checker.schemas import State
+
+from factories import validated_claim
+
+
+class ClaimSchedulerTests(unittest.TestCase):
+    def test_bounds_concurrency_and_starts_waiters_by_priority(self):
+        started, peak = [], []
+
+        async def run():
+            scheduler = ClaimScheduler(max_parallel=2)
+            active = 0
+
+            async def verify(name, priority):
+                nonlocal active
+                async with scheduler.slot(priority):
+                    active += 1
+                    peak.append(active)
+                    started.append(name)
+                    await asyncio.sleep(0.01)
+                    active -= 1
+
+            await asyncio.gather(
+                verify("a", (0,)), verify("b", (1,)), verify("late", (9,)), verify("urgent", (2,))
+            )
+            return scheduler.stats()
+
+        stats = asyncio.run(run())
+
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(started, ["a", "b", "urgent", "late"])
+        self.assertEqual(stats["running"], 0)
+        self.assertEqual(stats["waiting"], 0)
+
+    def test_cancelled_waiter_does_not_leak_a_slot(self):
+        async def run():
+            scheduler = ClaimScheduler(max_parallel=1)
+
+            async def hold(seconds):
+                async with scheduler.slot((0,)):
+                    await asyncio.sleep(seconds)
+
+            holder = asyncio.create_task(hold(0.02))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(hold(0))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await holder
+            await asyncio.wait_for(hold(0), 1)
+            return scheduler.stats()
+
+        self.assertEqual(asyncio.run(run())["running"], 0)
+
+    def test_rejects_unknown_priority_policy(self):
+        with self.assertRaises(ValueError):
+            get_claim_priorities([validated_claim("x", 0)], "alphabetical")
+
+
+class DispatchTests(unittest.TestCase):
+    def test_sends_claims_in_priority_order(self):
+        claims = [validated_claim("third", 5), validated_claim("first", 0), validated_claim("second", 2)]
+        sends = dispatch_claims_for_verification(State(answer="...", claims_to_verify=claims))
+
+        self.assertEqual(
+            [send.arg["claim"].claim_text for send in sends], ["first", "second", "third"]
+        )
+        self.assertEqual([send.arg["claim_index"] for send in sends], [1, 2, 0])
+
+    def test_earlier_runs_keep_precedence_over_later_runs(self):
+        older = dispatch_claims_for_verification(
+            State(answer="...", claims_to_verify=[validated_claim(f"old{i}", 10 + i) for i in range(3)])
+        )
+        newer = dispatch_claims_for_verification(
+            State(answer="...", claims_to_verify=[validated_claim("new", 0)])
+        )
+        started = []
+
+        async def run():
+            scheduler = ClaimScheduler(max_parallel=1)
+
+            async def verify(send):
+                async with scheduler.slot(send.arg["priority"]):
+                    started.append(send.arg["claim"].claim_text)
+                    await asyncio.sleep(0.01)
+
+            # The newer run's first claim has the better in-run priority
+            await asyncio.gather(verify(older[0]), *(verify(send) for send in newer + older[1:]))
+
+        asyncio.run(run())
+
+        self.assertEqual(started, ["old0", "old1", "old2", "new"])
+
+    def test_verifier_branches_respect_the_parallel_limit(self):
+        active, peak = 0, 0
+
+        class FakeVerifier:
+            async def ainvoke(self, payload, config):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return {}
+
+        async def run():
+            await asyncio.gather(
+                *(
+                    claim_verifier.claim_verifier_node(
+                        {"claim": validated_claim(f"c{i}", i), "priority": [i]}, {}
+                    )
+                    for i in range(6)
+                )
+            )
+
+        with mock.patch.object(claim_verifier, "claim_scheduler", ClaimScheduler(2)), mock.patch(
+            "claim_verifier.agent._graph", FakeVerifier()
+        ):
+            asyncio.run(run())
+
+        self.assertEqual(peak, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
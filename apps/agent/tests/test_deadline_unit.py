@@ -0,0 +1,126 @@
+"""Unit tests for deadline propagation and graceful degradation."""
+
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+import claim_verifier
+from claim_verifier.agent import create_graph
+from claim_verifier.nodes import (
+    evaluate_evidence,
+    generate_search_query,
+    retrieve_evidence,
+    search_decision,
+)
+from fact_checker.config import DEADLINE_CONFIG
+from fact_checker.nodes import claim_verifier_node
+from search.models import SearchResult
+from utils import run_within, time_remaining, with_deadline
+
+CLAIM_TEXT = "Apollo 11 landed on the Moon in 1969."
+CLAIM = {
+    "claim_text": CLAIM_TEXT,
+    "is_complete_declarative": True,
+    "disambiguated_sentence": CLAIM_TEXT,
+    "original_sentence": CLAIM_TEXT,
+    "original_index": 0,
+}
+
+
+class DeadlineHelperTests(unittest.TestCase):
+    def test_with_deadline_keeps_the_earlier_deadline(self):
+        config = {"configurable": {"llm_provider": "openai", "deadline": 100.0}}
+
+        self.assertEqual(with_deadline(config, 200.0)["configurable"]["deadline"], 100.0)
+        self.assertEqual(with_deadline(config, 50.0)["configurable"]["deadline"], 50.0)
+        self.assertEqual(with_deadline(config, 50.0)["configurable"]["llm_provider"], "openai")
+        no_deadline = {"configurable": {"llm_provider": "openai"}}
+        self.assertIs(with_deadline(no_deadline, None), no_deadline)
+
+    def test_time_remaining(self):
+        self.assertIsNone(time_remaining({}))
+        self.assertEqual(time_remaining({"configurable": {"deadline": time.time() - 1}}), 0.0)
+        self.assertEqual(time_remaining({"configurable": {"deadline": time.time() + 10}}, 20), 0.0)
+
+    def test_run_within_returns_default_on_timeout(self):
+        async def slow():
+            await asyncio.sleep(1)
+            return "done"
+
+        self.assertEqual(asyncio.run(run_within(slow(), 0.01, "late")), "late")
+        self.assertEqual(asyncio.run(run_within(slow(), 0, "skipped")), "skipped")
+
+
+class VerifierDeadlineTests(unittest.TestCase):
+    """Runs the verifier graph with stubbed search and LLM calls under a deadline."""
+
+    def _run(self, budget, evaluation_delay=0.0):
+        calls = []
+
+        async def fake_search(query, max_results):
+            calls.append("search")
+            return [SearchResult(url="https://nasa.gov/apollo", content=CLAIM_TEXT)]
+
+        async def fake_llm(llm, output_class, messages, context_desc):
+            calls.append(output_class.__name__)
+            if output_class.__name__ == "QueryGenerationOutput":
+                return output_class(query="apollo 11 moon landing")
+            if output_class.__name__ == "SearchDecisionOutput":
+                return output_class(needs_more_evidence=True)
+            await asyncio.sleep(evaluation_delay)
+            return output_class(verdict="Supported", reasoning="ok")
+
+        with mock.patch.object(retrieve_evidence, "search", fake_search), mock.patch.multiple(
+            generate_search_query, call_llm_with_structured_output=fake_llm, get_llm=mock.DEFAULT
+        ), mock.patch.multiple(
+            search_decision, call_llm_with_structured_output=fake_llm, get_llm=mock.DEFAULT
+        ), mock.patch.multiple(
+            evaluate_evidence, call_llm_with_structured_output=fake_llm, get_llm=mock.DEFAULT
+        ):
+            result = asyncio.run(
+                create_graph().ainvoke(
+                    {"claim": CLAIM},
+                    config={"configurable": {"deadline": time.time() + budget}},
+                )
+            )
+        return result, calls
+
+    def test_near_deadline_skips_searching_and_evaluates(self):
+        result, calls = self._run(budget=1.0)
+
+        self.assertEqual(result["search_decisions"], ["deadline"])
+        self.assertEqual(calls, ["EvidenceEvaluationOutput"])
+        self.assertEqual(result["query"], CLAIM_TEXT)
+        self.assertFalse(result["verdict"].timed_out)
+
+    def test_evaluation_past_deadline_returns_timed_out_verdict(self):
+        result, _ = self._run(budget=0.05, evaluation_delay=1.0)
+
+        self.assertTrue(result["verdict"].timed_out)
+        self.assertEqual(
+            result["verdict"].result, claim_verifier.VerificationResult.INSUFFICIENT_INFORMATION
+        )
+
+
+class FactCheckerDeadlineTests(unittest.TestCase):
+    def test_stuck_verifier_branch_is_replaced_by_timed_out_verdict(self):
+        class StuckGraph:
+            async def ainvoke(self, payload, config):
+                await asyncio.sleep(1)
+
+        claim = claim_verifier.schemas.ValidatedClaim(**CLAIM)
+        with mock.patch.dict(DEADLINE_CONFIG, grace_seconds=0), mock.patch(
+            "claim_verifier.agent._graph", StuckGraph()
+        ):
+            update = asyncio.run(
+                claim_verifier_node({"claim": claim, "deadline": time.time() + 0.05}, {})
+            )
+
+        (verdict,) = update["verification_results"]
+        self.assertTrue(verdict.timed_out)
+        self.assertEqual(verdict.claim_text, CLAIM_TEXT)
+
+
+if __name__ == "__main__":
+    unittest.main()
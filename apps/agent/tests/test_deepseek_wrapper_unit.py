@@ -10,6 +10,9 @@ from typing import Any, List
 from langchain_core.messages import AIMessage
 from pydantic import BaseModel, Field
 
+from claim_verifier.nodes.evaluate_evidence import EvidenceEvaluationOutput
+from claim_verifier.schemas import VerificationResult
+from utils.json_output import extract_json_object, normalize_enum_values, schema_example_json
 from utils.models import DeepSeekChatWrapper
 from utils.llm import call_llm_with_structured_output
 
@@ -97,5 +100,57 @@ class DeepSeekWrapperTests(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(result.no_claims)
 
 
+class Assessment(BaseModel):
+    verdict: VerificationResult
+    note: str = ""
+
+
+class Report(BaseModel):
+    assessments: List[Assessment] = Field(default_factory=list)
+    summary: str = ""
+
+
+class JsonExtractionTests(unittest.TestCase):
+    def test_skips_braces_inside_strings(self):
+        text = 'Result: {"reasoning": "uses {braces} and \\"}\\" quotes", "verdict": "Supported"} done'
+
+        self.assertEqual(
+            extract_json_object(text),
+            {"reasoning": 'uses {braces} and "}" quotes', "verdict": "Supported"},
+        )
+
+    def test_skips_non_json_brace_spans_before_the_object(self):
+        text = 'Format as {field: value}:\n```json\n{"claims": ["c1"], "no_claims": false}\n```'
+
+        self.assertEqual(extract_json_object(text), {"claims": ["c1"], "no_claims": False})
+
+    def test_truncated_response_yields_nothing(self):
+        self.assertIsNone(extract_json_object('{"claims": [{"text": "a"}, {"text": "b'))
+        self.assertIsNone(extract_json_object('{"claims": [{"text": "a"}, {"text": "b"}'))
+
+    def test_normalizes_only_enum_fields_including_nested_ones(self):
+        data = {
+            "assessments": [{"verdict": "INSUFFICIENT_INFORMATION", "note": "supported"}],
+            "summary": "refuted",
+        }
+
+        normalize_enum_values(data, Report)
+
+        self.assertEqual(data["assessments"][0]["verdict"], "Insufficient Information")
+        self.assertEqual(data["assessments"][0]["note"], "supported")
+        self.assertEqual(data["summary"], "refuted")
+
+    def test_wrapper_parses_uppercase_verdicts(self):
+        fake_llm = FakeLLM('{"verdict": "REFUTED", "reasoning": "Contradicted by {source 1}."}')
+        wrapper = DeepSeekChatWrapper(fake_llm)
+
+        result = wrapper.with_structured_output(EvidenceEvaluationOutput).invoke(
+            [AIMessage(content="Evaluate")]
+        )
+
+        self.assertEqual(result.verdict, VerificationResult.REFUTED)
+        self.assertIn(schema_example_json(EvidenceEvaluationOutput), fake_llm.recorded_messages[-1].content)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,120 @@
+"""Unit tests for the claim verifier's per-run evidence store and dedup."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from claim_extractor.schemas import ValidatedClaim
+from claim_verifier.nodes import retrieve_evidence
+from claim_verifier.schemas import ClaimVerifierState, Evidence, merge_evidence
+from search import canonicalize_url, content_fingerprint
+from search.models import SearchResult
+
+CLAIM = ValidatedClaim(
+    claim_text="The Earth orbits the Sun.",
+    is_complete_declarative=True,
+    disambiguated_sentence="The Earth orbits the Sun.",
+    original_sentence="The Earth orbits the Sun.",
+    original_index=0,
+)
+
+
+def _evidence(url: str, text: str = "snippet") -> Evidence:
+    return Evidence(url=url, text=text)
+
+
+class CanonicalizeUrlTests(unittest.TestCase):
+    def test_equivalent_urls_share_a_canonical_form(self):
+        variants = [
+            "https://example.com/news/story",
+            "http://www.example.com/news/story/",
+            "https://example.com/news/story?utm_source=twitter&fbclid=abc",
+            "https://m.example.com/news/story#comments",
+            "https://example.com/news/story/amp",
+            "https://www-example-com.cdn.ampproject.org/c/s/www.example.com/news/story",
+        ]
+        self.assertEqual(
+            {canonicalize_url(url) for url in variants}, {"https://example.com/news/story"}
+        )
+
+    def test_keeps_meaningful_query_parameters(self):
+        self.assertEqual(
+            canonicalize_url("https://example.com/search?q=moon&page=2&utm_medium=email"),
+            "https://example.com/search?page=2&q=moon",
+        )
+        self.assertNotEqual(
+            canonicalize_url("https://example.com/item?id=1"),
+            canonicalize_url("https://example.com/item?id=2"),
+        )
+
+    def test_malformed_urls_do_not_raise(self):
+        self.assertEqual(canonicalize_url("http://example.com:99999/a/"), "https://example.com:99999/a")
+        self.assertEqual(canonicalize_url("http://example.com:abc/a"), "https://example.com:abc/a")
+        self.assertEqual(canonicalize_url(" http://[::1/page "), "http://[::1/page")
+
+    def test_content_fingerprint_ignores_case_and_whitespace(self):
+        self.assertEqual(
+            content_fingerprint("The Moon  landing\nwas in 1969."),
+            content_fingerprint("the moon landing was in 1969. "),
+        )
+
+
+class MergeEvidenceTests(unittest.TestCase):
+    def test_keeps_first_copy_and_order(self):
+        first = _evidence("https://a.org", "first")
+        merged = merge_evidence(
+            {"https://a.org": first},
+            {"https://a.org": _evidence("https://a.org", "second"), "https://b.org": _evidence("https://b.org")},
+        )
+
+        self.assertEqual(list(merged), ["https://a.org", "https://b.org"])
+        self.assertIs(merged["https://a.org"], first)
+
+
+class RetrieveEvidenceTests(unittest.TestCase):
+    def _retrieve(self, state, results):
+        async def fake_search(query, max_results):
+            return results
+
+        with mock.patch.object(retrieve_evidence, "search", fake_search):
+            return asyncio.run(retrieve_evidence.retrieve_evidence_node(state))
+
+    def test_skips_canonical_duplicates_and_mirrored_content(self):
+        known = _evidence("https://www.a.org/page/", "Shared text")
+        state = ClaimVerifierState(
+            claim=CLAIM,
+            query="earth orbit",
+            evidence={canonicalize_url(known.url): known},
+            evidence_fingerprints=[content_fingerprint(known.text)],
+        )
+
+        update = self._retrieve(
+            state,
+            [
+                SearchResult(url="https://a.org/page?utm_source=x", content="Other text"),
+                SearchResult(url="https://mirror.net/copy", content="shared  TEXT"),
+                SearchResult(url="https://c.org/new", content="Fresh text"),
+            ],
+        )
+
+        self.assertEqual(list(update["evidence"]), ["https://c.org/new"])
+        self.assertEqual(update["evidence_fingerprints"], [content_fingerprint("Fresh text")])
+
+    def test_returns_evidence_models_for_new_urls_only(self):
+        known = _evidence("https://a.org")
+        state = ClaimVerifierState(claim=CLAIM, query="earth orbit", evidence={known.url: known})
+
+        update = self._retrieve(
+            state,
+            [
+                SearchResult(url="https://a.org", content="again"),
+                SearchResult(url="https://b.org", title="B", content="new"),
+            ],
+        )
+
+        self.assertEqual(list(update["evidence"]), ["https://b.org"])
+        self.assertIsInstance(update["evidence"]["https://b.org"], Evidence)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+"""Unit tests for the fused selection and disambiguation stage."""
+
+import asyncio
+import unittest
+from contextlib import ExitStack
+from unittest import mock
+
+from claim_extractor.agent import create_graph
+from claim_extractor.memo import clear_memo
+from claim_extractor.nodes import (
+    decomposition,
+    disambiguation,
+    fused_selection,
+    selection,
+    validation,
+)
+from claim_extractor.schemas import ContextualSentence, State
+
+SENTENCES = [
+    "Jane Doe founded TurboCorp in 2010.",
+    "She grew its revenue by 20% last year.",
+    "Innovation is important.",
+]
+
+FUSED_RESPONSES = {
+    SENTENCES[0]: {
+        "processed_sentence": SENTENCES[0],
+        "no_verifiable_claims": False,
+        "remains_unchanged": True,
+        "disambiguated_sentence": SENTENCES[0],
+        "cannot_be_disambiguated": False,
+    },
+    SENTENCES[1]: {
+        "processed_sentence": "She grew its revenue by 20% last year.",
+        "no_verifiable_claims": False,
+        "remains_unchanged": True,
+        "disambiguated_sentence": None,
+        "cannot_be_disambiguated": True,
+    },
+    SENTENCES[2]: {
+        "processed_sentence": None,
+        "no_verifiable_claims": True,
+        "remains_unchanged": False,
+    },
+}
+
+
+def _state() -> State:
+    return State(
+        answer_text=" ".join(SENTENCES),
+        sentences=SENTENCES,
+        contextual_sentences=[
+            ContextualSentence(original_sentence=sentence, original_index=i)
+            for i, sentence in enumerate(SENTENCES)
+        ],
+    )
+
+
+def _sentence_of(messages) -> str:
+    human = messages[-1][1] if isinstance(messages, list) else messages.to_messages()[-1].content
+    return human.rsplit("Sentence:", 1)[1].strip()
+
+
+class FusedSelectionNodeTests(unittest.TestCase):
+    def setUp(self):
+        clear_memo()
+
+    def test_votes_once_per_sentence_and_returns_both_stages(self):
+        calls = []
+
+        async def fake_llm(llm, output_class, messages, context_desc):
+            calls.append(output_class.__name__)
+            return output_class(**FUSED_RESPONSES[_sentence_of(messages)])
+
+        with mock.patch.multiple(
+            fused_selection, call_llm_with_structured_output=fake_llm, get_llm=mock.DEFAULT
+        ):
+            update = asyncio.run(fused_selection.fused_selection_node(_state(), {}))
+
+        self.assertEqual(calls, ["FusedSelectionOutput"] * 3 * len(SENTENCES))
+        self.assertEqual([c.original_index for c in update["selected_contents"]], [0])
+        self.assertEqual(
+            [c.disambiguated_sentence for c in update["disambiguated_contents"]], [SENTENCES[0]]
+        )
+
+    def test_routes_by_extraction_mode(self):
+        self.assertEqual(fused_selection.route_selection(_state(), {}), "selection")
+        self.assertEqual(
+            fused_selection.route_selection(
+                _state(), {"configurable": {"extraction_mode": "fused"}}
+            ),
+            "fused_selection",
+        )
+        with self.assertRaises(ValueError):
+            fused_selection.get_extraction_mode({"configurable": {"extraction_mode": "single"}})
+
+
+class ExtractionModeGraphTests(unittest.TestCase):
+    def _run(self, mode):
+        clear_memo()
+        calls = []
+
+        async def fake_llm(llm, output_class, messages, context_desc):
+            calls.append(output_class.__name__)
+            name = output_class.__name__
+            if name == "FusedSelectionOutput":
+                return output_class(**FUSED_RESPONSES[_sentence_of(messages)])
+            if name == "SelectionOutput":
+                fields = ("processed_sentence", "no_verifiable_claims", "remains_unchanged")
+                response = FUSED_RESPONSES[_sentence_of(messages)]
+                return output_class(**{field: response[field] for field in fields})
+            if name == "DisambiguationOutput":
+                sentence = _sentence_of(messages)
+                if sentence == SENTENCES[1]:
+                    return output_class(cannot_be_disambiguated=True)
+                return output_class(disambiguated_sentence=sentence, cannot_be_disambiguated=False)
+            if name == "DecompositionOutput":
+                return output_class(claims=[_sentence_of(messages)], no_claims=False)
+            return output_class(is_complete_declarative=True)
+
+        with ExitStack() as stack:
+            for module in (selection, disambiguation, fused_selection, decomposition, validation):
+                stack.enter_context(
+                    mock.patch.multiple(
+                        module, call_llm_with_structured_output=fake_llm, get_llm=mock.DEFAULT
+                    )
+                )
+            result = asyncio.run(
+                create_graph().ainvoke(
+                    {"answer_text": " ".join(SENTENCES)},
+                    {"configurable": {"extraction_mode": mode, "sentence_segmenter": "regex"}},
+                )
+            )
+        return result, calls
+
+    def test_fused_mode_matches_two_stage_claims_with_fewer_calls(self):
+        two_stage, two_stage_calls = self._run("two_stage")
+        fused, fused_calls = self._run("fused")
+
+        self.assertEqual(
+            [c.claim_text for c in fused["validated_claims"]],
+            [c.claim_text for c in two_stage["validated_claims"]],
+        )
+        self.assertEqual([c.claim_text for c in fused["validated_claims"]], [SENTENCES[0]])
+        self.assertNotIn("SelectionOutput", fused_calls)
+        self.assertLess(len(fused_calls), len(two_stage_calls))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+"""Import-time regression test for the server cold start.
+
+Loads every graph in a fresh interpreter under `python -X importtime` and
+fails if a provider SDK or heavy dependency is imported eagerly.
+"""
+
+import unittest
+
+from scripts.profile_cold_start import LAZY_MODULES, profile_imports
+
+
+class ColdStartImportTests(unittest.TestCase):
+    def test_server_startup_does_not_import_lazy_modules(self):
+        _, _, loaded = profile_imports()
+
+        self.assertIn("fact_checker.nodes", loaded)
+        self.assertEqual([m for m in LAZY_MODULES if m in loaded], [])
+
+    def test_importing_a_package_does_not_compile_graphs(self):
+        _, imports, _ = profile_imports(
+            "import sys, claim_extractor, claim_verifier, fact_checker; "
+            "assert all(vars(sys.modules[p + '.agent'])['_graph'] is None "
+            "for p in ('claim_extractor', 'claim_verifier', 'fact_checker'))"
+        )
+        self.assertTrue(imports)
+
+
+if __name__ == "__main__":
+    unittest.main()
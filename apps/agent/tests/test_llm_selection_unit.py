@@ -0,0 +1,45 @@
+"""Unit tests for per-run LLM provider selection via RunnableConfig."""
+
+import unittest
+from unittest import mock
+
+from utils import models
+from utils.models import get_llm, get_llm_selection
+
+
+class LLMSelectionTests(unittest.TestCase):
+    def test_falls_back_to_settings_without_config(self):
+        with mock.patch.object(models.settings, "llm_provider", "gemini"):
+            self.assertEqual(get_llm_selection(None), ("gemini", None))
+            self.assertEqual(get_llm_selection({"configurable": {}}), ("gemini", None))
+
+    def test_configurable_overrides_settings(self):
+        config = {"configurable": {"llm_provider": "deepseek", "llm_model": "deepseek-reasoner"}}
+        with mock.patch.object(models.settings, "llm_provider", "openai"):
+            self.assertEqual(get_llm_selection(config), ("deepseek", "deepseek-reasoner"))
+
+    def test_get_llm_routes_to_configured_provider(self):
+        recorded = {}
+
+        class FakeProvider:
+            def invoke(self, model_name=None, temperature=0.0, completions=1):
+                recorded["model_name"] = model_name
+                return "fake-llm"
+
+        config = {"configurable": {"llm_provider": "deepseek"}}
+        with mock.patch.dict(models._PROVIDER_CACHE, {"deepseek": FakeProvider()}):
+            self.assertEqual(get_llm(config=config), "fake-llm")
+            self.assertEqual(recorded["model_name"], "deepseek-chat")
+
+            # A configured model is used when the caller does not pass one
+            config["configurable"]["llm_model"] = "deepseek-reasoner"
+            get_llm(config=config)
+            self.assertEqual(recorded["model_name"], "deepseek-reasoner")
+
+    def test_unknown_configured_provider_raises(self):
+        with self.assertRaises(ValueError):
+            get_llm(config={"configurable": {"llm_provider": "unknown"}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+"""Unit tests for sentence-level memoisation and verdict reuse on re-checks."""
+
+import asyncio
+import unittest
+from collections import Counter
+from contextlib import ExitStack
+from unittest import mock
+
+from claim_extractor.agent import create_graph
+from claim_extractor.memo import clear_memo, memoized, tracking_failures
+from claim_extractor.nodes import decomposition, disambiguation, selection, validation
+from claim_verifier.schemas import Verdict, VerificationResult
+from fact_checker.nodes import claim_verifier
+from utils import call_llm_with_structured_output
+
+from factories import validated_claim
+
+SENTENCES = [f"Fact number {i} was recorded in {2000 + i}." for i in range(8)]
+
+
+def _sentence_of(messages) -> str:
+    human = messages[-1][1] if isinstance(messages, list) else messages.to_messages()[-1].content
+    return human.rsplit("Sentence:", 1)[1].strip()
+
+
+async def _fake_llm(calls, llm, output_class, messages, context_desc):
+    name = output_class.__name__
+    calls[name] += 1
+    if name == "SelectionOutput":
+        return output_class(
+            processed_sentence=_sentence_of(messages), no_verifiable_claims=False, remains_unchanged=True
+        )
+    if name == "DisambiguationOutput":
+        return output_class(disambiguated_sentence=_sentence_of(messages), cannot_be_disambiguated=False)
+    if name == "DecompositionOutput":
+        return output_class(claims=[_sentence_of(messages)], no_claims=False)
+    if name == "BatchValidationOutput":
+        count = len(messages[-1][1].split("Claims:", 1)[1].strip().splitlines())
+        return output_class(
+            results=[{"index": i, "is_complete_declarative": True} for i in range(1, count + 1)]
+        )
+    return output_class(is_complete_declarative=True)
+
+
+class ExtractionMemoTests(unittest.TestCase):
+    def setUp(self):
+        clear_memo()
+
+    def _extract(self, sentences, configurable=None):
+        calls = Counter()
+
+        async def fake_llm(*args, **kwargs):
+            return await _fake_llm(calls, *args, **kwargs)
+
+        with ExitStack() as stack:
+            for module in (selection, disambiguation, decomposition, validation):
+                stack.enter_context(
+                    mock.patch.multiple(
+                        module, call_llm_with_structured_output=fake_llm, get_llm=mock.DEFAULT
+                    )
+                )
+            result = asyncio.run(
+                create_graph().ainvoke(
+                    {"answer_text": " ".join(sentences)},
+                    {"configurable": {"sentence_segmenter": "regex", **(configurable or {})}},
+                )
+            )
+        return result["validated_claims"], calls
+
+    def test_recheck_only_reprocesses_changed_sentence_and_its_neighbours(self):
+        self._extract(SENTENCES)
+        edited = SENTENCES[:-1] + ["Fact number 7 was first recorded in 1999."]
+
+        claims, calls = self._extract(edited)
+
+        # Selection sees 5 sentences either side, disambiguation and
+        # decomposition only preceding ones
+        self.assertEqual(calls["SelectionOutput"], 3 * 6)
+        self.assertEqual(calls["DisambiguationOutput"], 3)
+        self.assertEqual(calls["DecompositionOutput"], 1)
+        self.assertEqual(calls["ValidationOutput"] + calls["BatchValidationOutput"], 1)
+        self.assertEqual([claim.claim_text for claim in claims], edited)
+        self.assertEqual([claim.original_index for claim in claims], list(range(8)))
+
+    def test_inserted_sentence_shifts_indices_of_reused_results(self):
+        self._extract(SENTENCES)
+        edited = ["A new first fact was noted in 1990."] + SENTENCES
+
+        claims, _ = self._extract(edited)
+
+        self.assertEqual([claim.claim_text for claim in claims], edited)
+        self.assertEqual([claim.original_index for claim in claims], list(range(9)))
+
+    def test_memoize_false_recomputes_everything(self):
+        self._extract(SENTENCES)
+
+        _, calls = self._extract(SENTENCES, {"memoize": False})
+
+        self.assertEqual(calls["SelectionOutput"], 3 * len(SENTENCES))
+
+    def test_results_of_failed_llm_calls_are_not_memoised(self):
+        class BrokenLLM:
+            def with_structured_output(self, output_class):
+                return self
+
+            async def ainvoke(self, messages):
+                raise RuntimeError("provider unavailable")
+
+        class Item:
+            original_index = 0
+
+        async def processor(item, llm):
+            response = await call_llm_with_structured_output(llm, Verdict, [("human", "x")])
+            return response is not None, response
+
+        computed = []
+
+        async def compute(pending):
+            failed = set()
+            outcome = await tracking_failures(processor, failed)(pending[0], BrokenLLM())
+            computed.append(outcome)
+            return [None], {0} if failed else set()
+
+        async def run():
+            await memoized("test", {}, [Item()], lambda item: ("x",), compute)
+            await memoized("test", {}, [Item()], lambda item: ("x",), compute)
+
+        asyncio.run(run())
+
+        self.assertEqual(len(computed), 2)
+
+
+class VerdictReuseTests(unittest.TestCase):
+    def setUp(self):
+        claim_verifier._VERDICTS.clear()
+
+    def _verify(self, claims, result=VerificationResult.SUPPORTED, timed_out=False):
+        verified = []
+
+        class FakeVerifier:
+            async def ainvoke(self, payload, config):
+                claim = payload["claim"]
+                verified.append(claim.claim_text)
+                return {
+                    "verdict": Verdict(
+                        claim_text=claim.claim_text,
+                        disambiguated_sentence=claim.disambiguated_sentence,
+                        original_sentence=claim.original_sentence,
+                        original_index=claim.original_index,
+                        result=result,
+                        reasoning="ok",
+                        timed_out=timed_out,
+                    )
+                }
+
+        async def run():
+            return [
+                await claim_verifier.claim_verifier_node({"claim": claim}, {}) for claim in claims
+            ]
+
+        with mock.patch("claim_verifier.agent._graph", FakeVerifier()):
+            updates = asyncio.run(run())
+        return [update["verification_results"][0] for update in updates], verified
+
+    @staticmethod
+    def _claim(index):
+        return validated_claim("The Eiffel Tower is in Paris.", index, f"Sentence {index}")
+
+    def test_reuses_verdict_for_the_same_claim_at_its_new_position(self):
+        verdicts, verified = self._verify([self._claim(0), self._claim(4)])
+
+        self.assertEqual(len(verified), 1)
+        self.assertEqual(verdicts[1].original_index, 4)
+        self.assertEqual(verdicts[1].original_sentence, "Sentence 4")
+        self.assertEqual(verdicts[1].result, VerificationResult.SUPPORTED)
+
+    def test_timed_out_verdicts_are_not_reused(self):
+        _, verified = self._verify([self._claim(0), self._claim(1)], timed_out=True)
+
+        self.assertEqual(len(verified), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""Unit tests for first-round multi-query generation and concurrent retrieval."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from claim_extractor.schemas import ValidatedClaim
+from claim_verifier.nodes import generate_search_query, retrieve_evidence
+from claim_verifier.schemas import ClaimVerifierState
+from search.models import SearchResult
+
+CLAIM = ValidatedClaim(
+    claim_text="The Earth orbits the Sun.",
+    is_complete_declarative=True,
+    disambiguated_sentence="The Earth orbits the Sun.",
+    original_sentence="The Earth orbits the Sun.",
+    original_index=0,
+)
+
+
+class GenerateQueriesTests(unittest.TestCase):
+    def _generate(self, state, initial_queries, response):
+        calls = []
+
+        async def fake_llm(llm, output_class, messages, context_desc):
+            calls.append(output_class.__name__)
+            return output_class(**response)
+
+        with mock.patch.multiple(
+            generate_search_query, call_llm_with_structured_output=fake_llm, get_llm=mock.DEFAULT
+        ):
+            update = asyncio.run(
+                generate_search_query.generate_search_query_node(
+                    state, {"configurable": {"initial_queries": initial_queries}}
+                )
+            )
+        return update, calls
+
+    def test_first_round_returns_unique_queries_from_one_call(self):
+        update, calls = self._generate(
+            ClaimVerifierState(claim=CLAIM),
+            3,
+            {"queries": ["earth orbit sun", "Earth orbit Sun", "geocentric model refuted", " ", "nasa heliocentric", "extra"]},
+        )
+
+        self.assertEqual(calls, ["MultiQueryGenerationOutput"])
+        self.assertEqual(
+            update["queries"], ["earth orbit sun", "geocentric model refuted", "nasa heliocentric"]
+        )
+        self.assertEqual(update["query"], "earth orbit sun")
+        self.assertEqual(update["all_queries"], update["queries"])
+
+    def test_later_rounds_generate_a_single_query(self):
+        update, calls = self._generate(
+            ClaimVerifierState(claim=CLAIM, iteration_count=1, all_queries=["earth orbit sun"]),
+            3,
+            {"query": "earth revolution period"},
+        )
+
+        self.assertEqual(calls, ["QueryGenerationOutput"])
+        self.assertEqual(update["queries"], ["earth revolution period"])
+
+    def test_rejects_non_positive_query_count(self):
+        with self.assertRaises(ValueError):
+            generate_search_query.get_initial_query_count({"configurable": {"initial_queries": 0}})
+
+
+class ConcurrentRetrievalTests(unittest.TestCase):
+    def test_searches_every_query_and_dedups_across_them(self):
+        results = {
+            "a": [SearchResult(url="https://a.org", content="A"), SearchResult(url="https://shared.org", content="S")],
+            "b": [SearchResult(url="https://www.shared.org/", content="S"), SearchResult(url="https://b.org", content="B")],
+        }
+        searched = []
+
+        async def fake_search(query, max_results):
+            searched.append((query, max_results))
+            return results[query]
+
+        state = ClaimVerifierState(claim=CLAIM, query="a", queries=["a", "b"])
+        with mock.patch.object(retrieve_evidence, "search", fake_search):
+            update = asyncio.run(retrieve_evidence.retrieve_evidence_node(state))
+
+        self.assertEqual([query for query, _ in searched], ["a", "b"])
+        self.assertTrue(all(max_results > 3 for _, max_results in searched))
+        self.assertEqual(
+            list(update["evidence"]), ["https://a.org", "https://shared.org", "https://b.org"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""Unit tests for cache-friendly verifier prompts and cached-token accounting."""
+
+import asyncio
+import re
+import unittest
+from typing import Any, List, Optional
+from unittest import mock
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from claim_verifier.nodes import generate_search_query
+from claim_verifier.prompts import (
+    QUERY_GENERATION_INITIAL_SYSTEM_PROMPT,
+    QUERY_GENERATION_ITERATIVE_SYSTEM_PROMPT,
+)
+from claim_verifier.schemas import ClaimVerifierState
+from utils import LLMUsageTracker
+
+from factories import validated_claim
+
+
+class StablePrefixTests(unittest.TestCase):
+    def _system_prompt(self, state) -> str:
+        prompts = []
+
+        async def fake_llm(llm, output_class, messages, context_desc):
+            prompts.append(messages[0][1])
+            return output_class(query="q")
+
+        with mock.patch.multiple(
+            generate_search_query, call_llm_with_structured_output=fake_llm, get_llm=mock.DEFAULT
+        ):
+            asyncio.run(
+                generate_search_query.generate_search_query_node(
+                    state, {"configurable": {"initial_queries": 1}}
+                )
+            )
+        return prompts[0]
+
+    def test_system_prompt_is_identical_across_claims_and_dated_by_day(self):
+        first = self._system_prompt(ClaimVerifierState(claim=validated_claim("The Earth orbits the Sun.")))
+        second = self._system_prompt(ClaimVerifierState(claim=validated_claim("Water boils at 100 C.")))
+
+        self.assertEqual(first, second)
+        self.assertTrue(first.startswith(QUERY_GENERATION_INITIAL_SYSTEM_PROMPT))
+        self.assertRegex(first, r"Current date: \d{4}-\d{2}-\d{2}$")
+        self.assertIsNone(re.search(r"\d{2}:\d{2}", first))
+
+    def test_iteration_context_follows_the_static_instructions(self):
+        prompt = self._system_prompt(
+            ClaimVerifierState(
+                claim=validated_claim("The Earth orbits the Sun."),
+                iteration_count=1,
+                all_queries=["earth orbit sun"],
+            )
+        )
+
+        self.assertTrue(prompt.startswith(QUERY_GENERATION_ITERATIVE_SYSTEM_PROMPT))
+        self.assertLess(prompt.index("Current date:"), prompt.index("earth orbit sun"))
+        self.assertIn("Iteration: 2", prompt)
+
+
+class _UsageReportingModel(BaseChatModel):
+    usage: dict
+    token_usage: dict = {}
+
+    @property
+    def _llm_type(self) -> str:
+        return "usage-reporting"
+
+    def _generate(
+        self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any
+    ) -> ChatResult:
+        message = AIMessage(content="{}", usage_metadata=self.usage)
+        return ChatResult(
+            generations=[ChatGeneration(message=message)],
+            llm_output={"token_usage": self.token_usage},
+        )
+
+
+class LLMUsageTrackerTests(unittest.TestCase):
+    def _track(self, *models) -> LLMUsageTracker:
+        tracker = LLMUsageTracker()
+
+        async def run():
+            for model in models:
+                await model.ainvoke("hi", config={"callbacks": [tracker]})
+
+        asyncio.run(run())
+        return tracker
+
+    def test_sums_standard_cache_read_details(self):
+        model = _UsageReportingModel(
+            usage={
+                "input_tokens": 1200,
+                "output_tokens": 20,
+                "total_tokens": 1220,
+                "input_token_details": {"cache_read": 1024},
+            }
+        )
+
+        tracker = self._track(model, model)
+
+        self.assertEqual(tracker.calls, 2)
+        self.assertEqual(tracker.input_tokens, 2400)
+        self.assertEqual(tracker.cached_input_tokens, 2048)
+        self.assertEqual(tracker.output_tokens, 40)
+        self.assertAlmostEqual(tracker.cache_hit_rate, 2048 / 2400)
+
+    def test_falls_back_to_deepseek_cache_hit_tokens(self):
+        model = _UsageReportingModel(
+            usage={"input_tokens": 900, "output_tokens": 10, "total_tokens": 910},
+            token_usage={"prompt_cache_hit_tokens": 640, "prompt_cache_miss_tokens": 260},
+        )
+
+        tracker = self._track(model)
+
+        self.assertEqual(tracker.summary()["cached_input_tokens"], 640)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+"""Unit tests for the shared Redis connection pool."""
+
+import unittest
+
+import redis.asyncio as redis
+
+from utils import redis as redis_utils
+
+
+class RedisPoolTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self):
+        await redis_utils.close_redis_pool()
+
+    async def test_clients_share_one_bounded_pool(self):
+        pool = redis_utils.get_redis_pool()
+
+        self.assertIsInstance(pool, redis.BlockingConnectionPool)
+        self.assertIs(redis_utils.get_redis_pool(), pool)
+        self.assertIs(redis_utils.get_redis().connection_pool, pool)
+        self.assertEqual(pool.max_connections, redis_utils.settings.redis_max_connections)
+
+    async def test_client_context_does_not_close_pool(self):
+        async with redis_utils.redis_client() as client:
+            pool = client.connection_pool
+
+        self.assertIs(redis_utils.get_redis_pool(), pool)
+
+    async def test_close_resets_pool(self):
+        pool = redis_utils.get_redis_pool()
+        await redis_utils.close_redis_pool()
+
+        self.assertIsNot(redis_utils.get_redis_pool(), pool)
+
+
+if __name__ == "__main__":
+    unittest.main()
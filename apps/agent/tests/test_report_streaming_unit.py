@@ -0,0 +1,97 @@
+"""Unit tests for incremental report snapshots streamed by the fact checker."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from claim_extractor.schemas import ValidatedClaim
+from claim_verifier.schemas import Verdict, VerificationResult
+from fact_checker.agent import create_graph
+from fact_checker.report import SNAPSHOT_EVENT
+
+CLAIMS = [
+    ValidatedClaim(
+        claim_text=text,
+        is_complete_declarative=True,
+        disambiguated_sentence=text,
+        original_sentence=text,
+        original_index=i,
+    )
+    for i, text in enumerate(
+        ["Water boils at 100 C at sea level.", "The Moon is made of cheese.", "Paris is in France."]
+    )
+]
+
+
+class FakeExtractor:
+    async def ainvoke(self, payload, config):
+        return {"validated_claims": CLAIMS}
+
+
+class FakeVerifier:
+    """Finishes claims in reverse order so completion order differs from claim order."""
+
+    async def ainvoke(self, payload, config):
+        claim = payload["claim"]
+        await asyncio.sleep(0.01 * (len(CLAIMS) - claim.original_index))
+        result = (
+            VerificationResult.REFUTED if "cheese" in claim.claim_text else VerificationResult.SUPPORTED
+        )
+        return {
+            "verdict": Verdict(
+                claim_text=claim.claim_text,
+                disambiguated_sentence=claim.disambiguated_sentence,
+                original_sentence=claim.original_sentence,
+                original_index=claim.original_index,
+                result=result,
+                reasoning="ok",
+            )
+        }
+
+
+class ReportStreamingTests(unittest.TestCase):
+    def _stream(self):
+        async def collect():
+            snapshots, final_report = [], None
+            async for mode, chunk in create_graph().astream(
+                {"answer": " ".join(claim.claim_text for claim in CLAIMS)},
+                {"configurable": {"memoize": False}},
+                stream_mode=["custom", "updates"],
+            ):
+                if mode == "custom" and chunk.get("type") == SNAPSHOT_EVENT:
+                    snapshots.append(chunk)
+                elif mode == "updates" and "generate_report_node" in chunk:
+                    final_report = chunk["generate_report_node"]["final_report"]
+            return snapshots, final_report
+
+        with mock.patch("claim_extractor.agent._graph", FakeExtractor()), mock.patch(
+            "claim_verifier.agent._graph", FakeVerifier()
+        ):
+            return asyncio.run(collect())
+
+    def test_snapshots_grow_as_claims_complete(self):
+        snapshots, _ = self._stream()
+        partial = [snapshot for snapshot in snapshots if not snapshot["final"]]
+
+        self.assertEqual([s["claims_verified"] for s in partial], [1, 2, 3])
+        self.assertTrue(all(s["claims_total"] == 3 for s in partial))
+        self.assertEqual(len(partial[0]["pending_claims"]), 2)
+        self.assertEqual(partial[0]["verified_claims"][0]["claim_text"], CLAIMS[2].claim_text)
+        self.assertIn("1 of 3 claims verified", partial[0]["summary"])
+
+    def test_final_snapshot_reconciles_with_report(self):
+        snapshots, report = self._stream()
+        final = snapshots[-1]
+
+        self.assertTrue(final["final"])
+        self.assertEqual(final["summary"], report.summary)
+        self.assertEqual(
+            final["verified_claims"], [verdict.model_dump(mode="json") for verdict in report.verified_claims]
+        )
+        self.assertEqual(final["counts"]["Supported"], 2)
+        self.assertEqual(final["counts"]["Refuted"], 1)
+        self.assertEqual(final["pending_claims"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
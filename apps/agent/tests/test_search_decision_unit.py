@@ -0,0 +1,122 @@
+"""Unit tests for the search decision modes of the claim verifier."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from claim_verifier.agent import create_graph
+from claim_verifier.nodes import (
+    evaluate_evidence,
+    generate_search_query,
+    retrieve_evidence,
+    search_decision,
+)
+from claim_verifier.nodes.search_decision import _heuristic_decision, get_search_decision_mode
+from claim_verifier.schemas import Evidence
+from search.models import SearchResult
+
+CLAIM_TEXT = "Apollo 11 landed on the Moon in 1969."
+CLAIM = {
+    "claim_text": CLAIM_TEXT,
+    "is_complete_declarative": True,
+    "disambiguated_sentence": CLAIM_TEXT,
+    "original_sentence": CLAIM_TEXT,
+    "original_index": 0,
+}
+
+
+def _evidence(url: str, text: str) -> Evidence:
+    return Evidence(url=url, text=text)
+
+
+class HeuristicDecisionTests(unittest.TestCase):
+    def test_too_little_evidence_searches_again(self):
+        evidence = [_evidence("https://nasa.gov/a", CLAIM_TEXT)]
+        self.assertTrue(_heuristic_decision(CLAIM_TEXT, evidence).needs_more_evidence)
+
+    def test_irrelevant_evidence_searches_again_with_missing_terms(self):
+        evidence = [_evidence(f"https://site{i}.com", "Recipes for banana bread.") for i in range(3)]
+        assessment = _heuristic_decision(CLAIM_TEXT, evidence)
+
+        self.assertTrue(assessment.needs_more_evidence)
+        self.assertIn("apollo", assessment.missing_aspects[0])
+
+    def test_relevant_authoritative_evidence_is_sufficient(self):
+        evidence = [
+            _evidence("https://www.nasa.gov/apollo", "Apollo 11 landed on the Moon on July 20, 1969."),
+            _evidence("https://blog.example.com/a", "In 1969 Apollo 11 landed on the Moon."),
+            _evidence("https://news.example.org/b", "The Moon landing of Apollo 11 took place in 1969."),
+        ]
+        self.assertFalse(_heuristic_decision(CLAIM_TEXT, evidence).needs_more_evidence)
+
+    def test_mixed_evidence_defers_to_llm(self):
+        evidence = [
+            _evidence("https://blog.example.com/a", "Apollo 11 landed on the Moon in 1969."),
+            _evidence("https://forum.example.net/b", "Was the Moon landing staged?"),
+        ]
+        self.assertIsNone(_heuristic_decision(CLAIM_TEXT, evidence))
+
+    def test_unknown_mode_raises(self):
+        with self.assertRaises(ValueError):
+            get_search_decision_mode({"configurable": {"search_decision_mode": "fast"}})
+
+
+class DecisionModeFlowTests(unittest.TestCase):
+    """Runs the verifier graph with stubbed search and LLM calls."""
+
+    def _run(self, mode, evaluation_outputs):
+        calls = []
+
+        async def fake_search(query, max_results):
+            n = len(calls)
+            return [
+                SearchResult(url=f"https://blog{n}.example.com/a", content=CLAIM_TEXT),
+                SearchResult(url=f"https://forum{n}.example.net/b", content="Was it staged?"),
+            ]
+
+        async def fake_llm(llm, output_class, messages, context_desc):
+            calls.append(output_class.__name__)
+            if output_class.__name__ == "QueryGenerationOutput":
+                return output_class(query="apollo 11 moon landing")
+            if output_class.__name__ == "SearchDecisionOutput":
+                return output_class(needs_more_evidence=False)
+            return output_class(**evaluation_outputs.pop(0))
+
+        with mock.patch.object(retrieve_evidence, "search", fake_search):
+            with mock.patch.multiple(
+                generate_search_query, call_llm_with_structured_output=fake_llm, get_llm=mock.DEFAULT
+            ), mock.patch.multiple(
+                search_decision, call_llm_with_structured_output=fake_llm, get_llm=mock.DEFAULT
+            ), mock.patch.multiple(
+                evaluate_evidence, call_llm_with_structured_output=fake_llm, get_llm=mock.DEFAULT
+            ):
+                result = asyncio.run(
+                    create_graph().ainvoke(
+                        {"claim": CLAIM}, config={"configurable": {"search_decision_mode": mode}}
+                    )
+                )
+        return result, calls
+
+    def test_llm_mode_asks_the_llm(self):
+        result, calls = self._run("llm", [{"verdict": "Supported", "reasoning": "ok"}])
+
+        self.assertEqual(result["search_decisions"], ["llm"])
+        self.assertEqual(calls.count("SearchDecisionOutput"), 1)
+
+    def test_merged_mode_lets_evaluation_request_more_evidence(self):
+        result, calls = self._run(
+            "merged",
+            [
+                {"verdict": "Supported", "reasoning": "-", "needs_more_evidence": True},
+                {"verdict": "Supported", "reasoning": "ok"},
+            ],
+        )
+
+        self.assertNotIn("SearchDecisionOutput", calls)
+        self.assertEqual(calls.count("MergedEvaluationOutput"), 2)
+        self.assertEqual(result["iteration_count"], 1)
+        self.assertEqual(result["verdict"].reasoning, "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
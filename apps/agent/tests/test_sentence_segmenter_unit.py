@@ -0,0 +1,218 @@
+"""Unit tests for the sentence segmenters and the sentence table."""
+
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from unittest import mock
+
+from claim_extractor.nodes import sentence_splitter
+from claim_extractor.nodes.sentence_splitter import (
+    RegexSegmenter,
+    _sentence_splitter_and_context_creator,
+    get_segmenter,
+    get_sentence_tokenizer,
+)
+from utils import render_context, server
+
+
+class RegexSegmenterTests(unittest.TestCase):
+    def setUp(self):
+        self.segmenter = RegexSegmenter()
+
+    def test_splits_on_terminal_punctuation(self):
+        self.assertEqual(
+            self.segmenter.segment("It rained. Was it cold? Yes! \"Very,\" she said."),
+            ["It rained.", "Was it cold?", "Yes!", "\"Very,\" she said."],
+        )
+
+    def test_keeps_abbreviations_initials_and_decimals(self):
+        text = (
+            "Dr. Smith met J. K. Rowling in the U.S. last year. "
+            "Growth was 3.5 percent, e.g. in Europe. It ended."
+        )
+        self.assertEqual(
+            self.segmenter.segment(text),
+            [
+                "Dr. Smith met J. K. Rowling in the U.S. last year.",
+                "Growth was 3.5 percent, e.g. in Europe.",
+                "It ended.",
+            ],
+        )
+
+    def test_keeps_citation_markers_with_their_sentence(self):
+        self.assertEqual(
+            self.segmenter.segment("It was built in 1982.[^1^] [^2^] It failed."),
+            ["It was built in 1982.[^1^] [^2^]", "It failed."],
+        )
+
+    def test_markdown_structure(self):
+        text = (
+            "## Key facts\n"
+            "Some examples are:\n"
+            "- The **Jarvik-7** was first\n"
+            "  implanted in 1982. It was famous.\n"
+            "2) Numbered item\n"
+            "\n"
+            "```python\n"
+            "x = 1. Not prose.\n"
+            "```\n"
+            "Closing remark\\nafter a literal newline."
+        )
+        self.assertEqual(
+            self.segmenter.segment(text),
+            [
+                "Key facts",
+                "Some examples are:",
+                "The **Jarvik-7** was first implanted in 1982.",
+                "It was famous.",
+                "Numbered item",
+                "Closing remark after a literal newline.",
+            ],
+        )
+
+
+class SegmenterSelectionTests(unittest.TestCase):
+    def test_get_segmenter(self):
+        self.assertIsInstance(get_segmenter("regex"), RegexSegmenter)
+        self.assertIs(get_segmenter("regex"), get_segmenter("regex"))
+        with self.assertRaises(ValueError):
+            get_segmenter("unknown")
+
+    def test_items_reference_the_sentence_table(self):
+        sentences, items = asyncio.run(
+            _sentence_splitter_and_context_creator(
+                "First one. Second one. Third one.", segmenter=get_segmenter("regex")
+            )
+        )
+
+        self.assertEqual(sentences, ["First one.", "Second one.", "Third one."])
+        self.assertEqual([item.original_index for item in items], [0, 1, 2])
+        self.assertEqual(items[1].original_sentence, sentences[1])
+
+
+class FakePunkt:
+    loads = 0
+
+    def __init__(self, language):
+        FakePunkt.loads += 1
+
+    def tokenize(self, text):
+        return [text]
+
+
+class UnreadySegmenter(RegexSegmenter):
+    @property
+    def ready(self):
+        return False
+
+
+class TokenizerLoadingTests(unittest.TestCase):
+    def setUp(self):
+        FakePunkt.loads = 0
+        patches = [
+            mock.patch.object(sentence_splitter, "_tokenizer", None),
+            # Slow enough that the first callers all race for the lock
+            mock.patch.object(sentence_splitter, "ensure_nltk_resources", lambda: time.sleep(0.05)),
+            mock.patch("nltk.tokenize.PunktTokenizer", FakePunkt),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_concurrent_first_calls_load_punkt_once(self):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            tokenizers = list(pool.map(lambda _: get_sentence_tokenizer(), range(8)))
+
+        self.assertEqual(FakePunkt.loads, 1)
+        self.assertTrue(all(tokenizer is tokenizers[0] for tokenizer in tokenizers))
+        self.assertTrue(sentence_splitter.PunktSegmenter().ready)
+
+    def test_punkt_splits_lines_but_not_escaped_newlines(self):
+        self.assertEqual(
+            sentence_splitter.PunktSegmenter().segment("Use \\n to break.\r\nNext line."),
+            ["Use \\n to break.", "Next line."],
+        )
+
+    def test_server_lifespan_warms_tokenizer_in_a_thread(self):
+        threads = []
+
+        def load():
+            threads.append(threading.current_thread())
+            return get_sentence_tokenizer()
+
+        @asynccontextmanager
+        async def no_redis(app):
+            yield
+
+        async def run():
+            async with server.lifespan(None):
+                pass
+
+        with mock.patch.object(server, "redis_lifespan", no_redis), mock.patch.object(
+            sentence_splitter, "get_sentence_tokenizer", load
+        ):
+            asyncio.run(run())
+
+        self.assertEqual(FakePunkt.loads, 1)
+        self.assertIsNot(threads[0], threading.main_thread())
+
+    def test_failed_warm_up_does_not_stop_the_server(self):
+        def fail():
+            raise LookupError("punkt_tab")
+
+        async def run():
+            with self.assertLogs(server.logger, "WARNING"):
+                await server._warm_sentence_tokenizer()
+
+        with mock.patch.object(sentence_splitter, "get_sentence_tokenizer", fail):
+            asyncio.run(run())
+
+
+class SplitOffloadTests(unittest.TestCase):
+    def _split(self, text, segmenter):
+        with mock.patch("asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            sentences, _ = asyncio.run(_sentence_splitter_and_context_creator(text, segmenter))
+        return sentences, to_thread.call_count
+
+    def test_unready_segmenter_splits_in_a_thread(self):
+        sentences, offloaded = self._split("First one. Second one.", UnreadySegmenter())
+
+        self.assertEqual(sentences, ["First one.", "Second one."])
+        self.assertEqual(offloaded, 1)
+
+    def test_long_text_splits_in_a_thread(self):
+        with mock.patch.object(sentence_splitter, "OFFLOAD_THRESHOLD_CHARS", 10):
+            _, offloaded = self._split("First one. Second one.", get_segmenter("regex"))
+
+        self.assertEqual(offloaded, 1)
+
+    def test_short_text_with_a_ready_segmenter_stays_on_the_loop(self):
+        _, offloaded = self._split("First one. Second one.", get_segmenter("regex"))
+
+        self.assertEqual(offloaded, 0)
+
+
+class RenderContextTests(unittest.TestCase):
+    sentences = ["One is here.", "Two is here.", "Three is here.", "Four is here."]
+
+    def test_renders_window_around_sentence(self):
+        self.assertEqual(
+            render_context(self.sentences, 1, 5, 1, metadata="doc"),
+            "[Document Metadata: doc]\n"
+            "\n[Preceding Sentences:]\nOne is here.\n"
+            "\n[Sentence of Interest for current task:]\nTwo is here.\n"
+            "\n[Following Sentences:]\nThree is here.",
+        )
+
+    def test_omits_empty_sections(self):
+        self.assertEqual(
+            render_context(self.sentences, 0, 5, 0),
+            "\n[Sentence of Interest for current task:]\nOne is here.",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,35 +3,103 @@
 Common tools shared across all components.
 """
 
+from .batch import (
+    BATCH_PROVIDERS,
+    BatchBackend,
+    BatchDispatcher,
+    BatchRequest,
+    BatchRequestError,
+    BatchResult,
+    LocalBatchBackend,
+    OpenAIBatchBackend,
+    batch_llm_calls,
+    get_batch_backend,
+)
+from .cache import TTLCache
+from .deadline import (
+    deadline_from_budget,
+    deadline_reached,
+    earliest_deadline,
+    get_deadline,
+    run_within,
+    time_remaining,
+    with_deadline,
+)
 from .llm import (
     call_llm_with_structured_output,
+    collect_llm_errors,
     process_with_voting,
     estimate_token_count,
     truncate_evidence_for_token_limit,
 )
-from .models import get_llm, get_default_llm
-from .redis import redis_client, test_redis_connection
+from .memo import memo_enabled, memo_key
+from .models import LLMConfigurable, get_default_llm, get_llm, get_llm_selection
+from .redis import (
+    close_redis_pool,
+    get_redis,
+    get_redis_pool,
+    init_redis_pool,
+    redis_client,
+    redis_lifespan,
+    test_redis_connection,
+)
 from .settings import settings
-from .text import remove_following_sentences
+from .text import render_context
+from .usage import LLMUsageTracker, cached_input_tokens
 
 __all__ = [
+    # Batch mode
+    "BATCH_PROVIDERS",
+    "BatchBackend",
+    "BatchDispatcher",
+    "BatchRequest",
+    "BatchRequestError",
+    "BatchResult",
+    "LocalBatchBackend",
+    "OpenAIBatchBackend",
+    "batch_llm_calls",
+    "get_batch_backend",
+    # Caching
+    "TTLCache",
+    # Deadlines
+    "deadline_from_budget",
+    "deadline_reached",
+    "earliest_deadline",
+    "get_deadline",
+    "run_within",
+    "time_remaining",
+    "with_deadline",
     # Checkpointer utilities
     "create_checkpointer",
     "setup_checkpointer",
     "create_checkpointer_sync",
     # LLM utilities
     "call_llm_with_structured_output",
+    "collect_llm_errors",
     "process_with_voting",
     "estimate_token_count",
     "truncate_evidence_for_token_limit",
+    # Memoisation
+    "memo_enabled",
+    "memo_key",
     # LLM models
     "get_llm",
     "get_default_llm",
+    "get_llm_selection",
+    "LLMConfigurable",
     # Redis utilities
     "redis_client",
     "test_redis_connection",
+    "get_redis",
+    "get_redis_pool",
+    "init_redis_pool",
+    "close_redis_pool",
+    "redis_lifespan",
     # Settings
     "settings",
     # Text utilities
-    "remove_following_sentences",
+    "render_context",
+    # Token usage
+    "LLMUsageTracker",
+    "cached_input_tokens",
 ]
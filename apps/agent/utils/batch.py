@@ -0,0 +1,445 @@
+"""Provider batch-API mode for offline runs.
+
+Inside ``batch_llm_calls``, call_llm_with_structured_output does not call the
+real-time API. Each request is queued with the active BatchDispatcher, which
+submits everything queued while the graphs wait as one provider batch, polls
+it and resolves the waiting calls with its results. Running many graph
+invocations concurrently therefore moves them through the pipeline stage by
+stage, one batch per stage round, without real-time rate limits.
+
+Submitted batches and received results are recorded in a state file, so an
+interrupted run resumes polling its batches and reuses finished results
+instead of paying for the requests again.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from collections import Counter
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+from langchain_core.messages import BaseMessage, convert_to_openai_messages
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+BATCH_PROVIDERS = ("openai",)
+
+
+class BatchRequestError(RuntimeError):
+    """A request of a provider batch failed or got no result."""
+
+
+@dataclass
+class BatchRequest:
+    """One structured-output chat completion in a provider batch."""
+
+    custom_id: str
+    model: str
+    messages: List[Dict[str, Any]]
+    schema_name: str
+    json_schema: Dict[str, Any]
+    temperature: Optional[float] = None
+
+
+@dataclass
+class BatchResult:
+    """Response JSON, or the error, for one request of a finished batch."""
+
+    custom_id: str
+    content: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BatchBackend(ABC):
+    """A provider batch endpoint."""
+
+    @abstractmethod
+    async def submit(self, requests: List[BatchRequest]) -> str:
+        """Submit requests as one batch and return the batch id."""
+
+    @abstractmethod
+    async def poll(self, batch_id: str) -> Optional[List[BatchResult]]:
+        """Results of a finished batch, or None while it is still running."""
+
+
+class LocalBatchBackend(BatchBackend):
+    """In-process stand-in for a provider batch endpoint, for tests and dry runs.
+
+    Args:
+        respond: Returns the response JSON for a request (may be async); an
+            exception becomes an error result
+        pending_polls: How many polls report a batch as still running
+    """
+
+    def __init__(self, respond: Callable[[BatchRequest], Any], pending_polls: int = 0):
+        self.respond = respond
+        self.pending_polls = pending_polls
+        self.batches: Dict[str, List[BatchRequest]] = {}
+        self._polls: Counter = Counter()
+
+    async def submit(self, requests: List[BatchRequest]) -> str:
+        batch_id = f"local-{len(self.batches) + 1}"
+        self.batches[batch_id] = list(requests)
+        return batch_id
+
+    async def poll(self, batch_id: str) -> Optional[List[BatchResult]]:
+        self._polls[batch_id] += 1
+        if self._polls[batch_id] <= self.pending_polls:
+            return None
+
+        results = []
+        for request in self.batches[batch_id]:
+            try:
+                content = self.respond(request)
+                if inspect.isawaitable(content):
+                    content = await content
+                results.append(BatchResult(request.custom_id, content=content))
+            except Exception as e:
+                results.append(BatchResult(request.custom_id, error=str(e)))
+        return results
+
+
+class OpenAIBatchBackend(BatchBackend):
+    """OpenAI Batch API over /v1/chat/completions with a 24h completion window."""
+
+    ENDPOINT = "/v1/chat/completions"
+    RUNNING = ("validating", "in_progress", "finalizing", "cancelling")
+
+    def __init__(self, api_key: Optional[str] = None):
+        from openai import AsyncOpenAI
+
+        from utils.settings import settings
+
+        api_key = api_key or settings.openai_api_key
+        if not api_key:
+            raise ValueError("OpenAI API key not found in environment variables")
+        self.client = AsyncOpenAI(api_key=api_key)
+
+    @staticmethod
+    def _body(request: BatchRequest) -> Dict[str, Any]:
+        body = {
+            "model": request.model,
+            "messages": request.messages,
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"name": request.schema_name, "schema": request.json_schema},
+            },
+        }
+        if request.temperature is not None:
+            body["temperature"] = request.temperature
+        return body
+
+    async def submit(self, requests: List[BatchRequest]) -> str:
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": request.custom_id,
+                    "method": "POST",
+                    "url": self.ENDPOINT,
+                    "body": self._body(request),
+                }
+            )
+            for request in requests
+        ]
+        batch_file = await self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id, endpoint=self.ENDPOINT, completion_window="24h"
+        )
+        return batch.id
+
+    @staticmethod
+    def _parse_line(line: str) -> BatchResult:
+        record = json.loads(line)
+        response = record.get("response") or {}
+        body = response.get("body") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            error = record.get("error") or body.get("error") or f"status {response.get('status_code')}"
+            return BatchResult(record["custom_id"], error=str(error))
+
+        message = body["choices"][0]["message"]
+        if message.get("refusal"):
+            return BatchResult(record["custom_id"], error=f"refused: {message['refusal']}")
+        return BatchResult(record["custom_id"], content=message.get("content"))
+
+    async def poll(self, batch_id: str) -> Optional[List[BatchResult]]:
+        batch = await self.client.batches.retrieve(batch_id)
+        if batch.status in self.RUNNING:
+            return None
+
+        results = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                content = await self.client.files.content(file_id)
+                results.extend(
+                    self._parse_line(line) for line in content.text.splitlines() if line.strip()
+                )
+        if not results:
+            logger.warning(f"Batch {batch_id} ended with status {batch.status} and no output")
+        return results
+
+
+def get_batch_backend(provider: str) -> BatchBackend:
+    """Batch backend for an LLM provider.
+
+    Raises:
+        ValueError: If the provider has no supported batch endpoint
+    """
+    if provider == "openai":
+        return OpenAIBatchBackend()
+    raise ValueError(
+        f"Batch mode is not available for provider: {provider}. "
+        f"Supported providers: {list(BATCH_PROVIDERS)}"
+    )
+
+
+def llm_parameters(llm: Any) -> Tuple[str, Optional[float]]:
+    """Model name and temperature of a chat model, unwrapping provider wrappers."""
+    llm = getattr(llm, "actual_llm", None) or llm
+    model = getattr(llm, "model_name", None) or getattr(llm, "model", None)
+    if not model:
+        raise ValueError(f"Cannot determine the model of {type(llm).__name__} for batch mode")
+    return str(model), getattr(llm, "temperature", None)
+
+
+@lru_cache(maxsize=None)
+def _json_schema(output_class: Type[BaseModel]) -> Dict[str, Any]:
+    return output_class.model_json_schema()
+
+
+class BatchDispatcher:
+    """Queues structured-output calls and resolves them from provider batches.
+
+    Args:
+        backend: Provider batch endpoint
+        state_path: JSON file recording submitted batches and results, for
+            resuming an interrupted run; None to keep them in memory only
+        max_requests: Most requests per submitted batch
+        collect_seconds: Quiet period after the last queued request before
+            the queue is submitted
+        poll_seconds: Interval between polls of a running batch
+        max_poll_errors: Consecutive poll failures before the batch's calls
+            fail (the batch stays in the state file for the next run)
+    """
+
+    def __init__(
+        self,
+        backend: BatchBackend,
+        state_path: Optional[str] = None,
+        max_requests: int = 50000,
+        collect_seconds: float = 2.0,
+        poll_seconds: float = 30.0,
+        max_poll_errors: int = 5,
+    ):
+        self.backend = backend
+        self.state_path = Path(state_path) if state_path else None
+        self.max_requests = max_requests
+        self.collect_seconds = collect_seconds
+        self.poll_seconds = poll_seconds
+        self.max_poll_errors = max_poll_errors
+
+        self._state: Dict[str, Dict[str, Any]] = {"batches": {}, "results": {}}
+        if self.state_path and self.state_path.exists():
+            self._state = json.loads(self.state_path.read_text())
+        self._batch_of = {
+            custom_id: batch_id
+            for batch_id, custom_ids in self._state["batches"].items()
+            for custom_id in custom_ids
+        }
+
+        self._occurrences: Counter = Counter()
+        self._queued: List[BatchRequest] = []
+        self._futures: Dict[str, asyncio.Future] = {}
+        self._pollers: Dict[str, asyncio.Task] = {}
+        self._tasks: set = set()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        self.submitted_batches = 0
+        self.submitted_requests = 0
+        self.reused_results = 0
+
+    def _build_request(
+        self, llm: Any, output_class: Type[BaseModel], messages: List[BaseMessage]
+    ) -> BatchRequest:
+        model, temperature = llm_parameters(llm)
+        payload = {
+            "model": model,
+            "messages": convert_to_openai_messages(messages),
+            "schema_name": output_class.__name__,
+            "json_schema": _json_schema(output_class),
+            "temperature": temperature,
+        }
+        # Identical requests (e.g. voting completions) are numbered so each
+        # gets its own response; the ids are stable across reruns
+        digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:32]
+        occurrence = self._occurrences[digest]
+        self._occurrences[digest] += 1
+        return BatchRequest(custom_id=f"{digest}-{occurrence}", **payload)
+
+    async def request(
+        self, llm: Any, output_class: Type[M], messages: List[BaseMessage]
+    ) -> M:
+        """Queue one structured-output call and wait for its batch result.
+
+        Raises:
+            BatchRequestError: If the request failed in its batch
+        """
+        request = self._build_request(llm, output_class, messages)
+
+        content = self._state["results"].get(request.custom_id)
+        if content is None:
+            future = asyncio.get_running_loop().create_future()
+            self._futures[request.custom_id] = future
+
+            batch_id = self._batch_of.get(request.custom_id)
+            if batch_id is not None:
+                self._start_polling(batch_id)
+            else:
+                self._queued.append(request)
+                self._schedule_flush(0 if len(self._queued) >= self.max_requests else self.collect_seconds)
+            content = await future
+        else:
+            self.reused_results += 1
+
+        return output_class.model_validate_json(content)
+
+    def _schedule_flush(self, delay: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = asyncio.get_running_loop().call_later(delay, self._flush)
+
+    def _flush(self) -> None:
+        self._timer = None
+        requests, self._queued = self._queued, []
+        if requests:
+            self._spawn(self._submit(requests))
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _submit(self, requests: List[BatchRequest]) -> None:
+        try:
+            batch_id = await self.backend.submit(requests)
+        except Exception as e:
+            logger.error(f"Submitting a batch of {len(requests)} requests failed: {e}")
+            for request in requests:
+                self._fail(request.custom_id, f"batch submission failed: {e}")
+            return
+
+        custom_ids = [request.custom_id for request in requests]
+        self._state["batches"][batch_id] = custom_ids
+        self._batch_of.update({custom_id: batch_id for custom_id in custom_ids})
+        self._save_state()
+
+        self.submitted_batches += 1
+        self.submitted_requests += len(requests)
+        logger.info(f"Submitted batch {batch_id} with {len(requests)} requests")
+        self._start_polling(batch_id)
+
+    def _start_polling(self, batch_id: str) -> None:
+        if batch_id not in self._pollers:
+            self._pollers[batch_id] = self._spawn(self._poll(batch_id))
+
+    async def _poll(self, batch_id: str) -> None:
+        errors = 0
+        while True:
+            try:
+                results = await self.backend.poll(batch_id)
+                errors = 0
+            except Exception as e:
+                errors += 1
+                logger.warning(f"Polling batch {batch_id} failed ({errors}/{self.max_poll_errors}): {e}")
+                if errors >= self.max_poll_errors:
+                    self._pollers.pop(batch_id, None)
+                    for custom_id in self._state["batches"].get(batch_id, []):
+                        self._fail(custom_id, f"polling batch {batch_id} failed: {e}")
+                    return
+                results = None
+            if results is not None:
+                break
+            await asyncio.sleep(self.poll_seconds)
+
+        by_id = {result.custom_id: result for result in results}
+        for custom_id in self._state["batches"].pop(batch_id, []):
+            self._batch_of.pop(custom_id, None)
+            result = by_id.get(custom_id)
+            if result is not None and result.content is not None:
+                self._state["results"][custom_id] = result.content
+                future = self._futures.pop(custom_id, None)
+                if future is not None and not future.done():
+                    future.set_result(result.content)
+            else:
+                # Failed requests are not recorded, so a rerun submits them again
+                self._fail(custom_id, result.error if result else f"missing from batch {batch_id} output")
+        self._pollers.pop(batch_id, None)
+        self._save_state()
+        logger.info(f"Batch {batch_id} finished with {len(results)} results")
+
+    def _fail(self, custom_id: str, error: str) -> None:
+        future = self._futures.pop(custom_id, None)
+        if future is not None and not future.done():
+            future.set_exception(BatchRequestError(error))
+
+    def _save_state(self) -> None:
+        if self.state_path is None:
+            return
+        temporary = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+        temporary.write_text(json.dumps(self._state))
+        os.replace(temporary, self.state_path)
+
+    async def aclose(self) -> None:
+        """Stop the timer and pollers and save the state."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._save_state()
+
+
+_DISPATCHER: ContextVar[Optional[BatchDispatcher]] = ContextVar("batch_dispatcher", default=None)
+
+
+def current_batch_dispatcher() -> Optional[BatchDispatcher]:
+    """The dispatcher of the enclosing batch_llm_calls block, if any."""
+    return _DISPATCHER.get()
+
+
+@asynccontextmanager
+async def batch_llm_calls(
+    backend: BatchBackend, state_path: Optional[str] = None, **options: Any
+) -> AsyncIterator[BatchDispatcher]:
+    """Route structured-output LLM calls made in this block through provider batches.
+
+    Tasks started inside the block use the same dispatcher, so graph runs
+    gathered here share batches.
+
+    Args:
+        backend: Provider batch endpoint, see get_batch_backend
+        state_path: State file for resuming an interrupted run
+        **options: Further BatchDispatcher settings
+    """
+    dispatcher = BatchDispatcher(backend, state_path, **options)
+    token = _DISPATCHER.set(dispatcher)
+    try:
+        yield dispatcher
+    finally:
+        _DISPATCHER.reset(token)
+        await dispatcher.aclose()
@@ -0,0 +1,85 @@
+"""Deadline propagation helpers.
+
+A run's deadline travels in ``RunnableConfig["configurable"]["deadline"]`` as
+a wall-clock timestamp (seconds since the epoch), so nested graphs and the
+nodes inside them can bound their own work against the same SLA.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Optional, TypeVar
+
+from langchain_core.runnables import RunnableConfig
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+def deadline_from_budget(seconds: Optional[float], now: Optional[float] = None) -> Optional[float]:
+    """Absolute deadline for a time budget in seconds, None for no budget."""
+    if seconds is None:
+        return None
+    return (time.time() if now is None else now) + float(seconds)
+
+
+def earliest_deadline(*deadlines: Optional[float]) -> Optional[float]:
+    """The earliest of the given deadlines, ignoring missing ones."""
+    present = [deadline for deadline in deadlines if deadline is not None]
+    return min(present) if present else None
+
+
+def get_deadline(config: Optional[RunnableConfig]) -> Optional[float]:
+    """Deadline of the run, or None when it has no time budget."""
+    configurable = (config or {}).get("configurable") or {}
+    deadline = configurable.get("deadline")
+    return float(deadline) if deadline is not None else None
+
+
+def with_deadline(config: RunnableConfig, deadline: Optional[float]) -> RunnableConfig:
+    """Copy of ``config`` whose deadline is the earlier of its own and ``deadline``."""
+    configurable = dict((config or {}).get("configurable") or {})
+    combined = earliest_deadline(configurable.get("deadline"), deadline)
+    if combined is None:
+        return config
+    configurable["deadline"] = combined
+    return {**(config or {}), "configurable": configurable}
+
+
+def time_remaining(config: Optional[RunnableConfig], reserve: float = 0.0) -> Optional[float]:
+    """Seconds left before the deadline minus ``reserve``, None without a deadline.
+
+    Never negative, so the result can be used directly as a timeout.
+    """
+    deadline = get_deadline(config)
+    if deadline is None:
+        return None
+    return max(0.0, deadline - reserve - time.time())
+
+
+def deadline_reached(config: Optional[RunnableConfig], reserve: float = 0.0) -> bool:
+    """Whether less than ``reserve`` seconds are left before the deadline."""
+    return time_remaining(config, reserve) == 0.0
+
+
+async def run_within(
+    awaitable: Awaitable[T],
+    timeout: Optional[float],
+    default: T,
+    description: str = "operation",
+) -> T:
+    """Await ``awaitable`` for at most ``timeout`` seconds, returning ``default`` on timeout."""
+    if timeout is None:
+        return await awaitable
+    if timeout <= 0:
+        # Do not start work that cannot finish in time
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        logger.warning(f"Deadline already reached, skipping {description}")
+        return default
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Deadline reached after {timeout:.1f}s during {description}")
+        return default
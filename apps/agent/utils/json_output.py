@@ -0,0 +1,169 @@
+"""Fast extraction of JSON objects from free-form LLM responses.
+
+Used by the DeepSeek wrapper: JSON mode usually returns a bare object, but
+models still wrap it in prose or a code fence now and then. A bare object is
+parsed directly; otherwise candidate ``{...}`` spans are found in one
+left-to-right scan that skips braces inside JSON strings. Per-schema tables
+(the example shape for the prompt, which fields hold enums) are built once
+per schema class.
+
+orjson is used for parsing when installed, with json as the fallback.
+"""
+
+import json
+import re
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Optional, Tuple, Type, get_args
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+# Structural characters outside strings, and a whole JSON string literal
+_TOKEN = re.compile(r'[{}"]')
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+
+def loads(payload: str) -> Any:
+    """json.loads, through orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            pass  # json also accepts NaN, Infinity and huge integers
+    return json.loads(payload)
+
+
+def _balanced_end(text: str, begin: int) -> Optional[int]:
+    """End of the {...} opened at ``begin``, or None if it never closes."""
+    depth = 0
+    pos = begin
+    while True:
+        match = _TOKEN.search(text, pos)
+        if match is None:
+            return None
+        if match.group() == '"':
+            string = _STRING.match(text, match.start())
+            if string is None:
+                return None
+            pos = string.end()
+            continue
+        pos = match.end()
+        depth += 1 if match.group() == "{" else -1
+        if depth == 0:
+            return pos
+
+
+def json_object_spans(text: str) -> Iterator[Tuple[int, int]]:
+    """(start, end) of each top-level balanced {...} in ``text``, in order.
+
+    Stops at the first brace that never closes: a truncated response yields
+    nothing rather than one of its nested objects. The same applies to a lone
+    quoted brace in prose before the object, e.g. 'use "{" to start'.
+    """
+    begin = text.find("{")
+    while begin != -1:
+        end = _balanced_end(text, begin)
+        if end is None:
+            return
+        yield begin, end
+        begin = text.find("{", end)
+
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """The first JSON object in an LLM response, or None if there is none."""
+    if not text:
+        return None
+
+    text = text.strip()
+    if text.startswith("{") and text.endswith("}"):
+        try:
+            data = loads(text)
+            if isinstance(data, dict):
+                return data
+        except (ValueError, RecursionError):
+            pass
+
+    for start, end in json_object_spans(text):
+        try:
+            data = loads(text[start:end])
+        except (ValueError, RecursionError):
+            continue
+        if isinstance(data, dict):
+            return data
+    return None
+
+
+@lru_cache(maxsize=None)
+def schema_example_json(schema: Type[BaseModel]) -> str:
+    """Example shape of a schema for the prompt, e.g. {"claims": <List>}."""
+    fields = getattr(schema, "model_fields", None)
+    if not fields:
+        return "{}"
+
+    fragments = []
+    for field_name, field_def in fields.items():
+        annotation = getattr(field_def, "annotation", None)
+        type_name = getattr(annotation, "__name__", str(annotation)) if annotation else "value"
+        fragments.append(f'"{field_name}": <{type_name}>')
+    return "{" + ", ".join(fragments) + "}"
+
+
+def _leaf_types(annotation: Any) -> Tuple[Any, ...]:
+    args = get_args(annotation)
+    if not args:
+        return (annotation,)
+    return tuple(leaf for arg in args for leaf in _leaf_types(arg))
+
+
+def _enum_variants(enum: Type[Enum]) -> Dict[str, str]:
+    """Lowercase spellings models use for each member, mapped to its value."""
+    variants = {}
+    for member in enum:
+        if isinstance(member.value, str):
+            value = member.value
+            for variant in (value, value.replace(" ", "_"), member.name):
+                variants[variant.lower()] = value
+    return variants
+
+
+@lru_cache(maxsize=None)
+def _enum_tables(schema: Type[BaseModel]) -> Tuple[Dict[str, Dict[str, str]], Dict[str, Type[BaseModel]]]:
+    """Enum spellings per enum field, and nested model per model field."""
+    enum_fields: Dict[str, Dict[str, str]] = {}
+    model_fields: Dict[str, Type[BaseModel]] = {}
+    for name, field in getattr(schema, "model_fields", {}).items():
+        for leaf in _leaf_types(field.annotation):
+            if isinstance(leaf, type) and issubclass(leaf, Enum):
+                enum_fields[name] = _enum_variants(leaf)
+            elif isinstance(leaf, type) and issubclass(leaf, BaseModel):
+                model_fields[name] = leaf
+    return enum_fields, model_fields
+
+
+def normalize_enum_values(data: Dict[str, Any], schema: Type[BaseModel]) -> Dict[str, Any]:
+    """Fix the casing of enum values in place, e.g. 'SUPPORTED' -> 'Supported'.
+
+    Only fields the schema declares as enums (directly, in lists or in
+    nested models) are touched.
+    """
+    enum_fields, model_fields = _enum_tables(schema)
+    for name, variants in enum_fields.items():
+        value = data.get(name)
+        if isinstance(value, str):
+            data[name] = variants.get(value.lower(), value)
+        elif isinstance(value, list):
+            data[name] = [
+                variants.get(item.lower(), item) if isinstance(item, str) else item for item in value
+            ]
+    for name, model in model_fields.items():
+        value = data.get(name)
+        items = value if isinstance(value, list) else [value]
+        for item in items:
+            if isinstance(item, dict):
+                normalize_enum_values(item, model)
+    return data
@@ -5,18 +5,37 @@ Helper functions for working with language models.
 
 import asyncio
 import logging
-from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from pydantic import BaseModel
 
+from .batch import current_batch_dispatcher
+
 T = TypeVar("T")
 R = TypeVar("R")
 M = TypeVar("M", bound=BaseModel)
 
 logger = logging.getLogger(__name__)
 
+# Errors of structured-output calls, collected while collect_llm_errors is active
+_LLM_ERRORS: ContextVar[Optional[List[str]]] = ContextVar("llm_errors", default=None)
+
 
 def estimate_token_count(text: str) -> int:
     return len(text) // 4
@@ -124,6 +143,23 @@ def _normalize_messages(messages: Iterable[MessageLike]) -> List[BaseMessage]:
     return normalized
 
 
+@contextmanager
+def collect_llm_errors() -> Iterator[List[str]]:
+    """Collect the failures of call_llm_with_structured_output in this context.
+
+    call_llm_with_structured_output turns errors into None, which callers
+    cannot tell apart from an empty answer; this lets them find out, e.g.
+    before caching a result. Tasks started inside the block report to the
+    same list.
+    """
+    errors: List[str] = []
+    token = _LLM_ERRORS.set(errors)
+    try:
+        yield errors
+    finally:
+        _LLM_ERRORS.reset(token)
+
+
 async def call_llm_with_structured_output(
     llm: BaseChatModel,
     output_class: Type[M],
@@ -144,9 +180,16 @@ async def call_llm_with_structured_output(
     normalized_messages = _normalize_messages(messages)
 
     try:
+        # Inside batch_llm_calls the request goes into a provider batch
+        dispatcher = current_batch_dispatcher()
+        if dispatcher is not None:
+            return await dispatcher.request(llm, output_class, normalized_messages)
         return await llm.with_structured_output(output_class).ainvoke(normalized_messages)
     except Exception as e:
         logger.error(f"Error in LLM call for {context_desc}: {e}")
+        errors = _LLM_ERRORS.get()
+        if errors is not None:
+            errors.append(context_desc)
         return None
 
 
@@ -0,0 +1,29 @@
+"""Keys and switches for memoised pipeline results.
+
+Results of LLM stages are memoised per input content and LLM selection, so
+re-checking a lightly edited document only recomputes what changed.
+"""
+
+import hashlib
+from typing import Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from .models import get_llm_selection
+
+
+def memo_enabled(config: Optional[RunnableConfig], default: bool) -> bool:
+    """Whether to memoise: configurable.memoize, or ``default`` when unset."""
+    configurable = (config or {}).get("configurable") or {}
+    memoize = configurable.get("memoize")
+    return default if memoize is None else bool(memoize)
+
+
+def memo_key(stage: str, config: Optional[RunnableConfig], *parts: str) -> str:
+    """Digest of a stage's inputs and the run's LLM provider and model."""
+    provider, model = get_llm_selection(config)
+    digest = hashlib.sha256()
+    for part in (stage, provider, model or "", *parts):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
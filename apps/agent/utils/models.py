@@ -3,18 +3,21 @@
 Provides access to configured language model instances for all modules.
 """
 
-import json
 import logging
-import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
 
-from langchain.chat_models import init_chat_model
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import BaseMessage
-from langchain_openai import ChatOpenAI
+from langchain_core.runnables import RunnableConfig
 from pydantic import Field
 
+from utils.json_output import (
+    extract_json_object,
+    normalize_enum_values,
+    schema_example_json,
+)
 from utils.settings import settings
 
 
@@ -58,6 +61,9 @@ class OpenAIProvider(LLMProvider):
         if not settings.openai_api_key:
             raise ValueError("OpenAI API key not found in environment variables")
 
+        # Provider SDKs are imported on first use to keep cold starts fast
+        from langchain.chat_models import init_chat_model
+
         return init_chat_model(
             model=model_name,
             api_key=settings.openai_api_key,
@@ -99,6 +105,16 @@ class GeminiProvider(LLMProvider):
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=None)
+def _json_instruction(schema) -> str:
+    """JSON-only instruction appended to DeepSeek prompts, built once per schema."""
+    return (
+        "Please respond ONLY with valid JSON that matches this shape: "
+        f"{schema_example_json(schema)}. Do not include explanations or prose."
+    )
+
+
 class DeepSeekChatWrapper(BaseChatModel):
     """Wrapper for DeepSeek to handle structured output manually."""
 
@@ -141,19 +157,6 @@ class DeepSeekChatWrapper(BaseChatModel):
                     self.actual_llm = actual_llm
                     self.schema = schema
 
-                def _build_example_json(self) -> str:
-                    fields = getattr(self.schema, "model_fields", None)
-                    if not fields:
-                        return "{}"
-
-                    fragments = []
-                    for field_name, field_def in fields.items():
-                        annotation = getattr(field_def, "annotation", None)
-                        type_name = getattr(annotation, "__name__", str(annotation)) if annotation else "value"
-                        fragments.append(f'"{field_name}": <{type_name}>')
-
-                    return "{" + ", ".join(fragments) + "}"
-
                 def _format_request_with_json_instruction(
                     self, messages: List[BaseMessage]
                 ) -> List[BaseMessage]:
@@ -162,12 +165,8 @@ class DeepSeekChatWrapper(BaseChatModel):
                         return messages
 
                     enhanced_messages = list(messages)
-                    example_json = self._build_example_json()
                     last_msg = enhanced_messages[-1]
-                    instruction = (
-                        "Please respond ONLY with valid JSON that matches this shape: "
-                        f"{example_json}. Do not include explanations or prose."
-                    )
+                    instruction = _json_instruction(self.schema)
                     new_content = f"{last_msg.content}\n\n{instruction}" if last_msg.content else instruction
 
                     try:
@@ -197,86 +196,19 @@ class DeepSeekChatWrapper(BaseChatModel):
 
                     return str(content)
 
-                def _extract_json_segment(self, text: str) -> Optional[str]:
-                    if not text:
-                        return None
-
-                    text = text.strip()
-
-                    # Prefer fenced code blocks if present
-                    fence_match = re.search(r"```(?:json)?\s*(.*?)```", text, re.DOTALL | re.IGNORECASE)
-                    if fence_match:
-                        return fence_match.group(1).strip()
-
-                    start = text.find("{")
-                    if start == -1:
-                        return None
-
-                    depth = 0
-                    for idx in range(start, len(text)):
-                        char = text[idx]
-                        if char == "{":
-                            depth += 1
-                        elif char == "}":
-                            depth -= 1
-                            if depth == 0:
-                                return text[start : idx + 1]
-                    return None
-
-                def _normalize_enum_fields(self, data: dict) -> dict:
-                    """Normalize enum field values to match expected casing.
-                    
-                    DeepSeek sometimes returns enum values in uppercase (e.g., 'SUPPORTED')
-                    when the schema expects title case (e.g., 'Supported').
-                    """
-                    if not isinstance(data, dict):
-                        return data
-                    
-                    # Known enum value mappings (lowercase -> correct case)
-                    enum_mappings = {
-                        # VerificationResult enum values
-                        'supported': 'Supported',
-                        'refuted': 'Refuted',
-                        'insufficient information': 'Insufficient Information',
-                        'insufficient_information': 'Insufficient Information',
-                    }
-                    
-                    normalized = {}
-                    for key, value in data.items():
-                        if isinstance(value, str):
-                            lower_value = value.lower()
-                            if lower_value in enum_mappings:
-                                normalized[key] = enum_mappings[lower_value]
-                            else:
-                                normalized[key] = value
-                        elif isinstance(value, dict):
-                            normalized[key] = self._normalize_enum_fields(value)
-                        elif isinstance(value, list):
-                            normalized[key] = [
-                                self._normalize_enum_fields(item) if isinstance(item, dict) else item
-                                for item in value
-                            ]
-                        else:
-                            normalized[key] = value
-                    
-                    return normalized
-
                 def _parse_response(self, content: Any):
                     text = self._coerce_text_content(content)
-                    json_payload = self._extract_json_segment(text)
+                    parsed_data = extract_json_object(text)
 
-                    if not json_payload:
+                    if not parsed_data:
                         logger.debug("DeepSeek response missing JSON payload: %s", text[:200])
                         return None  # CHANGED: Return None instead of self.schema() to avoid validation errors
 
                     try:
-                        parsed_data = json.loads(json_payload)
-                        if not parsed_data:
-                            return None
                         # Normalize enum fields before Pydantic validation
-                        normalized_data = self._normalize_enum_fields(parsed_data)
+                        normalized_data = normalize_enum_values(parsed_data, self.schema)
                         return self.schema(**normalized_data)
-                    except (json.JSONDecodeError, TypeError, ValueError) as exc:
+                    except (TypeError, ValueError) as exc:
                         logger.warning("Failed to parse DeepSeek JSON response: %s", exc)
                         return None  # CHANGED: Return None on parse error
 
@@ -329,27 +261,64 @@ class DeepSeekProvider(LLMProvider):
 _PROVIDER_CACHE = {}
 
 
+class LLMConfigurable(TypedDict, total=False):
+    """Per-run LLM selection carried in ``RunnableConfig["configurable"]``.
+
+    Lets concurrent runs in one process use different providers/models
+    without touching the global settings object.
+    """
+
+    llm_provider: str
+    llm_model: str
+
+
+def get_llm_selection(config: Optional[RunnableConfig] = None) -> Tuple[str, Optional[str]]:
+    """Resolve the provider and model for a run.
+
+    Args:
+        config: LangGraph run config. ``configurable.llm_provider`` and
+            ``configurable.llm_model`` take precedence over settings.
+
+    Returns:
+        (provider, model_name) - model_name is None when not configured
+    """
+    configurable = (config or {}).get("configurable") or {}
+    provider = configurable.get("llm_provider") or settings.llm_provider
+    model_name = configurable.get("llm_model") or None
+    return provider, model_name
+
+
 def get_llm(
     model_name: str = None,
     temperature: float = 0.0,
     completions: int = 1,
     provider: str = None,
+    config: Optional[RunnableConfig] = None,
 ) -> BaseChatModel:
     """Get LLM with specified configuration.
 
     Args:
-        model_name: The model to use (provider-specific format). If None, uses provider-appropriate default.
+        model_name: The model to use (provider-specific format). If None, uses the
+            run-configured model or a provider-appropriate default.
         temperature: Temperature for generation
         completions: How many completions we need (affects temperature for diversity)
-        provider: LLM provider to use ("openai", "gemini", "deepseek"). If None, uses configured default.
+        provider: LLM provider to use ("openai", "gemini", "deepseek"). If None, uses
+            the run-configured provider or the configured default.
+        config: LangGraph run config carrying per-run provider/model selection
 
     Returns:
         Configured LLM instance
     """
-    # Use configured default provider if none specified
+    configured_provider, configured_model = get_llm_selection(config)
+
+    # Use run-configured (or settings) provider if none specified
     if provider is None:
-        provider = settings.llm_provider
-    
+        provider = configured_provider
+
+    # A configured model only applies to the provider it was configured with
+    if model_name is None and provider == configured_provider:
+        model_name = configured_model
+
     # Use provider-appropriate default model name if none specified
     if model_name is None:
         if provider == "openai":
@@ -1,20 +1,82 @@
-"""Redis utilities for connection management and common operations."""
+"""Redis utilities for connection management and common operations.
 
+All Redis access goes through one process-wide, bounded connection pool so
+hot paths (like API key checks on every request) reuse TCP connections
+instead of opening a new one per call.
+"""
+
+import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Optional
 
 import redis.asyncio as redis
 
 from .settings import settings
 
+logger = logging.getLogger(__name__)
+
+_pool: Optional[redis.ConnectionPool] = None
+
+
+def get_redis_pool() -> redis.ConnectionPool:
+    """Get the shared connection pool, creating it on first use.
+
+    The pool blocks (up to REDIS_POOL_TIMEOUT seconds) when all
+    REDIS_MAX_CONNECTIONS connections are in use rather than growing unbounded.
+    """
+    global _pool
+    if _pool is None:
+        _pool = redis.BlockingConnectionPool.from_url(
+            str(settings.redis_uri),
+            max_connections=settings.redis_max_connections,
+            timeout=settings.redis_pool_timeout,
+            health_check_interval=settings.redis_health_check_interval,
+        )
+    return _pool
+
+
+def get_redis() -> redis.Redis:
+    """Get a Redis client backed by the shared connection pool."""
+    return redis.Redis(connection_pool=get_redis_pool())
+
+
+async def init_redis_pool() -> None:
+    """Create the shared pool and warm one connection. Call on startup."""
+    try:
+        await get_redis().ping()
+        logger.info("Redis connection pool ready")
+    except redis.RedisError as e:
+        # Don't block startup; connections are retried on use
+        logger.warning(f"Redis not reachable at startup: {e}")
+
+
+async def close_redis_pool() -> None:
+    """Close all pooled connections. Call on shutdown."""
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool, None
+        await pool.aclose()
+        logger.info("Redis connection pool closed")
+
+
+@asynccontextmanager
+async def redis_lifespan(app: Any = None) -> AsyncGenerator[None, None]:
+    """Lifespan handler managing the shared pool for an ASGI app."""
+    await init_redis_pool()
+    try:
+        yield
+    finally:
+        await close_redis_pool()
+
 
 @asynccontextmanager
 async def redis_client() -> AsyncGenerator[redis.Redis, None]:
-    """Context manager for Redis connections."""
-    client = redis.from_url(str(settings.redis_uri))
+    """Context manager for Redis connections from the shared pool."""
+    client = get_redis()
     try:
         yield client
     finally:
+        # Returns connections to the pool; the pool itself stays open
         await client.aclose()
 
 
@@ -0,0 +1,37 @@
+"""Custom HTTP app mounted by the LangGraph server.
+
+Used for process lifecycle hooks: the shared Redis connection pool is
+opened on startup and closed on shutdown, and the sentence tokenizer is
+loaded in the background so the first request doesn't pay for it.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator
+
+from starlette.applications import Starlette
+
+from utils.redis import redis_lifespan
+
+logger = logging.getLogger(__name__)
+
+
+async def _warm_sentence_tokenizer() -> None:
+    from claim_extractor.nodes.sentence_splitter import get_sentence_tokenizer
+
+    try:
+        await asyncio.to_thread(get_sentence_tokenizer)
+    except Exception as e:
+        logger.warning(f"Sentence tokenizer warm-up failed: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: Any) -> AsyncGenerator[None, None]:
+    warmup = asyncio.create_task(_warm_sentence_tokenizer())
+    async with redis_lifespan(app):
+        yield
+    await warmup
+
+
+app = Starlette(lifespan=lifespan)
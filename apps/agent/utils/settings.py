@@ -77,6 +77,27 @@ class Settings(BaseSettings):
     tavily_api_key: TavilyAPIKey = Field(default=None, alias="TAVILY_API_KEY")
     brave_api_key: BraveAPIKey = Field(default=None, alias="BRAVE_API_KEY")
     redis_uri: RedisDsn = Field(default="redis://localhost:6379", alias="REDIS_URL")
+    redis_max_connections: int = Field(default=20, alias="REDIS_MAX_CONNECTIONS")
+    redis_pool_timeout: float = Field(default=5.0, alias="REDIS_POOL_TIMEOUT")
+    redis_health_check_interval: int = Field(
+        default=30, alias="REDIS_HEALTH_CHECK_INTERVAL"
+    )
+    api_key_cache_size: int = Field(default=1024, alias="API_KEY_CACHE_SIZE")
+    api_key_cache_ttl: float = Field(default=60.0, alias="API_KEY_CACHE_TTL")
+    api_key_cache_negative_ttl: float = Field(
+        default=5.0, alias="API_KEY_CACHE_NEGATIVE_TTL"
+    )
+    rate_limit_enabled: bool = Field(default=True, alias="RATE_LIMIT_ENABLED")
+    rate_limit_requests: int = Field(default=120, alias="RATE_LIMIT_REQUESTS")
+    rate_limit_window_seconds: float = Field(
+        default=60.0, alias="RATE_LIMIT_WINDOW_SECONDS"
+    )
+    rate_limit_max_concurrent_runs: int = Field(
+        default=3, alias="RATE_LIMIT_MAX_CONCURRENT_RUNS"
+    )
+    rate_limit_run_lease_seconds: float = Field(
+        default=600.0, alias="RATE_LIMIT_RUN_LEASE_SECONDS"
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -4,14 +4,23 @@ Helper functions for manipulating text content.
 """
 
 import logging
+from typing import Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
 
-def remove_following_sentences(context_for_llm: str) -> str:
-    """Strips out the following sentences section from context.
+def render_context(
+    sentences: Sequence[str],
+    index: int,
+    preceding_sentences: int,
+    following_sentences: int,
+    metadata: Optional[str] = None,
+) -> str:
+    """Render the context window for one sentence of a document.
 
-    Our context looks like:
+    Contexts are built on demand from the shared sentence table rather than
+    stored per sentence. The output looks like:
+    [Document Metadata: ...]
     [Preceding Sentences:]
     ...
     [Sentence of Interest for current task:]
@@ -20,17 +29,30 @@ def remove_following_sentences(context_for_llm: str) -> str:
     ...
 
     Args:
-        context_for_llm: The full context string
+        sentences: All sentences of the document, in order
+        index: Index of the sentence of interest
+        preceding_sentences: How many sentences before it to include
+        following_sentences: How many sentences after it to include
+        metadata: Source metadata, included when present
 
     Returns:
-        Context with following sentences removed
+        The context string for the LLM
     """
-    # Split by the marker
-    parts = context_for_llm.split("\n[Following Sentences:]")
+    context_parts = []
 
-    # If there are following sentences, return only the part before them
-    if len(parts) > 1:
-        return parts[0]
+    if metadata:
+        context_parts.append(f"[Document Metadata: {metadata}]")
 
-    # No following sentences? Return as is
-    return context_for_llm
+    start_index = max(0, index - preceding_sentences)
+    if start_index < index:
+        context_parts.append("\n[Preceding Sentences:]")
+        context_parts.extend(sentences[start_index:index])
+
+    context_parts.append(f"\n[Sentence of Interest for current task:]\n{sentences[index]}")
+
+    end_index = min(len(sentences), index + 1 + following_sentences)
+    if index + 1 < end_index:
+        context_parts.append("\n[Following Sentences:]")
+        context_parts.extend(sentences[index + 1:end_index])
+
+    return "\n".join(context_parts)
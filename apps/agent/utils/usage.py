@@ -0,0 +1,70 @@
+"""Token usage accounting for LLM calls.
+
+Providers report how many prompt tokens were served from their prompt
+cache; summing that next to the total input tokens shows how much of the
+prompt prefix is actually reused across calls.
+"""
+
+from typing import Any, Dict
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.outputs import LLMResult
+
+
+def cached_input_tokens(usage_metadata: Dict[str, Any], token_usage: Dict[str, Any]) -> int:
+    """Prompt tokens served from the provider's prompt cache.
+
+    Args:
+        usage_metadata: The message's standardised usage metadata
+            (OpenAI and Gemini report input_token_details.cache_read)
+        token_usage: The raw provider usage (DeepSeek reports
+            prompt_cache_hit_tokens)
+    """
+    details = (usage_metadata or {}).get("input_token_details") or {}
+    cached = details.get("cache_read")
+    if cached is None:
+        cached = (token_usage or {}).get("prompt_cache_hit_tokens")
+    return cached or 0
+
+
+class LLMUsageTracker(AsyncCallbackHandler):
+    """Counts chat model calls and their input, cached input and output tokens.
+
+    Pass it in a run's ``callbacks``; it sees every LLM call made by the
+    graph's nodes.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.input_tokens = 0
+        self.cached_input_tokens = 0
+        self.output_tokens = 0
+
+    async def on_chat_model_start(self, serialized, messages, **kwargs) -> None:
+        self.calls += 1
+
+    async def on_llm_end(self, response: LLMResult, **kwargs) -> None:
+        token_usage = (response.llm_output or {}).get("token_usage") or {}
+        for generations in response.generations:
+            for generation in generations[:1]:
+                message = getattr(generation, "message", None)
+                usage = getattr(message, "usage_metadata", None) or {}
+                if not usage:
+                    continue
+                self.input_tokens += usage.get("input_tokens", 0)
+                self.output_tokens += usage.get("output_tokens", 0)
+                self.cached_input_tokens += cached_input_tokens(usage, token_usage)
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Share of input tokens served from the provider's prompt cache."""
+        return self.cached_input_tokens / self.input_tokens if self.input_tokens else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals as a plain dict, e.g. for logging or result columns."""
+        return {
+            "llm_calls": self.calls,
+            "input_tokens": self.input_tokens,
+            "cached_input_tokens": self.cached_input_tokens,
+            "output_tokens": self.output_tokens,
+        }
@@ -23,21 +23,29 @@ export const FactChecker = ({
 }: FactCheckerProps) => {
   const [expandedCitation, setExpandedCitation] = useState<number | null>(null);
 
-  const { verifiedClaims, hasSentences, hasAnyClaims, hasVerifiedClaims } =
-    useMemo(() => {
-      const allClaims = Array.from(claims.values()).flat();
-      const verifiedClaims = allClaims.filter(
-        (claim) => claim.status === "verified"
-      );
+  const {
+    verifiedClaims,
+    notCheckedCount,
+    hasSentences,
+    hasAnyClaims,
+    hasVerifiedClaims,
+  } = useMemo(() => {
+    const allClaims = Array.from(claims.values()).flat();
+    const verifiedClaims = allClaims.filter(
+      (claim) => claim.status === "verified"
+    );
 
-      return {
-        allClaims,
-        verifiedClaims,
-        hasSentences: claims.size > 0,
-        hasAnyClaims: allClaims.length > 0,
-        hasVerifiedClaims: verifiedClaims.length > 0,
-      };
-    }, [claims]);
+    return {
+      allClaims,
+      verifiedClaims,
+      notCheckedCount: allClaims.filter(
+        (claim) => claim.status === "not_checked"
+      ).length,
+      hasSentences: claims.size > 0,
+      hasAnyClaims: allClaims.length > 0,
+      hasVerifiedClaims: verifiedClaims.length > 0,
+    };
+  }, [claims]);
 
   const showInitialLoading = isLoading && !hasSentences;
   const showProcessingIndicator =
@@ -98,6 +106,14 @@ export const FactChecker = ({
       {hasVerifiedClaims && (
         <VerdictSummary isLoading={isLoading} verdicts={verifiedClaims} />
       )}
+
+      {notCheckedCount > 0 && (
+        <p className="text-neutral-500 text-xs">
+          {notCheckedCount}{" "}
+          {notCheckedCount === 1 ? "claim was" : "claims were"} not checked:
+          other claims in this text were more check-worthy.
+        </p>
+      )}
     </motion.div>
   );
 };
@@ -114,6 +114,11 @@ export const Citation = ({ id, claim, isExpanded, onClick }: CitationProps) => (
                     className="border-neutral-200 border-b p-3 text-neutral-900 text-sm last:border-b-0"
                     key={idx}
                   >
+                    {item.status === "not_checked" && (
+                      <div className="mb-2">
+                        <VerdictBadge verdict={item} />
+                      </div>
+                    )}
                     {item.text}
                   </div>
                 )}
@@ -3,6 +3,7 @@ import {
   AlertCircle,
   Check,
   CircleCheck,
+  CircleDashed,
   CircleSlash,
   Info,
   X,
@@ -38,21 +39,33 @@ const getIcon = (result: string | undefined) => {
 };
 
 export const VerdictBadge = ({ verdict }: VerdictBadgeProps) => {
-  if (!verdict.result) return null;
+  // Claims skipped by check-worthiness load shedding have no verdict
+  const isNotChecked = verdict.status === "not_checked";
+  const label = isNotChecked ? "Not checked" : verdict.result;
+  if (!label) return null;
 
   return (
     <Badge
       className="flex w-fit items-center justify-center rounded-sm py-0.5 pr-2 pl-1 text-[11px]"
+      title={
+        isNotChecked
+          ? "Skipped: other claims in this text were more check-worthy"
+          : undefined
+      }
       variant={getBadgeVariant(verdict.result)}
     >
-      {getIcon(verdict.result)}
+      {isNotChecked ? (
+        <CircleDashed className="mt-px mr-1 size-3.5 flex-shrink-0" />
+      ) : (
+        getIcon(verdict.result)
+      )}
       <motion.span
         animate={{ opacity: 1, x: 0 }}
         className="truncate"
         initial={{ opacity: 0, x: -2 }}
         transition={{ duration: 0.2 }}
       >
-        {verdict.result}
+        {label}
       </motion.span>
     </Badge>
   );
@@ -136,7 +136,7 @@ export const useFactCheckerStore = create<FactCheckerStore>()(
 
           if (event.event === "no-claims") set({ hasNoClaims: true });
 
-          const claimsEvents = ["sentences", "claims", "verdicts"];
+          const claimsEvents = ["sentences", "claims", "progress", "verdicts"];
           if (claimsEvents.includes(event.event)) {
             const { claims } = event.data as { claims: [string, Claim[]][] };
             set((state) => ({
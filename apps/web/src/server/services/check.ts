@@ -35,6 +35,15 @@ const agentEventSchema = z.object({
   data: z.unknown(),
 });
 
+// biome-ignore lint/suspicious/noExplicitAny: Verdict from agent has dynamic structure
+const toVerifiedClaim = (claim: any): ClaimData => ({
+  status: "verified",
+  text: claim.claim_text,
+  result: claim.result as "Supported" | "Refuted",
+  reasoning: claim.reasoning,
+  sources: claim.sources || [],
+});
+
 const sanitizeEventData = (
   event: string,
   // biome-ignore lint/suspicious/noExplicitAny: Event data from agent has dynamic structure
@@ -87,15 +96,18 @@ const sanitizeEventData = (
       const sentence = claim.original_sentence;
       const existingClaims = claimsMap.get(sentence) || [];
 
+      claimsMap.set(sentence, [...existingClaims, toVerifiedClaim(claim)]);
+    }
+
+    // Claims skipped by check-worthiness load shedding
+    for (const claim of data.generate_report_node.final_report
+      .unchecked_claims || []) {
+      const sentence = claim.original_sentence;
+      const existingClaims = claimsMap.get(sentence) || [];
+
       claimsMap.set(sentence, [
         ...existingClaims,
-        {
-          status: "verified",
-          text: claim.claim_text,
-          result: claim.result as "Supported" | "Refuted",
-          reasoning: claim.reasoning,
-          sources: claim.sources || [],
-        },
+        { text: claim.claim_text, status: "not_checked" },
       ]);
     }
 
@@ -107,6 +119,37 @@ const sanitizeEventData = (
     }
   }
 
+  // Partial reports streamed as claims finish; the final report above reconciles
+  if (
+    event === "custom" &&
+    data.type === "report_snapshot" &&
+    !data.final
+  ) {
+    const claimsMap = new Map<string, ClaimData[]>();
+
+    for (const claim of data.verified_claims) {
+      const sentence = claim.original_sentence;
+      const existingClaims = claimsMap.get(sentence) || [];
+
+      claimsMap.set(sentence, [...existingClaims, toVerifiedClaim(claim)]);
+    }
+
+    for (const claim of data.pending_claims) {
+      const sentence = claim.original_sentence;
+      const existingClaims = claimsMap.get(sentence) || [];
+
+      claimsMap.set(sentence, [
+        ...existingClaims,
+        { text: claim.claim_text, status: "pending" },
+      ]);
+    }
+
+    events.push({
+      event: "progress",
+      data: { claims: Array.from(claimsMap.entries()) },
+    });
+  }
+
   return events;
 };
 
@@ -188,7 +231,7 @@ const executeAgentWorkflow = async (
 
   const runStream = client.runs.stream(thread.thread_id, "fact_checker", {
     input: { answer: content },
-    streamMode: ["updates"],
+    streamMode: ["updates", "custom"],
   });
 
   for await (const event of runStream) {
@@ -55,7 +55,7 @@ export interface ClaimSource {
 
 export type ClaimVerdict = "Supported" | "Refuted";
 
-export type ClaimStatus = "pending" | "verified";
+export type ClaimStatus = "pending" | "verified" | "not_checked";
 
 export interface ClaimData {
   text: string;